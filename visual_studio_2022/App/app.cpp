@@ -78,42 +78,55 @@ int main(int argc, char** argv) {
 
             Settings settings;
             if (!readConfigINI(configFilePath, settings)) {
+                // Plik czasu obliczeń nie jest znany - klient zgłasza błąd z powodu jego braku
                 std::cerr << "Failed to read configuration file: " << configFilePath << std::endl;
+                SetEvent(hCompletionEvent);
                 continue;
             }
             else {
                 std::cout << "Configuration settings:" << std::endl;
                 std::cout << "Implementation: " << settings.implementation << std::endl;
+                std::cout << "Evaluation scheme: " << settings.scheme << std::endl;
+                std::cout << "Derivatives: " << settings.derivatives << std::endl;
                 std::cout << "Use multithreading: " << settings.use_multithreading << std::endl;
                 std::cout << "Number of threads: " << settings.number_of_threads << std::endl;
                 std::cout << "Use AVX: " << settings.use_avx << std::endl;
                 std::cout << "Save results: " << settings.save_results << std::endl;
+                std::cout << "Results format: " << settings.results_format << std::endl;
                 std::cout << "Generate chart: " << settings.generate_chart << std::endl;
                 std::cout << "Output file: " << settings.output_file << std::endl;
                 std::cout << "Input coefficients file: " << settings.input_coeffs_file << std::endl;
                 std::cout << "Input points file: " << settings.input_points_file << std::endl;
                 std::cout << "Progress file: " << settings.progress_file << std::endl;
                 std::cout << "Computation time file: " << settings.computation_time_file << std::endl;
+                std::cout << "Worker times file: " << settings.worker_times_file << std::endl;
             }
 
-            // Wczytaj pliki wejściowe
+            // Wczytaj pliki wejściowe (punkty generowane są blokami w trakcie obliczeń)
             std::vector<float> coefficients;
-            std::vector<float> points;
+            double pointsStart, pointsEnd, pointsStep;
 
+            // Błędy zgłaszane są klientowi znacznikiem w pliku czasu obliczeń i sygnałem zakończenia
             if (!readCoefficients(settings.input_coeffs_file, coefficients)) {
                 std::cerr << "Failed to read coefficients from file: " << settings.input_coeffs_file << std::endl;
+                writeComputationError(settings.computation_time_file,
+                    "Failed to read coefficients from file: " + settings.input_coeffs_file);
+                SetEvent(hCompletionEvent);
                 continue;
             }
 
-            if (!readPoints(settings.input_points_file, points)) {
+            if (!readPointsRange(settings.input_points_file, pointsStart, pointsEnd, pointsStep)) {
                 std::cerr << "Failed to read points from file: " << settings.input_points_file << std::endl;
+                writeComputationError(settings.computation_time_file,
+                    "Failed to read points from file: " + settings.input_points_file);
+                SetEvent(hCompletionEvent);
                 continue;
             }
 
-            // Wykonaj obliczenia
-            computePolynomial(settings, coefficients, points);
+            // Wykonaj obliczenia (błąd zapisuje computePolynomial)
+            computePolynomial(settings, coefficients, pointsStart, pointsEnd, pointsStep);
 
-            // Sygnał zakończenia
+            // Sygnał zakończenia - także po błędzie
             SetEvent(hCompletionEvent);
 
         }
@@ -19,6 +19,15 @@ namespace configuration {
     const char* const EVENT_NAME = "Global\\ComputeEvent";
     const char* const COMPLETION_EVENT_NAME = "Global\\CompletionEvent";
     const char* const CONFIG_FILE = "../../PythonGUI/config.ini";
+    const int POINTS_CHUNK_SIZE = 65536; // liczba punktów przetwarzanych w jednym bloku
+    const int TILE_TARGET_WORK = 1 << 18; // docelowa liczba mnożeń z dodawaniem na jeden kafelek
+    const int MIN_TILE_POINTS = 64; // minimalna liczba punktów w kafelku
+    const int BLOCKED_BUFFER_SIZE = 1 << 20; // maksymalna liczba wyników częściowych schematu blokowego
+    const int PROGRESSION_MAX_COEFFS = 10; // maksymalna liczba współczynników schematu progression (błąd różnic rośnie ze stopniem)
+    const int PROGRESSION_TILE_POINTS = 64; // co ile punktów odtwarzana jest tablica różnic
+    const int PROGRESSION_MIN_TILE_POINTS = 8; // krótsze kafelki nie opłacają się
+    const double PROGRESSION_MAX_SPAN = 1.0; // maksymalna szerokość kafelka schematu progression
+    const int MAX_DERIVATIVES = 8; // maksymalna liczba pochodnych liczonych razem z wartością
 }
 
 std::string trim(const std::string& str) {
@@ -83,16 +92,29 @@ bool readConfigINI(const std::string& filename, Settings& settings) {
         settings.number_of_threads = 1; // Fallback or default value
     }
 
+    // Liczba pochodnych zapisywanych jako dodatkowe kolumny wyników (0 - tylko wartość)
+    try {
+        settings.derivatives = std::clamp(stringToInt(configMap.at("Settings.derivatives")),
+            0, configuration::MAX_DERIVATIVES);
+    }
+    catch (...) {
+        settings.derivatives = 0;
+    }
+
     settings.implementation = configMap["Settings.implementation"];
+    const std::string& scheme = configMap["Settings.scheme"];
+    settings.scheme = (scheme == "blocked" || scheme == "progression") ? scheme : "horner";
     settings.use_multithreading = configMap["Settings.multithreading"] == "1";
     settings.use_avx = configMap["Settings.avx"] == "1";
     settings.save_results = configMap["Settings.save_results"] == "1";
     settings.generate_chart = configMap["Settings.generate_chart"] == "1";
+    settings.results_format = configMap["Settings.results_format"] == "binary" ? "binary" : "text";
     settings.output_file = configMap["Settings.output_file"];
     settings.input_coeffs_file = configMap["Settings.input_coeffs_file"];
     settings.input_points_file = configMap["Settings.input_points_file"];
     settings.progress_file = configMap["Settings.progress_file"];
     settings.computation_time_file = configMap["Settings.computation_time_file"];
+    settings.worker_times_file = configMap["Settings.worker_times_file"];
 
     return true;
 }
@@ -22,6 +22,15 @@ namespace configuration {
     extern const char* const EVENT_NAME;
     extern const char* const COMPLETION_EVENT_NAME;
     extern const char* const CONFIG_FILE;
+    extern const int POINTS_CHUNK_SIZE;
+    extern const int TILE_TARGET_WORK;
+    extern const int MIN_TILE_POINTS;
+    extern const int BLOCKED_BUFFER_SIZE;
+    extern const int PROGRESSION_MAX_COEFFS;
+    extern const int PROGRESSION_TILE_POINTS;
+    extern const int PROGRESSION_MIN_TILE_POINTS;
+    extern const double PROGRESSION_MAX_SPAN;
+    extern const int MAX_DERIVATIVES;
 }
 
 /**
@@ -30,16 +39,20 @@ namespace configuration {
  */
 struct Settings {
     std::string implementation;
+    std::string scheme;
+    int derivatives;
     bool use_multithreading;
     int number_of_threads;
     bool use_avx;
     bool save_results;
+    std::string results_format;
     bool generate_chart;
     std::string output_file;
     std::string input_coeffs_file;
     std::string input_points_file;
     std::string progress_file;
     std::string computation_time_file;
+    std::string worker_times_file;
 };
 
 /**
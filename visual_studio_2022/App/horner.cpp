@@ -11,6 +11,7 @@
 
 #include "horner.h"
 #include "utils.h"
+#include "threadpool.h"
 
 #include <fstream>
 #include <iostream>
@@ -18,34 +19,79 @@
 #include <immintrin.h> // For AVX instructions
 #include <atomic>
 #include <mutex>
+#include <chrono>
+#include <cmath>
+#include <algorithm>
+
+// Liczba punktów kafelka schematu progression: co najwyżej PROGRESSION_TILE_POINTS punktów
+// i PROGRESSION_MAX_SPAN szerokości (na rzadkich siatkach błąd różnic narasta zbyt szybko)
+static int progressionTileSize(float step) {
+    if (step == 0.0f) {
+        return configuration::PROGRESSION_TILE_POINTS;
+    }
+    double pointsInSpan = std::floor(configuration::PROGRESSION_MAX_SPAN / std::fabs((double)step)) + 1.0;
+    return (int)std::min((double)configuration::PROGRESSION_TILE_POINTS, pointsInSpan);
+}
+
+bool progressionApplicable(int n, float step) {
+    return n <= configuration::PROGRESSION_MAX_COEFFS
+        && progressionTileSize(step) >= configuration::PROGRESSION_MIN_TILE_POINTS;
+}
 
-void computePolynomial(
+// Oblicza wartości wielomianu dla jednego bloku punktów wybraną implementacją.
+// Postęp raportuje computePolynomial po każdym bloku, więc funkcje obliczeniowe
+// dostają interwał większy niż liczba punktów bloku (nigdy nie zapisują postępu same).
+static bool evaluateChunk(
     const Settings& settings,
-    const std::vector<float>& coefficients,
-    const std::vector<float>& points
+    float* coeffsArray, int numCoeffs,
+    float* pointsArray, int numPoints, float pointsStep,
+    float* resultsArray,
+    std::vector<double>& workerBusyTimes
 ) {
-    int numCoeffs = (int)coefficients.size();
-    int numPoints = (int)points.size();
-    int numThreads = settings.number_of_threads;
-
-    std::vector<float> results(numPoints);
-    float* coeffsArray = const_cast<float*>(coefficients.data());
-    float* pointsArray = const_cast<float*>(points.data());
-    float* resultsArray = results.data();
-
-    // Progress
+    int numThreads = std::max(1, settings.number_of_threads);
+    int progressUpdateInterval = numPoints + 1;
     std::atomic<int> progressCounter(0);
-    int progressUpdateInterval = std::max(2, (2 * numPoints) / 100); // update progresss by ~2%
 
-    auto start = std::chrono::high_resolution_clock::now();
+    // Pochodne liczone są jednym przejściem Hornera, niezależnie od schematu i implementacji DLL
+    if (settings.derivatives > 0) {
+        hornerDerivatives(coeffsArray, numCoeffs, pointsArray, numPoints, settings.derivatives, resultsArray,
+            settings.use_multithreading ? numThreads : 1, workerBusyTimes);
+        return true;
+    }
 
+    // Schemat progression nie korzysta z DLL - dla wysokich stopni i rzadkich siatek
+    // wykonywany jest zwykły schemat Hornera wybranej implementacji
+    if (settings.scheme == "progression" && progressionApplicable(numCoeffs, pointsStep)) {
+        hornerProgression(coeffsArray, numCoeffs, pointsArray, numPoints, pointsStep, resultsArray,
+            settings.use_multithreading ? numThreads : 1, workerBusyTimes);
+        return true;
+    }
 
-    if (settings.implementation == "cpp") {
+    if (settings.scheme == "blocked") {
+        PolynomialFunc polynomialFunc;
+        PolynomialFuncAvx polynomialFuncAvx;
+        if (settings.implementation == "cpp") {
+            polynomialFunc = dll_functions::hornerCpp;
+            polynomialFuncAvx = dll_functions::hornerCppAvx;
+        }
+        else if (settings.implementation == "asm") {
+            polynomialFunc = dll_functions::hornerAsm;
+            polynomialFuncAvx = dll_functions::hornerAsmAvx;
+        }
+        else {
+            std::cout << "wrong implementation choosen, there are only cpp and asm..." << std::endl;
+            return false;
+        }
+        hornerBlocked(coeffsArray, numCoeffs, pointsArray, numPoints, resultsArray,
+            settings.use_multithreading ? numThreads : 1,
+            settings.use_avx ? polynomialFuncAvx : nullptr, polynomialFunc, workerBusyTimes);
+    }
+    else if (settings.implementation == "cpp") {
         if (settings.use_avx) {
             if (settings.use_multithreading) {
                 hornerAvxMultithreaded(coeffsArray, numCoeffs, pointsArray, numPoints,
                     resultsArray, numThreads, progressUpdateInterval, settings.progress_file,
-                    dll_functions::hornerCppAvx, dll_functions::hornerCpp);
+                    dll_functions::hornerCppAvx, dll_functions::hornerCpp, workerBusyTimes);
             }
             else {
                 hornerAvx(coeffsArray, numCoeffs, pointsArray, numPoints,
@@ -58,7 +104,7 @@ void computePolynomial(
             if (settings.use_multithreading) {
                 hornerScalarMultithreaded(coeffsArray, numCoeffs, pointsArray, numPoints,
                     resultsArray, numThreads, progressUpdateInterval, settings.progress_file,
-                    dll_functions::hornerCpp);
+                    dll_functions::hornerCpp, workerBusyTimes);
             }
             else {
                 hornerScalar(coeffsArray, numCoeffs, pointsArray, numPoints, 
@@ -72,7 +118,7 @@ void computePolynomial(
             if (settings.use_multithreading) {
                 hornerAvxMultithreaded(coeffsArray, numCoeffs, pointsArray, numPoints,
                     resultsArray, numThreads, progressUpdateInterval, settings.progress_file,
-                    dll_functions::hornerAsmAvx, dll_functions::hornerAsm);
+                    dll_functions::hornerAsmAvx, dll_functions::hornerAsm, workerBusyTimes);
             }
             else {
                 hornerAvx(coeffsArray, numCoeffs, pointsArray, numPoints,
@@ -85,7 +131,7 @@ void computePolynomial(
             if (settings.use_multithreading) {
                 hornerScalarMultithreaded(coeffsArray, numCoeffs, pointsArray, numPoints,
                     resultsArray, numThreads, progressUpdateInterval, settings.progress_file,
-                    dll_functions::hornerAsm);
+                    dll_functions::hornerAsm, workerBusyTimes);
             }
             else {
                 hornerScalar(coeffsArray, numCoeffs, pointsArray, numPoints,
@@ -96,30 +142,122 @@ void computePolynomial(
     }
     else {
         std::cout << "wrong implementation choosen, there are only cpp and asm..." << std::endl;
+        return false;
     }
 
-    auto end = std::chrono::high_resolution_clock::now();
-    std::chrono::duration<double> computationTime = end - start;
+    return true;
+}
+
+bool computePolynomial(
+    const Settings& settings,
+    const std::vector<float>& coefficients,
+    double pointsStart,
+    double pointsEnd,
+    double pointsStep
+) {
+    // Błąd trafia do pliku czasu obliczeń, aby klient nie czekał na wynik do przekroczenia czasu
+    auto fail = [&](const std::string& message) {
+        std::cerr << message << std::endl;
+        writeComputationError(settings.computation_time_file, message);
+        return false;
+    };
+
+    int numCoeffs = (int)coefficients.size();
+    int chunkSize = configuration::POINTS_CHUNK_SIZE;
+    float* coeffsArray = const_cast<float*>(coefficients.data());
+
+    // Bufory na jeden blok punktów i wyników - pamięć nie zależy od długości zakresu
+    std::vector<float> points;
+    points.reserve(chunkSize);
+    // Z pochodnymi każdy punkt ma derivatives + 1 kolumn wyników
+    int columns = settings.derivatives + 1;
+    std::vector<float> results((size_t)chunkSize * columns);
+
+    // Dokładna liczba punktów, taka sama jak w silniku NumPy (count_points z gui/grid.py)
+    long long totalPoints = countPoints(pointsStart, pointsEnd, pointsStep);
+
+    // Wyniki dopisywane są strumieniowo po każdym bloku
+    bool binaryResults = settings.results_format == "binary";
+    std::ofstream outputFile;
+    if (settings.save_results) {
+        outputFile.open(settings.output_file, binaryResults ? std::ios::binary : std::ios::out);
+        if (!outputFile.is_open()) {
+            return fail("Failed to open results file: " + settings.output_file);
+        }
+        if (binaryResults && !writeResultsBinaryHeader(outputFile, pointsStart, pointsEnd, pointsStep, columns)) {
+            return fail("Failed to write results header to file: " + settings.output_file);
+        }
+    }
+
+    // Czas pracy każdego wątku sumowany po wszystkich blokach - pokazuje nierówny podział pracy
+    int numWorkers = settings.use_multithreading ? std::max(1, settings.number_of_threads) : 1;
+    std::vector<double> workerBusyTimes(numWorkers, 0.0);
+
+    // Przygotuj pulę wątków przed pomiarem czasu (tworzona tylko przy zmianie liczby wątków)
+    if (settings.use_multithreading) {
+        getThreadPool(numWorkers);
+    }
+
+    std::chrono::duration<double> computationTime(0);
+    long long pointsDone = 0;
+
+    int numPoints;
+    while ((numPoints = readPointsChunk(pointsStart, pointsStep, totalPoints, pointsDone, chunkSize, points)) > 0) {
+        // Mierzymy tylko czas obliczeń, bez generowania punktów i zapisu wyników
+        auto start = std::chrono::high_resolution_clock::now();
+        bool ok = evaluateChunk(settings, coeffsArray, numCoeffs, points.data(), numPoints, (float)pointsStep,
+            results.data(), workerBusyTimes);
+        auto end = std::chrono::high_resolution_clock::now();
+        computationTime += end - start;
+
+        if (!ok) {
+            return fail("Unsupported implementation: " + settings.implementation);
+        }
+
+        if (settings.save_results) {
+            bool written = binaryResults
+                ? writeResultsChunkBinary(outputFile, results, numPoints, columns)
+                : writeResultsChunk(outputFile, results, numPoints, columns);
+            if (!written) {
+                return fail("Failed to write results to file: " + settings.output_file);
+            }
+        }
+
+        pointsDone += numPoints;
+        int progress = (int)((pointsDone * 100) / totalPoints);
+        writeProgress(settings.progress_file, progress);
+    }
 
     std::cout << "Computation completed in " << computationTime.count() << " seconds." << std::endl;
 
     // Save computation time
     if (!writeComputationTime(settings.computation_time_file, computationTime.count())) {
         std::cerr << "Failed to write computation time to file." << std::endl;
-        return;
+        return false;
+    }
+
+    // Obliczenia jednowątkowe: jedyny wątek pracuje przez cały czas obliczeń
+    if (!settings.use_multithreading) {
+        workerBusyTimes[0] = computationTime.count();
+    }
+    if (!settings.worker_times_file.empty() && !writeWorkerTimes(settings.worker_times_file, workerBusyTimes)) {
+        std::cerr << "Failed to write worker times to file." << std::endl;
     }
 
-    // Save results if output is in setting
     if (settings.save_results) {
-        if (!writeResults(settings.output_file, results)) {
-            std::cerr << "Failed to write results to file." << std::endl;
-            return;
+        if (binaryResults && !writeResultsBinaryCount(outputFile, pointsDone)) {
+            return fail("Failed to write results count to file: " + settings.output_file);
+        }
+        outputFile.close();
+        if (outputFile.fail()) {
+            return fail("Failed to write results to file: " + settings.output_file);
         }
         std::cout << "Results written to " << settings.output_file << std::endl;
     }
     else {
         std::cout << "Results not saved to file as per configuration." << std::endl;
     }
+    return true;
 }
 
 void hornerScalar(
@@ -189,32 +327,45 @@ void hornerAvx(
 }
 
 
+// Dobiera rozmiar kafelka tak, aby każdy kafelek zawierał podobną liczbę operacji
+// (TILE_TARGET_WORK mnożeń z dodawaniem), ale nie był większy niż równy podział punktów
+// między wątki. Rozmiar jest wielokrotnością bloku AVX (8 punktów).
+static int computeTileSize(int numCoeffs, int numPoints, int numThreads) {
+    int pointsPerThread = (numPoints + numThreads - 1) / numThreads;
+    int tileSize = configuration::TILE_TARGET_WORK / std::max(1, numCoeffs);
+    tileSize = std::max(configuration::MIN_TILE_POINTS, std::min(tileSize, pointsPerThread));
+    return (tileSize + 7) / 8 * 8;
+}
+
 void hornerScalarMultithreaded(
     float coeffs[], int n, float points[], int numPoints,
     float results[], int numThreads, int progressUpdateInterval,
     const std::string& progressFile,
-    PolynomialFunc polynomialFunc) {
+    PolynomialFunc polynomialFunc,
+    std::vector<double>& workerBusyTimes) {
 
     std::atomic<int> progressCounter(0);
-    std::vector<std::thread> threads;
-
-    int pointsPerThread = (numPoints + numThreads - 1) / numThreads;
-
-    for (int t = 0; t < numThreads; ++t) {
-        int start = t * pointsPerThread;
-        int end = std::min(start + pointsPerThread, numPoints);
-
-        threads.emplace_back([=, &progressCounter]() {
+    std::atomic<int> nextTile(0);
+
+    int tileSize = computeTileSize(n, numPoints, numThreads);
+    int numTiles = (numPoints + tileSize - 1) / tileSize;
+
+    // Wątki puli są tworzone raz i używane ponownie przez kolejne bloki i zlecenia
+    getThreadPool(numThreads).run([&](int t) {
+        // Wątki pobierają kolejne kafelki ze wspólnego licznika aż do wyczerpania punktów
+        auto busyStart = std::chrono::high_resolution_clock::now();
+        int tile;
+        while ((tile = nextTile.fetch_add(1)) < numTiles) {
+            int start = tile * tileSize;
+            int end = std::min(start + tileSize, numPoints);
             hornerScalar(
                 coeffs, n, points, numPoints, results,
                 start, end, progressCounter, progressUpdateInterval, progressFile,
                 polynomialFunc);
-        });
-    }
-
-    for (auto& thread : threads) {
-        thread.join();
-    }
+        }
+        std::chrono::duration<double> busyTime = std::chrono::high_resolution_clock::now() - busyStart;
+        workerBusyTimes[t] += busyTime.count();
+    });
 }
 
 void hornerAvxMultithreaded(
@@ -222,26 +373,248 @@ void hornerAvxMultithreaded(
     float results[], int numThreads, int progressUpdateInterval,
     const std::string& progressFile,
     PolynomialFuncAvx polynomialFuncAvx,
-    PolynomialFunc polynomialFunc) {
+    PolynomialFunc polynomialFunc,
+    std::vector<double>& workerBusyTimes) {
 
     std::atomic<int> progressCounter(0);
-    std::vector<std::thread> threads;
-
-    int pointsPerThread = (numPoints + numThreads - 1) / numThreads;
-
-    for (int t = 0; t < numThreads; ++t) {
-        int start = t * pointsPerThread;
-        int end = std::min(start + pointsPerThread, numPoints);
-
-        threads.emplace_back([=, &progressCounter]() {
+    std::atomic<int> nextTile(0);
+
+    int tileSize = computeTileSize(n, numPoints, numThreads);
+    int numTiles = (numPoints + tileSize - 1) / tileSize;
+
+    // Wątki puli są tworzone raz i używane ponownie przez kolejne bloki i zlecenia
+    getThreadPool(numThreads).run([&](int t) {
+        // Wątki pobierają kolejne kafelki ze wspólnego licznika aż do wyczerpania punktów
+        auto busyStart = std::chrono::high_resolution_clock::now();
+        int tile;
+        while ((tile = nextTile.fetch_add(1)) < numTiles) {
+            int start = tile * tileSize;
+            int end = std::min(start + tileSize, numPoints);
             hornerAvx(
                 coeffs, n, points, numPoints, results,
                 start, end, progressCounter, progressUpdateInterval, progressFile,
                 polynomialFuncAvx, polynomialFunc);
-        });
+        }
+        std::chrono::duration<double> busyTime = std::chrono::high_resolution_clock::now() - busyStart;
+        workerBusyTimes[t] += busyTime.count();
+    });
+}
+
+void hornerBlocked(
+    float coeffs[], int n, float points[], int numPoints,
+    float results[], int numThreads,
+    PolynomialFuncAvx polynomialFuncAvx,
+    PolynomialFunc polynomialFunc,
+    std::vector<double>& workerBusyTimes) {
+
+    // Około sqrt(n) bloków po około sqrt(n) współczynników
+    int numBlocks = std::max(1, (int)std::lround(std::sqrt((double)n)));
+    int blockSize = (n + numBlocks - 1) / numBlocks;
+    numBlocks = (n + blockSize - 1) / blockSize;
+
+    // Wyniki częściowe (numBlocks x batchSize) mieszczą się w BLOCKED_BUFFER_SIZE
+    int batchSize = std::max(1, std::min(configuration::BLOCKED_BUFFER_SIZE / numBlocks, numPoints));
+    std::vector<float> partial((size_t)numBlocks * batchSize);
+
+    for (int batchStart = 0; batchStart < numPoints; batchStart += batchSize) {
+        int batchPoints = std::min(batchSize, numPoints - batchStart);
+        float* batch = points + batchStart;
+        std::atomic<int> nextBlock(0);
+
+        // Wątki pobierają kolejne bloki współczynników - każdy blok to niezależny łańcuch Hornera
+        auto evaluateBlocks = [&](int t) {
+            auto busyStart = std::chrono::high_resolution_clock::now();
+            int block;
+            while ((block = nextBlock.fetch_add(1)) < numBlocks) {
+                std::atomic<int> progressCounter(0);
+                int first = block * blockSize;
+                int length = std::min(blockSize, n - first);
+                float* row = &partial[(size_t)block * batchPoints];
+                // Interwał większy niż liczba punktów - postęp raportuje computePolynomial
+                if (polynomialFuncAvx != nullptr) {
+                    hornerAvx(coeffs + first, length, batch, batchPoints, row, 0, batchPoints,
+                        progressCounter, batchPoints + 1, "", polynomialFuncAvx, polynomialFunc);
+                }
+                else {
+                    hornerScalar(coeffs + first, length, batch, batchPoints, row, 0, batchPoints,
+                        progressCounter, batchPoints + 1, "", polynomialFunc);
+                }
+            }
+            std::chrono::duration<double> busyTime = std::chrono::high_resolution_clock::now() - busyStart;
+            workerBusyTimes[t] += busyTime.count();
+        };
+
+        if (numThreads > 1) {
+            getThreadPool(numThreads).run(evaluateBlocks);
+        }
+        else {
+            evaluateBlocks(0);
+        }
+
+        // P(x) = suma P_j(x) * y^j, gdzie y = x^blockSize - schemat Hornera względem y.
+        // Start od ostatniego bloku (nie od 0): przy przepełnionym y iloczyn 0 * inf dałby NaN
+        for (int i = 0; i < batchPoints; ++i) {
+            double y = std::pow((double)batch[i], blockSize);
+            double value = partial[(size_t)(numBlocks - 1) * batchPoints + i];
+            for (int block = numBlocks - 2; block >= 0; --block) {
+                value = value * y + partial[(size_t)block * batchPoints + i];
+            }
+            results[batchStart + i] = (float)value;
+        }
+    }
+}
+
+// Tablica T[j][k] = k! * S(j, k) (S - liczby Stirlinga drugiego rodzaju), czyli k-te różnice
+// progresywne jednomianu t^j w punkcie 0: T(j, k) = k * (T(j-1, k) + T(j-1, k-1))
+static std::vector<double> scaledStirlingTable(int degree) {
+    int size = degree + 1;
+    std::vector<double> table((size_t)size * size, 0.0);
+    table[0] = 1.0;
+    for (int j = 1; j <= degree; ++j) {
+        for (int k = 1; k <= j; ++k) {
+            table[(size_t)j * size + k] = k * (table[(size_t)(j - 1) * size + k] + table[(size_t)(j - 1) * size + k - 1]);
+        }
     }
+    return table;
+}
+
+void hornerProgression(
+    float coeffs[], int n, float points[], int numPoints, float step,
+    float results[], int numThreads,
+    std::vector<double>& workerBusyTimes) {
+
+    // Kafelki liczone są grupami po PROGRESSION_LANES jednocześnie - każdy kafelek w osobnym
+    // torze wektora, więc krok różnic to jedno wektorowe dodawanie na rząd tablicy
+    const int PROGRESSION_LANES = 4;
+
+    int degree = n - 1;
+    int tileSize = progressionTileSize(step);
+    int numTiles = (numPoints + tileSize - 1) / tileSize;
+    int numGroups = (numTiles + PROGRESSION_LANES - 1) / PROGRESSION_LANES;
+    std::vector<double> stirling = scaledStirlingTable(degree);
+    std::atomic<int> nextGroup(0);
+
+    auto evaluateTiles = [&](int t) {
+        auto busyStart = std::chrono::high_resolution_clock::now();
+        std::vector<double> shifted(n);
+        std::vector<double> differences((size_t)n * PROGRESSION_LANES);  // [rząd][tor]
+        int group;
+        while ((group = nextGroup.fetch_add(1)) < numGroups) {
+            int groupStart = group * PROGRESSION_LANES * tileSize;
+
+            for (int lane = 0; lane < PROGRESSION_LANES; ++lane) {
+                int start = groupStart + lane * tileSize;
+                // Taylor shift do pierwszego punktu kafelka (dzielenie syntetyczne)
+                double x0 = start < numPoints ? points[start] : 0.0;
+                for (int j = 0; j < n; ++j) {
+                    shifted[j] = coeffs[j];
+                }
+                for (int i = 0; i < degree; ++i) {
+                    for (int j = degree - 1; j >= i; --j) {
+                        shifted[j] += x0 * shifted[j + 1];
+                    }
+                }
+
+                // Współczynniki Q(t) = P(x0 + step * t) i różnice progresywne Q w t = 0
+                double scale = 1.0;
+                for (int j = 0; j < n; ++j) {
+                    shifted[j] *= scale;
+                    scale *= step;
+                }
+                for (int k = 0; k < n; ++k) {
+                    double difference = 0.0;
+                    for (int j = k; j < n; ++j) {
+                        difference += shifted[j] * stirling[(size_t)j * n + k];
+                    }
+                    differences[(size_t)k * PROGRESSION_LANES + lane] = difference;
+                }
+            }
+
+            // Kolejne wartości to tylko niezależne dodawania (bez łańcucha mnożeń Hornera)
+            for (int i = 0; i < tileSize; ++i) {
+                for (int lane = 0; lane < PROGRESSION_LANES; ++lane) {
+                    int index = groupStart + lane * tileSize + i;
+                    if (index < numPoints) {
+                        results[index] = (float)differences[lane];
+                    }
+                }
+                for (int k = 0; k < degree; ++k) {
+                    for (int lane = 0; lane < PROGRESSION_LANES; ++lane) {
+                        differences[(size_t)k * PROGRESSION_LANES + lane] += differences[(size_t)(k + 1) * PROGRESSION_LANES + lane];
+                    }
+                }
+            }
+        }
+        std::chrono::duration<double> busyTime = std::chrono::high_resolution_clock::now() - busyStart;
+        workerBusyTimes[t] += busyTime.count();
+    };
 
-    for (auto& thread : threads) {
-        thread.join();
+    if (numThreads > 1) {
+        getThreadPool(numThreads).run(evaluateTiles);
+    }
+    else {
+        evaluateTiles(0);
+    }
+}
+
+void hornerDerivatives(
+    float coeffs[], int n, float points[], int numPoints, int derivatives,
+    float results[], int numThreads,
+    std::vector<double>& workerBusyTimes) {
+
+    const int LANES = 8;
+    int columns = derivatives + 1;
+    int tileSize = computeTileSize(n * columns, numPoints, numThreads);
+    int numTiles = (numPoints + tileSize - 1) / tileSize;
+    std::atomic<int> nextTile(0);
+
+    // Akumulator d[j] po przejściu wszystkich współczynników to p^(j)(x) / j!
+    std::vector<float> factorials(columns, 1.0f);
+    for (int j = 1; j < columns; ++j) {
+        factorials[j] = factorials[j - 1] * j;
+    }
+
+    auto evaluateTiles = [&](int t) {
+        auto busyStart = std::chrono::high_resolution_clock::now();
+        std::vector<float> accumulators((size_t)columns * LANES);  // [pochodna][tor]
+        float x[LANES];
+        int tile;
+        while ((tile = nextTile.fetch_add(1)) < numTiles) {
+            int tileEnd = std::min((tile + 1) * tileSize, numPoints);
+            for (int first = tile * tileSize; first < tileEnd; first += LANES) {
+                int count = std::min(LANES, tileEnd - first);
+                for (int lane = 0; lane < LANES; ++lane) {
+                    x[lane] = lane < count ? points[first + lane] : 0.0f;
+                }
+                std::fill(accumulators.begin(), accumulators.end(), 0.0f);
+
+                float* d = accumulators.data();
+                for (int i = n - 1; i >= 0; --i) {
+                    for (int j = derivatives; j > 0; --j) {
+                        for (int lane = 0; lane < LANES; ++lane) {
+                            d[j * LANES + lane] = d[j * LANES + lane] * x[lane] + d[(j - 1) * LANES + lane];
+                        }
+                    }
+                    for (int lane = 0; lane < LANES; ++lane) {
+                        d[lane] = d[lane] * x[lane] + coeffs[i];
+                    }
+                }
+
+                for (int lane = 0; lane < count; ++lane) {
+                    for (int j = 0; j < columns; ++j) {
+                        results[(size_t)(first + lane) * columns + j] = d[j * LANES + lane] * factorials[j];
+                    }
+                }
+            }
+        }
+        std::chrono::duration<double> busyTime = std::chrono::high_resolution_clock::now() - busyStart;
+        workerBusyTimes[t] += busyTime.count();
+    };
+
+    if (numThreads > 1) {
+        getThreadPool(numThreads).run(evaluateTiles);
+    }
+    else {
+        evaluateTiles(0);
     }
 }
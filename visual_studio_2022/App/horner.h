@@ -22,15 +22,24 @@
 
 /**
  * @brief Funkcja do obsługi różnych implementacji i konfiguracji obliczania wielomianu.
+ * Punkty są generowane i przetwarzane blokami (configuration::POINTS_CHUNK_SIZE),
+ * a wyniki strumieniowo dopisywane do pliku, więc zużycie pamięci nie zależy od długości zakresu.
  * 
  * @param settings Konfiguracja wywołania funkcji obliczającej wielomian.
  * @param coefficients Lista współczynników wielomianu.
- * @param points Zbiór punktów, dla których obliczane są wartości wielomianu.
+ * @param pointsStart Pierwszy punkt zakresu.
+ * @param pointsEnd Ostatni punkt zakresu (włącznie).
+ * @param pointsStep Krok między kolejnymi punktami.
+ * @return true Jeśli obliczenia i zapis wyników zakończyły się powodzeniem.
+ * @return false Jeśli wystąpił błąd - plik czasu obliczeń zawiera wtedy znacznik błędu
+ *         (writeComputationError), a nie czas.
  */
-void computePolynomial(
+bool computePolynomial(
     const Settings& settings,
     const std::vector<float>& coefficients,
-    const std::vector<float>& points
+    double pointsStart,
+    double pointsEnd,
+    double pointsStep
 );
 
 /**
@@ -91,6 +100,8 @@ void hornerAvx(
 
 /**
  * @brief Oblicza wartości wielomianu stopnia n w punktach z tablicy points, korzystając ze skalarnych obliczeń wielowątkowych.
+ * Punkty dzielone są na kafelki (rozmiar zależy od liczby współczynników), które wątki
+ * pobierają ze wspólnego licznika atomowego, więc wolniejsze wątki nie opóźniają całości.
  * 
  * @param coeffs Lista współczynników wielomianu.
  * @param n Liczba współczynników wielomianu.
@@ -101,15 +112,18 @@ void hornerAvx(
  * @param progressUpdateInterval Interwał pomiędzy aktualizacjami poziomu postępu.
  * @param progressFile Ścieżka do pliku, w którym zapisywany jest poziom postępu obliczeń.
  * @param polynomialFunc Funkcja skalarnie obliczająca wartość wielomianu.
+ * @param workerBusyTimes Czasy pracy kolejnych wątków w sekundach (powiększane o czas tego wywołania).
  */
 void hornerScalarMultithreaded(
     float coeffs[], int n, float points[], int numPoints,
     float results[], int numThreads, int progressUpdateInterval,
     const std::string& progressFile,
-    PolynomialFunc polynomialFunc);
+    PolynomialFunc polynomialFunc,
+    std::vector<double>& workerBusyTimes);
 
 /**
  * @brief Oblicza wartości wielomianu stopnia n w punktach z tablicy points, wykorzystując implementację AVX oraz wielowątkowość.
+ * Podział pracy na kafelki jak w hornerScalarMultithreaded.
  * 
  * @param coeffs Lista współczynników wielomianu.
  * @param n Liczba współczynników wielomianu.
@@ -121,10 +135,87 @@ void hornerScalarMultithreaded(
  * @param progressFile Ścieżka do pliku, w którym zapisywany jest poziom postępu obliczeń.
  * @param polynomialFuncAvx Funkcja AVX obliczająca wartość wielomianu.
  * @param polynomialFunc Funkcja skalarnie obliczająca wartość wielomianu.
+ * @param workerBusyTimes Czasy pracy kolejnych wątków w sekundach (powiększane o czas tego wywołania).
  */
 void hornerAvxMultithreaded(
     float coeffs[], int n, float points[], int numPoints,
     float results[], int numThreads, int progressUpdateInterval,
     const std::string& progressFile,
     PolynomialFuncAvx polynomialFuncAvx,
-    PolynomialFunc polynomialFunc);
\ No newline at end of file
+    PolynomialFunc polynomialFunc,
+    std::vector<double>& workerBusyTimes);
+/**
+ * @brief Oblicza wartości wielomianu schematem blokowym dla wielomianów wysokiego stopnia.
+ * Współczynniki dzielone są na około sqrt(n) bloków (niezależnych podwielomianów P_j),
+ * liczonych funkcją z DLL równolegle przez wątki puli, a następnie łączonych jako
+ * suma P_j(x) * (x^m)^j, gdzie m to rozmiar bloku. Łańcuch zależności ma długość
+ * około 2 * sqrt(n) zamiast n, więc nawet dla pojedynczych punktów można użyć wielu wątków.
+ *
+ * @param coeffs Lista współczynników wielomianu.
+ * @param n Liczba współczynników wielomianu.
+ * @param points Zbiór punktów, dla których obliczane są wartości wielomianu.
+ * @param numPoints Liczba punktów, dla których obliczane są wartości wielomianu.
+ * @param results Tablica, do której zapisywane są wyniki obliczeń.
+ * @param numThreads Liczba wątków używanych w obliczeniach (1 - bez puli wątków).
+ * @param polynomialFuncAvx Funkcja AVX obliczająca wartość wielomianu (nullptr - tylko funkcja skalarna).
+ * @param polynomialFunc Funkcja skalarnie obliczająca wartość wielomianu.
+ * @param workerBusyTimes Czasy pracy kolejnych wątków w sekundach (powiększane o czas tego wywołania).
+ */
+void hornerBlocked(
+    float coeffs[], int n, float points[], int numPoints,
+    float results[], int numThreads,
+    PolynomialFuncAvx polynomialFuncAvx,
+    PolynomialFunc polynomialFunc,
+    std::vector<double>& workerBusyTimes);
+
+/**
+ * @brief Sprawdza, czy schemat progression może być użyty (niski stopień i gęsta siatka).
+ *
+ * @param n Liczba współczynników wielomianu.
+ * @param step Krok między kolejnymi punktami.
+ * @return true Jeśli schemat progression jest opłacalny i dokładny.
+ * @return false Jeśli należy użyć zwykłego schematu Hornera.
+ */
+bool progressionApplicable(int n, float step);
+
+/**
+ * @brief Oblicza wartości wielomianu w punktach ciągu arytmetycznego metodą różnic progresywnych.
+ * Punkty dzielone są na kafelki; dla każdego kafelka wielomian jest przesuwany (Taylor shift)
+ * do pierwszego punktu kafelka, wyznaczana jest tablica różnic, a każdy kolejny punkt to
+ * n - 1 niezależnych dodawań zamiast łańcucha n mnożeń z dodawaniem. Obliczenia prowadzone
+ * są w double, ale błąd różnic szybko rośnie ze stopniem, dlatego schemat jest używany tylko
+ * do PROGRESSION_MAX_COEFFS współczynników (progressionApplicable).
+ *
+ * @param coeffs Lista współczynników wielomianu.
+ * @param n Liczba współczynników wielomianu.
+ * @param points Punkty ciągu arytmetycznego.
+ * @param numPoints Liczba punktów.
+ * @param step Krok między kolejnymi punktami.
+ * @param results Tablica, do której zapisywane są wyniki obliczeń.
+ * @param numThreads Liczba wątków używanych w obliczeniach (1 - bez puli wątków).
+ * @param workerBusyTimes Czasy pracy kolejnych wątków w sekundach (powiększane o czas tego wywołania).
+ */
+void hornerProgression(
+    float coeffs[], int n, float points[], int numPoints, float step,
+    float results[], int numThreads,
+    std::vector<double>& workerBusyTimes);
+
+/**
+ * @brief Oblicza wartość wielomianu i jego pierwsze pochodne w jednym przejściu schematu Hornera.
+ * Dla każdego współczynnika aktualizowane są kolejno akumulatory pochodnych (d[j] = d[j] * x + d[j - 1])
+ * i wartości, więc koszt rośnie liniowo z liczbą pochodnych zamiast wielokrotnego
+ * przechodzenia po współczynnikach. Punkty liczone są grupami po 8 (jeden wektor AVX).
+ *
+ * @param coeffs Lista współczynników wielomianu.
+ * @param n Liczba współczynników wielomianu.
+ * @param points Punkty, w których obliczane są wartości.
+ * @param numPoints Liczba punktów.
+ * @param derivatives Liczba pochodnych (1..configuration::MAX_DERIVATIVES).
+ * @param results Tablica numPoints x (derivatives + 1) zapisywana wierszami: p(x), p'(x), p''(x), ...
+ * @param numThreads Liczba wątków używanych w obliczeniach (1 - bez puli wątków).
+ * @param workerBusyTimes Czasy pracy kolejnych wątków w sekundach (powiększane o czas tego wywołania).
+ */
+void hornerDerivatives(
+    float coeffs[], int n, float points[], int numPoints, int derivatives,
+    float results[], int numThreads,
+    std::vector<double>& workerBusyTimes);
@@ -0,0 +1,92 @@
+/**
+ * @file threadpool.cpp
+ * @author krzsztfwtk
+ * @brief Trwała pula wątków używana przez wielowątkowe obliczenia wielomianu
+ * @version 2.1
+ * @date 2024-12-20
+ *
+ * @copyright Copyright (c) 2025 krzsztfwtk
+ *
+ */
+
+#include "threadpool.h"
+
+#include <algorithm>
+
+ThreadPool::ThreadPool(int numThreads) {
+    resize(numThreads);
+}
+
+ThreadPool::~ThreadPool() {
+    stopWorkers();
+}
+
+void ThreadPool::resize(int numThreads) {
+    numThreads = std::max(0, numThreads);
+    if (numThreads == size()) {
+        return;
+    }
+
+    stopWorkers();
+
+    std::lock_guard<std::mutex> lock(mutex);
+    stopping = false;
+    for (int i = 0; i < numThreads; ++i) {
+        // Nowy wątek czeka na zadanie nowsze niż bieżąca generacja
+        workers.emplace_back(&ThreadPool::workerLoop, this, i, generation);
+    }
+}
+
+int ThreadPool::size() const {
+    return (int)workers.size();
+}
+
+void ThreadPool::run(const std::function<void(int)>& newTask) {
+    std::unique_lock<std::mutex> lock(mutex);
+    task = newTask;
+    pending = size();
+    ++generation;
+    taskReady.notify_all();
+    taskDone.wait(lock, [this]() { return pending == 0; });
+    task = nullptr;
+}
+
+void ThreadPool::workerLoop(int index, unsigned long long seenGeneration) {
+    while (true) {
+        std::function<void(int)> currentTask;
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            taskReady.wait(lock, [&]() { return stopping || generation != seenGeneration; });
+            if (stopping) {
+                return;
+            }
+            seenGeneration = generation;
+            currentTask = task;
+        }
+
+        currentTask(index);
+
+        std::lock_guard<std::mutex> lock(mutex);
+        if (--pending == 0) {
+            taskDone.notify_all();
+        }
+    }
+}
+
+void ThreadPool::stopWorkers() {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        stopping = true;
+    }
+    taskReady.notify_all();
+    for (auto& worker : workers) {
+        worker.join();
+    }
+    workers.clear();
+}
+
+ThreadPool& getThreadPool(int numThreads) {
+    static ThreadPool pool;
+    pool.resize(numThreads);
+    return pool;
+}
@@ -0,0 +1,82 @@
+/**
+ * @file threadpool.h
+ * @author krzsztfwtk
+ * @brief Trwała pula wątków używana przez wielowątkowe obliczenia wielomianu
+ * @version 2.1
+ * @date 2024-12-20
+ *
+ * @copyright Copyright (c) 2025 krzsztfwtk
+ *
+ */
+
+#pragma once
+
+#include <vector>
+#include <thread>
+#include <mutex>
+#include <condition_variable>
+#include <functional>
+
+/**
+ * @brief Pula wątków tworzonych raz i używanych przez kolejne obliczenia.
+ * Każde wywołanie run uruchamia to samo zadanie na wszystkich wątkach puli
+ * i czeka na jego zakończenie, więc narzut wywołania to tylko powiadomienie wątków.
+ */
+class ThreadPool {
+public:
+    /**
+     * @brief Tworzy pulę z podaną liczbą wątków.
+     *
+     * @param numThreads Liczba wątków puli.
+     */
+    explicit ThreadPool(int numThreads = 0);
+
+    /**
+     * @brief Kończy pracę wszystkich wątków puli.
+     */
+    ~ThreadPool();
+
+    ThreadPool(const ThreadPool&) = delete;
+    ThreadPool& operator=(const ThreadPool&) = delete;
+
+    /**
+     * @brief Zmienia liczbę wątków puli (wątki są tworzone ponownie tylko przy zmianie).
+     *
+     * @param numThreads Nowa liczba wątków puli.
+     */
+    void resize(int numThreads);
+
+    /**
+     * @brief Zwraca liczbę wątków puli.
+     */
+    int size() const;
+
+    /**
+     * @brief Uruchamia zadanie na każdym wątku puli i czeka na zakończenie wszystkich.
+     *
+     * @param task Zadanie wywoływane z indeksem wątku (0..size()-1).
+     */
+    void run(const std::function<void(int)>& task);
+
+private:
+    void workerLoop(int index, unsigned long long generation);
+    void stopWorkers();
+
+    std::vector<std::thread> workers;
+    std::mutex mutex;
+    std::condition_variable taskReady;
+    std::condition_variable taskDone;
+    std::function<void(int)> task;
+    unsigned long long generation = 0;
+    int pending = 0;
+    bool stopping = false;
+};
+
+/**
+ * @brief Zwraca współdzieloną pulę wątków o podanej liczbie wątków.
+ * Pula jest tworzona przy pierwszym użyciu i zmieniana tylko, gdy zmieni się threads_number.
+ *
+ * @param numThreads Wymagana liczba wątków.
+ * @return ThreadPool& Współdzielona pula wątków.
+ */
+ThreadPool& getThreadPool(int numThreads);
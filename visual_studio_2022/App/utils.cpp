@@ -15,9 +15,144 @@
 #include <iostream>
 #include <mutex>
 #include <sstream>
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <chrono>
+#include <filesystem>
+#include <algorithm>
+#include <cmath>
 
-// Funkcja do odczytu współczynników z pliku
+// Nagłówek pliku pomocniczego ze sparsowanymi współczynnikami (<plik>.cache) -
+// układ musi być zgodny z HEADER_FORMAT w gui/coeffs_cache.py
+#pragma pack(push, 1)
+struct CoefficientsCacheHeader {
+    char magic[4];
+    uint16_t version;
+    uint16_t itemsize;
+    uint32_t reserved;
+    int64_t mtimeNs;
+    uint64_t size;
+    uint64_t count;
+};
+#pragma pack(pop)
+
+static const char* const COEFFS_CACHE_SUFFIX = ".cache";
+static const uint16_t COEFFS_CACHE_VERSION = 2;
+// Początek pliku czasu obliczeń, gdy obliczenia się nie powiodły (COMPUTATION_ERROR_PREFIX w PythonGUI/gui/engine.py)
+static const char* const COMPUTATION_ERROR_PREFIX = "error:";
+// Nagłówek pliku współczynników w formacie rzadkim (SPARSE_HEADER w PythonGUI/gui/sparse.py)
+static const char* const SPARSE_COEFFS_HEADER = "# sparse";
+
+// Współczynniki ostatnio wczytanego pliku - serwer obsługuje wiele zleceń dla tych samych danych
+struct CoefficientsCacheEntry {
+    std::string filename;
+    int64_t mtimeNs = 0;
+    uint64_t size = 0;
+    std::vector<float> coefficients;
+};
+static CoefficientsCacheEntry lastCoefficients;
+
+// Klucz pamięci podręcznej: rozmiar pliku i czas modyfikacji w nanosekundach od epoki Unix
+static bool getFileKey(const std::string& filename, int64_t& mtimeNs, uint64_t& size) {
+    std::error_code ec;
+    auto writeTime = std::filesystem::last_write_time(filename, ec);
+    if (ec) {
+        return false;
+    }
+    size = std::filesystem::file_size(filename, ec);
+    if (ec) {
+        return false;
+    }
+    auto sysTime = std::chrono::file_clock::to_sys(writeTime);
+    mtimeNs = std::chrono::duration_cast<std::chrono::nanoseconds>(sysTime.time_since_epoch()).count();
+    return true;
+}
+
+// Odczyt współczynników z pliku pomocniczego, jeżeli odpowiada aktualnej wersji pliku .coeffs
+static bool readCoefficientsCache(const std::string& filename, int64_t mtimeNs, uint64_t size,
+                                  std::vector<float>& coefficients) {
+    std::ifstream cacheFile(filename + COEFFS_CACHE_SUFFIX, std::ios::binary);
+    if (!cacheFile.is_open()) {
+        return false;
+    }
+    CoefficientsCacheHeader header;
+    if (!cacheFile.read(reinterpret_cast<char*>(&header), sizeof(header))) {
+        return false;
+    }
+    if (std::memcmp(header.magic, "HRNC", 4) != 0 || header.version != COEFFS_CACHE_VERSION
+        || header.mtimeNs != mtimeNs || header.size != size || header.count == 0) {
+        return false;
+    }
+
+    coefficients.resize(header.count);
+    if (header.itemsize == sizeof(float)) {
+        cacheFile.read(reinterpret_cast<char*>(coefficients.data()), header.count * sizeof(float));
+    }
+    else if (header.itemsize == sizeof(double)) {
+        // Plik zapisany przez GUI w precyzji float64
+        std::vector<double> values(header.count);
+        cacheFile.read(reinterpret_cast<char*>(values.data()), header.count * sizeof(double));
+        std::copy(values.begin(), values.end(), coefficients.begin());
+    }
+    else {
+        return false;
+    }
+    return (bool)cacheFile;
+}
+
+// Zapis sparsowanych współczynników do pliku pomocniczego (błędy nie przerywają obliczeń)
+static void writeCoefficientsCache(const std::string& filename, int64_t mtimeNs, uint64_t size,
+                                   const std::vector<float>& coefficients) {
+    std::string cachePath = filename + COEFFS_CACHE_SUFFIX;
+    std::string tmpPath = cachePath + ".tmp";
+    {
+        std::ofstream cacheFile(tmpPath, std::ios::binary);
+        if (!cacheFile.is_open()) {
+            return;
+        }
+        CoefficientsCacheHeader header = { { 'H', 'R', 'N', 'C' }, COEFFS_CACHE_VERSION,
+            (uint16_t)sizeof(float), 0, mtimeNs, size, coefficients.size() };
+        cacheFile.write(reinterpret_cast<const char*>(&header), sizeof(header));
+        cacheFile.write(reinterpret_cast<const char*>(coefficients.data()), coefficients.size() * sizeof(float));
+        if (!cacheFile) {
+            return;
+        }
+    }
+    std::error_code ec;
+    std::filesystem::rename(tmpPath, cachePath, ec);
+}
+
+// Funkcja do odczytu współczynników z pliku z wykorzystaniem pamięci podręcznej
 bool readCoefficients(const std::string& filename, std::vector<float>& coefficients) {
+    int64_t mtimeNs;
+    uint64_t size;
+    if (!getFileKey(filename, mtimeNs, size)) {
+        return parseCoefficients(filename, coefficients);
+    }
+
+    if (lastCoefficients.filename == filename && lastCoefficients.mtimeNs == mtimeNs
+        && lastCoefficients.size == size) {
+        coefficients = lastCoefficients.coefficients;
+        return true;
+    }
+
+    if (!readCoefficientsCache(filename, mtimeNs, size, coefficients)) {
+        if (!parseCoefficients(filename, coefficients)) {
+            return false;
+        }
+        writeCoefficientsCache(filename, mtimeNs, size, coefficients);
+    }
+
+    lastCoefficients.filename = filename;
+    lastCoefficients.mtimeNs = mtimeNs;
+    lastCoefficients.size = size;
+    lastCoefficients.coefficients = coefficients;
+    return true;
+}
+
+// Funkcja do parsowania tekstowego pliku współczynników
+bool parseCoefficients(const std::string& filename, std::vector<float>& coefficients) {
     std::ifstream inputFile(filename);
     if (!inputFile.is_open()) {
         std::cerr << "Failed to open coefficients file: " << filename << std::endl;
@@ -26,16 +161,57 @@ bool readCoefficients(const std::string& filename, std::vector<float>& coefficie
     coefficients.clear();
     float value;
     std::string line;
+    // Format rzadki: pierwszy niepusty wiersz to nagłówek SPARSE_COEFFS_HEADER, dalej pary
+    // "stopień wartość" w liniach (rozwijane do gęstej tablicy). Bez nagłówka plik jest gęsty.
+    bool sparse = false;
+    bool headerChecked = false;
     while (std::getline(inputFile, line)) {
-        std::stringstream ss(line);
-        if (ss >> value) {
-            coefficients.push_back(value);
+        size_t begin = line.find_first_not_of(" \t\r");
+        if (begin == std::string::npos && (sparse || !headerChecked)) {
+            continue;  // Pusta linia przed danymi lub w pliku rzadkim
+        }
+        if (!headerChecked) {
+            headerChecked = true;
+            size_t end = line.find_last_not_of(" \t\r");
+            if (line.compare(begin, end - begin + 1, SPARSE_COEFFS_HEADER) == 0) {
+                sparse = true;
+                continue;
+            }
         }
-        else {
+
+        std::stringstream ss(line);
+        double first;
+        if (!(ss >> first)) {
             std::cerr << "Invalid coefficient value in file: " << line << std::endl;
             inputFile.close();
             return false;
         }
+
+        if (!sparse) {
+            if (ss >> value) {
+                std::cerr << "Invalid coefficients file format (sparse files must start with \""
+                          << SPARSE_COEFFS_HEADER << "\"): " << line << std::endl;
+                inputFile.close();
+                return false;
+            }
+            coefficients.push_back((float)first);
+            continue;
+        }
+        if (!(ss >> value)) {
+            std::cerr << "Sparse coefficients file must contain \"degree value\" pairs: " << line << std::endl;
+            inputFile.close();
+            return false;
+        }
+        if (first < 0 || first != std::floor(first)) {
+            std::cerr << "Invalid degree in sparse coefficients file: " << line << std::endl;
+            inputFile.close();
+            return false;
+        }
+        size_t degree = (size_t)first;
+        if (degree >= coefficients.size()) {
+            coefficients.resize(degree + 1, 0.0f);
+        }
+        coefficients[degree] += value;
     }
     inputFile.close();
 
@@ -47,14 +223,13 @@ bool readCoefficients(const std::string& filename, std::vector<float>& coefficie
     return true;
 }
 
-// Funkcja do odczytu punktów z pliku (czyta start, end, step i generuje punkty)
-bool readPoints(const std::string& filename, std::vector<float>& points) {
+// Funkcja do odczytu parametrów punktów z pliku (start, end, step)
+bool readPointsRange(const std::string& filename, double& start, double& end, double& step) {
     std::ifstream inputFile(filename);
     if (!inputFile.is_open()) {
         std::cerr << "Failed to open points file: " << filename << std::endl;
         return false;
     }
-    float start, end, step;
     inputFile >> start >> end >> step;
     inputFile.close();
 
@@ -67,41 +242,108 @@ bool readPoints(const std::string& filename, std::vector<float>& points) {
         return false;
     }
 
-    points.clear();
-    for (float current = start; current <= end; current += step) {
-        points.push_back(current);
+    return true;
+}
+
+// Liczba punktów siatki - ten sam wzór co count_points w gui/grid.py
+long long countPoints(double start, double end, double step) {
+    return (long long)std::floor((end - start) / step + 1e-9) + 1;
+}
+
+// Funkcja generująca blok punktów o podanych indeksach, tak aby cały zakres nigdy nie był w pamięci
+int readPointsChunk(double start, double step, long long totalPoints, long long first, int chunkSize, std::vector<float>& points) {
+    int count = (int)std::max(0LL, std::min((long long)chunkSize, totalPoints - first));
+    points.resize(count);
+    for (int i = 0; i < count; ++i) {
+        points[i] = (float)(start + step * (double)(first + i));
     }
+    return count;
+}
 
-    if (points.empty()) {
-        std::cerr << "No points generated from file: " << filename << std::endl;
-        return false;
+// Funkcja do dopisywania bloku wyników do pliku
+bool writeResultsChunk(std::ostream& outputFile, const std::vector<float>& results, int count, int columns) {
+    for (int i = 0; i < count; ++i) {
+        for (int j = 0; j < columns; ++j) {
+            outputFile << results[(size_t)i * columns + j] << (j + 1 < columns ? ' ' : '\n');
+        }
     }
+    return outputFile.good();
+}
 
-    return true;
+// Nagłówek binarnego pliku wyników - układ musi być zgodny z HEADER_FORMAT w gui/results_io.py
+#pragma pack(push, 1)
+struct ResultsBinaryHeader {
+    char magic[4];
+    uint16_t version;
+    uint16_t itemsize;
+    uint32_t columns;
+    uint32_t reserved;
+    uint64_t count;
+    double start;
+    double end;
+    double step;
+};
+#pragma pack(pop)
+
+static const uint16_t RESULTS_BINARY_VERSION = 1;
+
+// Funkcja do zapisu nagłówka binarnego pliku wyników
+bool writeResultsBinaryHeader(std::ostream& outputFile, double start, double end, double step, int columns) {
+    ResultsBinaryHeader header = { { 'H', 'R', 'N', 'B' }, RESULTS_BINARY_VERSION,
+        (uint16_t)sizeof(float), (uint32_t)columns, 0, 0, start, end, step };
+    outputFile.write(reinterpret_cast<const char*>(&header), sizeof(header));
+    return outputFile.good();
 }
 
-// Funkcja do zapisu wyników do pliku
-bool writeResults(const std::string& filename, const std::vector<float>& results) {
+// Funkcja do dopisywania bloku wyników w formacie binarnym
+bool writeResultsChunkBinary(std::ostream& outputFile, const std::vector<float>& results, int count, int columns) {
+    outputFile.write(reinterpret_cast<const char*>(results.data()), (size_t)count * columns * sizeof(float));
+    return outputFile.good();
+}
+
+// Funkcja uzupełniająca liczbę punktów w nagłówku binarnego pliku wyników
+bool writeResultsBinaryCount(std::ostream& outputFile, unsigned long long count) {
+    uint64_t value = count;
+    outputFile.seekp(offsetof(ResultsBinaryHeader, count));
+    outputFile.write(reinterpret_cast<const char*>(&value), sizeof(value));
+    return outputFile.good();
+}
+
+// Funkcja do zapisu czasu obliczeń do pliku
+bool writeComputationTime(const std::string& filename, double computationTime) {
     std::ofstream outputFile(filename);
     if (!outputFile.is_open()) {
-        std::cerr << "Failed to open results file: " << filename << std::endl;
+        std::cerr << "Failed to open computation time file: " << filename << std::endl;
         return false;
     }
-    for (const auto& value : results) {
-        outputFile << value << std::endl;
-    }
+    outputFile << computationTime << std::endl;
     outputFile.close();
     return true;
 }
 
-// Funkcja do zapisu czasu obliczeń do pliku
-bool writeComputationTime(const std::string& filename, double computationTime) {
+// Zapisuje znacznik błędu zamiast czasu obliczeń - klient (gui/events.py) zgłasza wtedy błąd
+// zamiast czekać do przekroczenia czasu
+bool writeComputationError(const std::string& filename, const std::string& message) {
     std::ofstream outputFile(filename);
     if (!outputFile.is_open()) {
         std::cerr << "Failed to open computation time file: " << filename << std::endl;
         return false;
     }
-    outputFile << computationTime << std::endl;
+    outputFile << COMPUTATION_ERROR_PREFIX << " " << message << std::endl;
+    outputFile.close();
+    return true;
+}
+
+// Zapisuje czasy pracy wątków, jedna wartość na linię
+bool writeWorkerTimes(const std::string& filename, const std::vector<double>& workerBusyTimes) {
+    std::ofstream outputFile(filename);
+    if (!outputFile.is_open()) {
+        std::cerr << "Failed to open worker times file: " << filename << std::endl;
+        return false;
+    }
+    for (double busyTime : workerBusyTimes) {
+        outputFile << busyTime << '\n';
+    }
     outputFile.close();
     return true;
 }
@@ -13,6 +13,7 @@
 
 #include <vector>
 #include <string>
+#include <ostream>
 
 /**
  * @brief Wczytuje wsp�czynniki wielomianu z pliku.
@@ -24,26 +25,105 @@
  */
 bool readCoefficients(const std::string& filename, std::vector<float>& coefficients);
 
+/**
+ * @brief Parsuje tekstowy plik współczynników (bez korzystania z pamięci podręcznej).
+ * readCoefficients korzysta z niej, gdy plik pomocniczy <plik>.cache jest nieaktualny
+ * (klucz: rozmiar i czas modyfikacji pliku) lub nie istnieje.
+ * Obsługuje format gęsty (jeden współczynnik w linii) i rzadki (nagłówek "# sparse",
+ * a po nim pary "stopień wartość"), który jest rozwijany do gęstego wektora współczynników.
+ * O formacie decyduje wyłącznie nagłówek - pary wartości w pliku bez niego są błędem.
+ *
+ * @param filename Nazwa pliku zawierającego współczynniki.
+ * @param coefficients Wektor, do którego zostaną zapisane współczynniki.
+ * @return true Jeśli odczyt zakończył się sukcesem.
+ * @return false Jeśli odczyt nie powiódł się.
+ */
+bool parseCoefficients(const std::string& filename, std::vector<float>& coefficients);
+
 
 /**
- * @brief Wczytuje punkty, dla kt�rych b�dzie obliczany wielomian, z pliku.
+ * @brief Wczytuje parametry start, end, step z pliku punktów bez generowania samych punktów.
  *
- * @param filename Nazwa pliku zawieraj�cego punkty.
- * @param points Wektor, do kt�rego zostan� zapisane punkty.
- * @return true Je�li operacja zako�czy�a si� powodzeniem.
- * @return false Je�li operacja nie powiod�a si�.
+ * @param filename Nazwa pliku zawierającego parametry punktów.
+ * @param start Pierwszy punkt.
+ * @param end Ostatni punkt (włącznie).
+ * @param step Krok między kolejnymi punktami.
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się (np. niepoprawny krok lub zakres).
  */
-bool readPoints(const std::string& filename, std::vector<float>& points);
+bool readPointsRange(const std::string& filename, double& start, double& end, double& step);
 
 /**
- * @brief Zapisuje wyniki oblicze� do pliku.
+ * @brief Zwraca liczbę punktów start, start + step, ..., <= end.
  *
- * @param filename Nazwa pliku, do kt�rego zostan� zapisane wyniki.
- * @param results Wektor zawieraj�cy wyniki oblicze�.
- * @return true Je�li operacja zako�czy�a si� powodzeniem.
- * @return false Je�li operacja nie powiod�a si�.
+ * Wzór jest taki sam jak w count_points z gui/grid.py, więc serwer C++ i silnik NumPy
+ * zawsze obliczają tę samą liczbę punktów.
  */
-bool writeResults(const std::string& filename, const std::vector<float>& results);
+long long countPoints(double start, double end, double step);
+
+/**
+ * @brief Generuje blok punktów siatki o indeksach [first, first + chunkSize) (nie dalej niż totalPoints).
+ *
+ * Punkt o indeksie i to start + i * step liczone w double - bez kumulacji błędów
+ * zaokrągleń i niezależnie od pozostałych bloków (tak jak PointGrid z gui/grid.py).
+ *
+ * @param start Pierwszy punkt zakresu.
+ * @param step Krok między kolejnymi punktami.
+ * @param totalPoints Liczba wszystkich punktów (countPoints).
+ * @param first Indeks pierwszego punktu bloku.
+ * @param chunkSize Maksymalna liczba punktów w bloku.
+ * @param points Wektor, do którego zostaną zapisane punkty bloku.
+ * @return int Liczba wygenerowanych punktów (0 oznacza koniec zakresu).
+ */
+int readPointsChunk(double start, double step, long long totalPoints, long long first, int chunkSize, std::vector<float>& points);
+
+/**
+ * @brief Dopisuje blok wyników obliczeń do otwartego strumienia wyjściowego.
+ *
+ * @param outputFile Strumień pliku wyników.
+ * @param results Wektor zawierający wyniki obliczeń bloku.
+ * @param count Liczba punktów (wierszy) do zapisania.
+ * @param columns Liczba wartości na punkt (wartość i kolejne pochodne), w tekście oddzielonych spacją.
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się.
+ */
+bool writeResultsChunk(std::ostream& outputFile, const std::vector<float>& results, int count, int columns = 1);
+
+/**
+ * @brief Zapisuje nagłówek binarnego pliku wyników (format odczytywany przez gui/results_io.py).
+ * Liczba punktów jest uzupełniana po zakończeniu obliczeń przez writeResultsBinaryCount.
+ *
+ * @param outputFile Strumień pliku wyników otwarty w trybie binarnym.
+ * @param start Pierwszy punkt zakresu.
+ * @param end Ostatni punkt zakresu.
+ * @param step Krok między kolejnymi punktami.
+ * @param columns Liczba kolumn wyników na punkt.
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się.
+ */
+bool writeResultsBinaryHeader(std::ostream& outputFile, double start, double end, double step, int columns = 1);
+
+/**
+ * @brief Dopisuje blok wyników jako surowe wartości float32 (little-endian).
+ *
+ * @param outputFile Strumień pliku wyników otwarty w trybie binarnym.
+ * @param results Wektor zawierający wyniki obliczeń bloku.
+ * @param count Liczba punktów (wierszy) do zapisania.
+ * @param columns Liczba wartości na punkt (zapisywanych kolejno dla każdego punktu).
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się.
+ */
+bool writeResultsChunkBinary(std::ostream& outputFile, const std::vector<float>& results, int count, int columns = 1);
+
+/**
+ * @brief Uzupełnia liczbę punktów w nagłówku binarnego pliku wyników.
+ *
+ * @param outputFile Strumień pliku wyników otwarty w trybie binarnym.
+ * @param count Liczba zapisanych punktów.
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się.
+ */
+bool writeResultsBinaryCount(std::ostream& outputFile, unsigned long long count);
 
 /**
  * @brief Zapisuje czas oblicze� do pliku.
@@ -55,6 +135,27 @@ bool writeResults(const std::string& filename, const std::vector<float>& results
  */
 bool writeComputationTime(const std::string& filename, double computationTime);
 
+/**
+ * @brief Zapisuje do pliku czasu obliczeń znacznik błędu ("error: opis") zamiast czasu.
+ * Klient po sygnale zakończenia odczytuje go i od razu zgłasza błąd.
+ *
+ * @param filename Nazwa pliku czasu obliczeń.
+ * @param message Opis błędu.
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się.
+ */
+bool writeComputationError(const std::string& filename, const std::string& message);
+
+/**
+ * @brief Zapisuje czas pracy każdego wątku (jedna wartość w sekundach na linię).
+ *
+ * @param filename Nazwa pliku, do którego zostaną zapisane czasy pracy wątków.
+ * @param workerBusyTimes Czasy pracy kolejnych wątków w sekundach.
+ * @return true Jeśli operacja zakończyła się powodzeniem.
+ * @return false Jeśli operacja nie powiodła się.
+ */
+bool writeWorkerTimes(const std::string& filename, const std::vector<double>& workerBusyTimes);
+
 /**
  * @brief Zapisuje post�p oblicze� do pliku.
  *
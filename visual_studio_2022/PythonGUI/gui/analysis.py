@@ -0,0 +1,210 @@
+import sys
+import argparse
+
+import numpy as np
+
+import gui.config as conf
+from gui.engine import (
+    read_coefficients,
+    read_points_range,
+    horner,
+    horner_derivatives,
+)
+from gui.multipoint import UNIT_ROUNDOFF
+from gui.grid import PointGrid
+
+
+def _scan_grid(coefficients, start, end, step):
+    """
+    Jedno przejście po siatce punktów (blokami conf.POINTS_CHUNK_SIZE): oblicza p(x) i p'(x)
+    i zwraca przedziały [x_i, x_i+1], na których zmienia się znak p (pierwiastki) lub p'
+    (ekstrema), oraz punkty siatki, w których p lub p' jest dokładnie zerem.
+
+    :return: Krotka (przedziały pierwiastków, zera p w siatce, przedziały ekstremów, zera p' w siatce),
+             przedziały jako tablice (k x 2)
+    """
+    root_brackets, root_points = [], []
+    extremum_brackets, extremum_points = [], []
+    previous = None  # Ostatni punkt poprzedniego bloku (zmiana znaku na granicy bloków)
+
+    for points in PointGrid(start, end, step).chunks(conf.POINTS_CHUNK_SIZE, np.float64):
+        values = horner_derivatives(coefficients, points, 1, np.float64)
+        x, p, dp = points, values[:, 0], values[:, 1]
+        if previous is not None:
+            x = np.concatenate(([previous[0]], x))
+            p = np.concatenate(([previous[1]], p))
+            dp = np.concatenate(([previous[2]], dp))
+        else:
+            # Zera w punktach siatki (pierwszy punkt bloku był już sprawdzony w poprzednim bloku)
+            root_points.append(x[:1][p[:1] == 0])
+            extremum_points.append(x[:1][dp[:1] == 0])
+        previous = (x[-1], p[-1], dp[-1])
+
+        for f, brackets, zeros in ((p, root_brackets, root_points), (dp, extremum_brackets, extremum_points)):
+            with np.errstate(invalid='ignore', over='ignore'):
+                change = np.flatnonzero((f[:-1] * f[1:] < 0) & np.isfinite(f[:-1]) & np.isfinite(f[1:]))
+            brackets.append(np.stack((x[change], x[change + 1]), axis=1))
+            zeros.append(x[1:][f[1:] == 0])
+
+    return (
+        np.concatenate(root_brackets) if root_brackets else np.empty((0, 2)),
+        np.concatenate(root_points) if root_points else np.empty(0),
+        np.concatenate(extremum_brackets) if extremum_brackets else np.empty((0, 2)),
+        np.concatenate(extremum_points) if extremum_points else np.empty(0),
+    )
+
+
+def _refine(coefficients, brackets, orders):
+    """
+    Zawęża jednocześnie wszystkie przedziały ze zmianą znaku funkcji g = p^(order) iteracją
+    Newtona zabezpieczoną metodą Illinois (regula falsi z połowieniem wartości końca
+    przedziału, który nie zmienił się dwa razy z rzędu). W każdej iteracji wszystkie aktywne
+    przedziały obliczane są jednym wywołaniem horner_derivatives.
+
+    :param brackets: Tablica (k x 2) przedziałów [a, b]
+    :param orders: Tablica (k) - 0 dla pierwiastków p, 1 dla pierwiastków p' (ekstremów)
+    :return: Tablica (k) znalezionych miejsc zerowych
+    """
+    count = len(brackets)
+    rows = np.arange(count)
+    a, b = brackets[:, 0].copy(), brackets[:, 1].copy()
+
+    def evaluate(x, index):
+        values = horner_derivatives(coefficients, x, 2, np.float64)
+        return values[np.arange(len(x)), orders[index]], values[np.arange(len(x)), orders[index] + 1]
+
+    fa, da = evaluate(a, rows)
+    fb, db = evaluate(b, rows)
+    roots = np.where(np.abs(fa) < np.abs(fb), a, b)
+    last_side = np.zeros(count, dtype=np.int8)  # 1 - ostatnio zmieniony a, 2 - b
+    active = rows
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(conf.ANALYSIS_MAX_ITERATIONS):
+            if len(active) == 0:
+                break
+            ia = a[active]
+            ib = b[active]
+
+            # Krok Newtona z lepszego końca, a gdy wypada poza przedział - punkt regula falsi
+            use_a = np.abs(fa[active]) < np.abs(fb[active])
+            x0 = np.where(use_a, ia, ib)
+            newton = x0 - np.where(use_a, fa[active] / da[active], fb[active] / db[active])
+            false_position = (ia * fb[active] - ib * fa[active]) / (fb[active] - fa[active])
+            inside = np.isfinite(newton) & (newton > ia) & (newton < ib)
+            c = np.where(inside, newton, false_position)
+            c = np.where(np.isfinite(c) & (c > ia) & (c < ib), c, 0.5 * (ia + ib))
+
+            fc, dc = evaluate(c, active)
+            roots[active] = c
+
+            same_as_a = np.sign(fc) == np.sign(fa[active])
+            replace_a = active[same_as_a]
+            replace_b = active[~same_as_a]
+
+            # Illinois: koniec zachowany drugi raz z rzędu ma połowioną wartość
+            fb[replace_a[last_side[replace_a] == 1]] *= 0.5
+            fa[replace_b[last_side[replace_b] == 2]] *= 0.5
+            a[replace_a], fa[replace_a], da[replace_a] = c[same_as_a], fc[same_as_a], dc[same_as_a]
+            b[replace_b], fb[replace_b], db[replace_b] = c[~same_as_a], fc[~same_as_a], dc[~same_as_a]
+            last_side[replace_a] = 1
+            last_side[replace_b] = 2
+
+            # Koniec: zerowa wartość, wąski przedział albo znikomy krok (Newton zbiega z jednej strony)
+            tolerance = conf.ANALYSIS_TOLERANCE * np.maximum(1.0, np.abs(c))
+            done = (fc == 0) | (b[active] - a[active] <= tolerance) | (np.abs(c - x0) <= tolerance)
+            active = active[~done]
+
+    return roots
+
+
+def find_roots_and_extrema(coefficients, start, end, step):
+    """
+    Wyznacza wszystkie pierwiastki i ekstrema lokalne wielomianu w zakresie [start, end].
+    Zmiany znaku p i p' wykrywane są w jednym przejściu po siatce punktów (krok step),
+    a następnie wszystkie przedziały zawężane są jednocześnie (_refine), więc czas działania
+    to w przybliżeniu jedno dodatkowe obliczenie wielomianu na siatce.
+    Ekstrema, w których |p| nie przekracza oszacowania błędu zaokrągleń, są też zwracane
+    jako pierwiastki podwójne (bez zmiany znaku p nie da się ich wykryć na siatce).
+
+    Pierwiastki i ekstrema leżące między punktami siatki w parzystej liczbie (np. dwa
+    pierwiastki w jednym przedziale siatki) nie są wykrywane - o rozdzielczości decyduje step.
+
+    :param coefficients: Współczynniki wielomianu (coefficients[0] to wyraz wolny)
+    :return: Słownik z posortowanymi tablicami 'roots', 'minima' i 'maxima' (współrzędne x)
+    """
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    root_brackets, root_points, extremum_brackets, extremum_points = _scan_grid(coefficients, start, end, step)
+
+    brackets = np.concatenate((root_brackets, extremum_brackets))
+    orders = np.concatenate((np.zeros(len(root_brackets), dtype=np.intp), np.ones(len(extremum_brackets), dtype=np.intp)))
+    refined = _refine(coefficients, brackets, orders) if len(brackets) else np.empty(0)
+
+    roots = np.concatenate((refined[:len(root_brackets)], root_points))
+    extrema = np.concatenate((refined[len(root_brackets):], extremum_points))
+
+    values = horner_derivatives(coefficients, extrema, 2, np.float64)
+    with np.errstate(over='ignore', invalid='ignore'):
+        bound = 2 * len(coefficients) * UNIT_ROUNDOFF * horner(np.abs(coefficients), np.abs(extrema), np.float64)
+    double_roots = extrema[np.abs(values[:, 0]) <= bound]
+
+    return {
+        'roots': np.unique(np.concatenate((roots, double_roots))),
+        'minima': np.sort(extrema[values[:, 2] > 0]),
+        'maxima': np.sort(extrema[values[:, 2] < 0]),
+    }
+
+
+def analyze_files(coefficients_file, points_file):
+    """
+    Wyznacza pierwiastki i ekstrema wielomianu z pliku współczynników (format gęsty lub rzadki)
+    w zakresie pliku punktów. Siatka jest obliczana w precyzji float64, niezależnie od
+    precyzji i formatu pliku wyników obliczeń.
+
+    :return: Słownik jak w find_roots_and_extrema
+    """
+    coefficients = read_coefficients(coefficients_file, np.float64)
+    start, end, step = read_points_range(points_file)
+    return find_roots_and_extrema(coefficients, start, end, step)
+
+
+def format_analysis(analysis, limit=None):
+    """
+    Opis wyniku find_roots_and_extrema (okno GUI i wiersz poleceń). Z limit wypisywanych
+    jest co najwyżej limit wartości każdego rodzaju.
+    """
+    lines = []
+    for key, title in (('roots', 'Roots'), ('minima', 'Local minima'), ('maxima', 'Local maxima')):
+        values = analysis[key]
+        shown = values if limit is None else values[:limit]
+        text = ", ".join(f"{x:.10g}" for x in shown) or "none"
+        if len(shown) < len(values):
+            text += f", ... ({len(values) - len(shown)} more)"
+        lines.append(f"{title} ({len(values)}): {text}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Punkt wejścia python -m gui.analysis: pierwiastki i ekstrema wielomianu z plików
+    współczynników i punktów, bez GUI. Zwraca kod wyjścia (0 - sukces, 2 - błędne pliki).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m gui.analysis",
+        description="Find all real roots and local extrema of a polynomial over the range of a points file."
+    )
+    parser.add_argument("coefficients", help="coefficients file (.coeffs, dense or sparse format)")
+    parser.add_argument("points", help="points file (.points) - range and grid step of the search")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    try:
+        analysis = analyze_files(args.coefficients, args.points)
+    except (OSError, ValueError) as e:
+        print(f"Analysis failed: {e}", file=sys.stderr)
+        return 2
+    print(format_analysis(analysis))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import os
+
+import numpy as np
+
+import gui.config as conf
+from gui import coeffs_cache
+
+
+def list_coefficients_files(directory):
+    """Zwraca posortowane ścieżki plików .coeffs z katalogu (kolejność kolumn wyników)."""
+    names = sorted(name for name in os.listdir(directory) if name.endswith('.coeffs'))
+    return [os.path.join(directory, name) for name in names]
+
+
+def load_coefficients_batch(path, dtype=np.float32):
+    """
+    Wczytuje zestaw wielomianów trybu wsadowego jako macierz współczynników
+    (wiersz - stopień, kolumna - wielomian). Krótsze wielomiany uzupełniane są zerami.
+
+    :param path: Katalog z plikami .coeffs (jeden wielomian na plik, format gęsty lub rzadki)
+                 albo plik wielokolumnowy (w każdej linii współczynniki danego stopnia
+                 kolejnych wielomianów, pierwsza linia to wyrazy wolne)
+    :return: Macierz (liczba współczynników x liczba wielomianów) w zadanej precyzji
+    """
+    if os.path.isdir(path):
+        files = list_coefficients_files(path)
+        if not files:
+            raise ValueError(f"No .coeffs files found in directory: {path}")
+        polynomials = [coeffs_cache.load_coefficients(filename, np.float64) for filename in files]
+        matrix = np.zeros((max(len(p) for p in polynomials), len(polynomials)), dtype=dtype)
+        for column, coefficients in enumerate(polynomials):
+            matrix[:len(coefficients), column] = coefficients
+        return matrix
+
+    matrix = np.loadtxt(path, dtype=np.float64, ndmin=2)
+    if matrix.size == 0:
+        raise ValueError(f"No coefficients found in file: {path}")
+    return matrix.astype(dtype)
+
+
+def batch_chunk_size(num_polynomials):
+    """
+    Liczba punktów bloku w trybie wsadowym: blok wyników (punkty x wielomiany) ma co najwyżej
+    conf.BATCH_CHUNK_VALUES wartości, ale nie więcej punktów niż conf.POINTS_CHUNK_SIZE.
+    """
+    return max(1, min(conf.POINTS_CHUNK_SIZE, conf.BATCH_CHUNK_VALUES // max(1, num_polynomials)))
+
+
+class BatchEvaluator(object):
+    """
+    Oblicza jednocześnie wartości wielu wielomianów w tych samych punktach schematem Hornera
+    po wierszach macierzy współczynników: acc = acc * x + współczynniki stopnia k (od najwyższego)
+    dla całej paczki punktów i grupy wielomianów naraz - jedno przejście po siatce zamiast
+    osobnego przejścia dla każdego wielomianu. Zera uzupełniające krótsze wielomiany występują
+    przed ich najwyższym współczynnikiem, więc nie zmieniają wyniku (w przeciwieństwie do macierzy
+    potęg x^k, której przepełnienie dawałoby 0 * inf = NaN). Wielomiany dzielone są na grupy,
+    których współczynniki mieszczą się w conf.BATCH_GROUP_BYTES (pamięć podręczna), a punkty
+    na paczki, w których macierz wyników częściowych ma co najwyżej conf.BLOCKED_BUFFER_SIZE wartości.
+    """
+    def __init__(self, matrix, dtype=np.float32):
+        self.dtype = np.dtype(dtype)
+        self.matrix = np.ascontiguousarray(matrix, dtype=self.dtype)
+        self.num_coeffs, self.num_polynomials = self.matrix.shape
+
+        group = conf.BATCH_GROUP_BYTES // (self.dtype.itemsize * self.num_coeffs)
+        self.group_size = max(1, min(self.num_polynomials, group))
+        self.groups = [
+            (first, np.ascontiguousarray(self.matrix[:, first:first + self.group_size]))
+            for first in range(0, self.num_polynomials, self.group_size)
+        ]
+
+    def evaluate(self, points):
+        """
+        Oblicza wartości wszystkich wielomianów w punktach.
+
+        :return: Macierz wyników (liczba punktów x liczba wielomianów)
+        """
+        points = np.asarray(points, dtype=self.dtype)
+        results = np.empty((len(points), self.num_polynomials), dtype=self.dtype)
+        batch_size = max(1, conf.BLOCKED_BUFFER_SIZE // self.group_size)
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            for start in range(0, len(points), batch_size):
+                x = points[start:start + batch_size, np.newaxis]
+                for first, group_matrix in self.groups:
+                    acc = results[start:start + len(x), first:first + group_matrix.shape[1]]
+                    acc[...] = group_matrix[-1]
+                    for row in group_matrix[-2::-1]:
+                        np.multiply(acc, x, out=acc)
+                        acc += row
+        return results
@@ -0,0 +1,185 @@
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import gui.config as conf
+from gui.sparse import SPARSE_HEADER, is_sparse_format, parse_sparse_coefficients
+
+
+# Plik pomocniczy (sidecar) ze sparsowanymi współczynnikami, zapisywany obok pliku .coeffs.
+# Układ (little-endian) musi być zgodny z CoefficientsCacheHeader z App/utils.cpp:
+#   magic    4s   b'HRNC'
+#   version  u16  wersja formatu
+#   itemsize u16  4 (float32) lub 8 (float64)
+#   reserved u32  0
+#   mtime_ns i64  czas modyfikacji pliku .coeffs w nanosekundach od epoki Unix
+#   size     u64  rozmiar pliku .coeffs w bajtach
+#   count    u64  liczba współczynników
+# Po nagłówku następują surowe wartości współczynników.
+CACHE_SUFFIX = '.cache'
+CACHE_MAGIC = b'HRNC'
+CACHE_VERSION = 2
+HEADER_FORMAT = '<4sHHIqQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+_DTYPES = {
+    4: np.dtype('<f4'),
+    8: np.dtype('<f8'),
+}
+
+# Pamięć podręczna LRU: ścieżka -> (mtime_ns, size, itemsize źródła, współczynniki float64)
+_memory_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def sidecar_path(filename):
+    """Zwraca ścieżkę pliku pomocniczego dla pliku współczynników."""
+    return os.path.abspath(filename) + CACHE_SUFFIX
+
+
+def parse_coefficients(filename):
+    """
+    Parsuje tekstowy plik .coeffs w formacie gęstym (jeden współczynnik w linii, pierwszy
+    to wyraz wolny) lub rzadkim (nagłówek SPARSE_HEADER, a po nim pary "stopień wartość"
+    w liniach, gui/sparse.py). Format wybiera wyłącznie nagłówek, a cały plik musi mu
+    odpowiadać - np. pary wartości w pliku bez nagłówka są błędem.
+    Zwraca gęstą tablicę współczynników.
+    """
+    sparse = is_sparse_format(filename)
+    data = np.loadtxt(filename, dtype=np.float64, ndmin=2)
+    if data.size == 0:
+        raise ValueError(f"No coefficients found in file: {filename}")
+    if sparse:
+        if data.shape[1] != 2:
+            raise ValueError(f"Sparse coefficients file must contain \"degree value\" pairs: {filename}")
+        return parse_sparse_coefficients(data, filename)
+    if data.shape[1] != 1:
+        raise ValueError(
+            f"Invalid coefficients file format (sparse files must start with \"{SPARSE_HEADER}\"): {filename}"
+        )
+    return data[:, 0].copy()
+
+
+def _read_sidecar(filename, mtime_ns, size, dtype):
+    """
+    Wczytuje współczynniki z pliku pomocniczego, jeżeli jest aktualny i ma wystarczającą precyzję.
+
+    Zwraca krotkę (itemsize, współczynniki float64) lub None.
+    """
+    path = sidecar_path(filename)
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                return None
+            magic, version, itemsize, _, cached_mtime_ns, cached_size, count = struct.unpack(HEADER_FORMAT, header)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION or itemsize not in _DTYPES:
+                return None
+            if cached_mtime_ns != mtime_ns or cached_size != size:
+                return None
+            # Współczynniki float32 (zapisane przez serwer C++) nie wystarczą do obliczeń float64
+            if itemsize < np.dtype(dtype).itemsize:
+                return None
+            coefficients = np.fromfile(f, dtype=_DTYPES[itemsize], count=count)
+    except OSError:
+        return None
+
+    if coefficients.size != count or count == 0:
+        return None
+    return itemsize, coefficients.astype(np.float64, copy=False)
+
+
+def _write_sidecar(filename, mtime_ns, size, coefficients):
+    """Zapisuje współczynniki (float64) do pliku pomocniczego. Błędy zapisu są ignorowane."""
+    path = sidecar_path(filename)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(struct.pack(
+                HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, 8, 0, mtime_ns, size, coefficients.size
+            ))
+            f.write(np.ascontiguousarray(coefficients, dtype='<f8').tobytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_coefficients(filename, dtype=np.float32):
+    """
+    Wczytuje współczynniki wielomianu, korzystając kolejno z:
+      - pamięci podręcznej LRU (klucz: ścieżka + mtime + rozmiar pliku),
+      - pliku pomocniczego <plik>.cache ze sparsowanymi wartościami,
+      - parsowania pliku tekstowego (wynik zapisywany jest w obu pamięciach podręcznych).
+
+    Zwraca tablicę tylko do odczytu w zadanej precyzji.
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    itemsize_needed = np.dtype(dtype).itemsize
+
+    with _lock:
+        entry = _memory_cache.get(path)
+        if entry is not None and entry[:2] == key and entry[2] >= itemsize_needed:
+            _memory_cache.move_to_end(path)
+            coefficients = entry[3]
+        else:
+            cached = _read_sidecar(path, *key, dtype)
+            if cached is not None:
+                itemsize, coefficients = cached
+            else:
+                itemsize, coefficients = 8, parse_coefficients(path)
+                _write_sidecar(path, *key, coefficients)
+
+            coefficients.setflags(write=False)
+            _memory_cache[path] = (*key, itemsize, coefficients)
+            _memory_cache.move_to_end(path)
+            while len(_memory_cache) > conf.COEFFS_CACHE_SIZE:
+                _memory_cache.popitem(last=False)
+
+    if coefficients.dtype == dtype:
+        return coefficients
+    result = coefficients.astype(dtype)
+    result.setflags(write=False)
+    return result
+
+
+def store(filename, coefficients):
+    """
+    Zapisuje w pamięci podręcznej współczynniki właśnie zapisane do pliku (np. wygenerowane),
+    dzięki czemu pierwsze obliczenia nie muszą parsować pliku tekstowego.
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    coefficients = np.array(coefficients, dtype=np.float64)
+    coefficients.setflags(write=False)
+
+    with _lock:
+        _write_sidecar(path, *key, coefficients)
+        _memory_cache[path] = (*key, 8, coefficients)
+        _memory_cache.move_to_end(path)
+        while len(_memory_cache) > conf.COEFFS_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def invalidate(filename=None):
+    """
+    Usuwa wpisy z pamięci podręcznej i pliki pomocnicze.
+
+    :param filename: Plik współczynników do unieważnienia (None - cała pamięć podręczna LRU)
+    """
+    with _lock:
+        if filename is None:
+            _memory_cache.clear()
+            return
+
+        path = os.path.abspath(filename)
+        _memory_cache.pop(path, None)
+        if os.path.exists(sidecar_path(path)):
+            os.remove(sidecar_path(path))
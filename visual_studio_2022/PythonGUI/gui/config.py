@@ -6,4 +6,35 @@ TEMP_DIR = os.path.abspath('temp')
 CONFIG_FILE = os.path.join('config.ini')
 PROGRESS_FILE = os.path.join(TEMP_DIR, 'progress.tmp')
 COMPUTATION_TIME_FILE = os.path.join(TEMP_DIR, 'computation.time')
-TIMEOUT_SECONDS = 600
\ No newline at end of file
+WORKER_TIMES_FILE = os.path.join(TEMP_DIR, 'workers.time')
+ERROR_ESTIMATE_FILE = os.path.join(TEMP_DIR, 'error.estimate')
+TIMEOUT_SECONDS = 600
+POINTS_CHUNK_SIZE = 65536
+COEFFS_CACHE_SIZE = 8
+WRITE_BLOCK_SIZE = 65536
+IPC_BACKEND = 'auto'  # 'auto', 'win32' (serwer App) lub 'local' (lokalny proces NumPy)
+POLL_INTERVAL = 0.1
+JOB_WORKERS = 2  # Liczba workerów obsługujących kolejkę zleceń
+TILE_TARGET_WORK = 1 << 20  # Docelowa liczba mnożeń z dodawaniem na jeden kafelek (gui/parallel.py)
+BLOCKED_BUFFER_SIZE = 1 << 20  # Maksymalna liczba wyników częściowych schematu blokowego (horner_blocked)
+PROGRESSION_MAX_COEFFS = 10  # Maksymalna liczba współczynników dla schematu progression (błąd różnic rośnie ze stopniem)
+PROGRESSION_TILE_POINTS = 64  # Co ile punktów schemat progression odtwarza tablicę różnic
+PROGRESSION_MAX_SPAN = 1.0  # Maksymalna szerokość kafelka (ogranicza narastanie błędu na rzadkich siatkach)
+PROGRESSION_MIN_TILE_POINTS = 8  # Krótsze kafelki nie opłacają się - schemat Hornera
+MULTIPOINT_MIN_COEFFS = 64  # Próg opłacalności implementacji multipoint (gui/multipoint.py)
+MULTIPOINT_MIN_WORK = 1 << 20  # Minimalna liczba współczynników x punktów dla multipoint
+MULTIPOINT_ERROR_SAMPLES = 64  # Liczba punktów bloku, w których szacowany jest błąd
+SPARSE_MIN_ZERO_RATIO = 0.5  # Minimalny udział zerowych współczynników pliku gęstego dla schematu rzadkiego
+BATCH_GROUP_BYTES = 1 << 18  # Rozmiar współczynników grupy wielomianów trybu wsadowego (pamięć podręczna)
+BATCH_CHUNK_VALUES = 1 << 22  # Maksymalna liczba wyników (punkty x wielomiany) w bloku trybu wsadowego
+MAX_DERIVATIVES = 8  # Maksymalna liczba pochodnych liczonych razem z wartością (klucz derivatives)
+ANALYSIS_MAX_ITERATIONS = 60  # Maksymalna liczba iteracji zawężania przedziałów (gui/analysis.py)
+ANALYSIS_TOLERANCE = 1e-14  # Względna szerokość przedziału, przy której pierwiastek jest gotowy
+INCREMENTAL_MAX_POINTS = 1 << 22  # Maksymalna liczba zapamiętanych wyników (gui/incremental.py), 0 - wyłączone
+INCREMENTAL_MAX_COST_RATIO = 0.5  # Aktualizacja przyrostowa tylko, gdy kosztuje mniej niż ta część pełnego obliczenia
+INCREMENTAL_MAX_UPDATES = 16  # Po tylu aktualizacjach z rzędu wykonywane jest pełne obliczenie
+RESULTS_CACHE_DIR = os.path.join(TEMP_DIR, 'results_cache')  # Pamięć podręczna wyników (gui/results_cache.py)
+RESULTS_CACHE_MAX_BYTES = 512 << 20  # Łączny rozmiar wpisów, po przekroczeniu usuwane są najdawniej używane
+RESULTS_CACHE_MAX_ENTRY_BYTES = 128 << 20  # Większe wyniki nie są zapamiętywane
+MIN_TILE_POINTS = 8192  # Minimalna liczba punktów w kafelku (amortyzuje narzut wywołań NumPy)
+PARALLEL_CHUNK_POINTS = 1 << 19  # Punkty na workera w jednym wywołaniu puli procesów (gui/parallel.py)
\ No newline at end of file
@@ -0,0 +1,659 @@
+import os
+import math
+import time
+import configparser
+
+import numpy as np
+
+import gui.config as conf
+from gui import coeffs_cache, incremental, results_cache
+from gui.grid import PointGrid
+from gui.multipoint import should_use_multipoint, evaluate_multipoint, error_estimate, block_matrix, evaluate_blocked
+from gui.sparse import is_sparse_format, should_use_sparse, horner_sparse
+from gui.batch import BatchEvaluator, load_coefficients_batch, batch_chunk_size
+from gui import results_io
+from gui.results_io import open_results_writer
+
+
+# Obsługiwane precyzje obliczeń silnika NumPy
+PRECISIONS = {
+    'float32': np.float32,
+    'float64': np.float64,
+}
+
+# Początek pliku czasu obliczeń, w którym serwer C++ zapisał błąd zamiast czasu (writeComputationError)
+COMPUTATION_ERROR_PREFIX = 'error:'
+
+
+def read_config_file(filename=conf.CONFIG_FILE):
+    """
+    Wczytuje ustawienia z pliku config.ini (odpowiednik readConfigINI z App/config.cpp).
+
+    Zwraca słownik z ustawieniami, wartości logiczne i liczbowe są już przekonwertowane.
+    """
+    config = configparser.ConfigParser()
+    if not config.read(filename):
+        raise FileNotFoundError(f"Failed to open configuration file: {filename}")
+
+    section = config['Settings']
+    try:
+        threads_number = int(section.get('threads_number', '1'))
+    except ValueError:
+        threads_number = 1
+    try:
+        derivatives = min(max(int(section.get('derivatives', '0')), 0), conf.MAX_DERIVATIVES)
+    except ValueError:
+        derivatives = 0
+
+    return {
+        'implementation': section.get('implementation', ''),
+        'scheme': section.get('scheme', 'horner'),
+        'batch': section.get('batch') == '1',
+        'derivatives': derivatives,
+        'reuse_results': section.get('reuse_results', '1') == '1',
+        'precision': section.get('precision', 'float32'),
+        'multithreading': section.get('multithreading') == '1',
+        'threads_number': threads_number,
+        'avx': section.get('avx') == '1',
+        'save_results': section.get('save_results') == '1',
+        'results_format': section.get('results_format', 'text'),
+        'generate_chart': section.get('generate_chart') == '1',
+        'output_file': section.get('output_file', ''),
+        'input_coeffs_file': section.get('input_coeffs_file', ''),
+        'input_points_file': section.get('input_points_file', ''),
+        'progress_file': section.get('progress_file', ''),
+        'computation_time_file': section.get('computation_time_file', ''),
+        'worker_times_file': section.get('worker_times_file', ''),
+        'error_estimate_file': section.get('error_estimate_file', ''),
+    }
+
+
+def get_dtype(precision):
+    """Zwraca typ NumPy dla nazwy precyzji ('float32' lub 'float64')."""
+    try:
+        return PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"Unsupported precision: {precision}") from None
+
+
+def read_coefficients(filename, dtype=np.float32):
+    """
+    Wczytuje współczynniki wielomianu z pliku .coeffs (jeden współczynnik w linii,
+    pierwszy to wyraz wolny) - odpowiednik readCoefficients z App/utils.cpp.
+    Ponowne odczyty niezmienionego pliku korzystają z pamięci podręcznej (gui/coeffs_cache.py).
+    """
+    return coeffs_cache.load_coefficients(filename, dtype)
+
+
+def read_points_range(filename):
+    """
+    Wczytuje parametry start, end, step z pliku .points.
+
+    Zwraca krotkę (start, end, step).
+    """
+    with open(filename, 'r') as f:
+        parts = f.read().split()
+    if len(parts) != 3:
+        raise ValueError("Points file must contain exactly three values: start, end, and step.")
+    start, end, step = map(float, parts)
+    if step <= 0:
+        raise ValueError(f"Invalid step size in points file: {step}")
+    if start > end:
+        raise ValueError("Start value is greater than end value in points file.")
+    return start, end, step
+
+
+def evaluate_chunks(coefficients, grid, chunk_size=conf.POINTS_CHUNK_SIZE, dtype=np.float32, evaluate=None,
+                    scheme='horner', evaluator=None):
+    """
+    Generator obliczający wartości wielomianu blok po bloku siatki punktów (PointGrid).
+
+    :param evaluate: Opcjonalna funkcja evaluate(points) -> results (np. evaluate_multipoint),
+                     domyślnie kernel schematu scheme w bieżącym procesie
+    :param scheme: Schemat obliczeń (klucz SCHEMES), gdy evaluate nie jest podane
+    :param evaluator: Opcjonalny obiekt z metodą evaluate_range(grid, first, last) (ParallelEvaluator) -
+                      punkty bloku generują wtedy workery, każdy tylko swoje
+    :return: Krotki (first, last, results, computation_time) dla każdego bloku punktów o indeksach [first, last)
+    """
+    if evaluate is None:
+        kernel = get_kernel(scheme)
+        evaluate = lambda points: kernel(coefficients, points, dtype)
+
+    for first, last in grid.ranges(chunk_size):
+        if evaluator is not None:
+            start_time = time.perf_counter()
+            results = evaluator.evaluate_range(grid, first, last)
+        else:
+            points = grid.points(first, last, dtype)
+            start_time = time.perf_counter()
+            results = evaluate(points)
+        yield first, last, results, time.perf_counter() - start_time
+
+
+def horner(coefficients, points, dtype=np.float32):
+    """
+    Wektorowo oblicza wartości wielomianu metodą Hornera jednocześnie we wszystkich punktach.
+
+    :param coefficients: Współczynniki wielomianu (coefficients[0] to wyraz wolny)
+    :param points: Tablica punktów (x)
+    :param dtype: Precyzja obliczeń (np.float32 lub np.float64)
+    :return: Tablica wartości wielomianu w punktach
+    """
+    coefficients = np.asarray(coefficients, dtype=dtype)
+    points = np.asarray(points, dtype=dtype)
+
+    results = np.zeros(points.shape, dtype=dtype)
+    # Przepełnienie daje inf/nan, tak jak w implementacjach C++/ASM
+    with np.errstate(over='ignore', invalid='ignore'):
+        for coeff in coefficients[::-1]:
+            np.multiply(results, points, out=results)
+            results += coeff
+    return results
+
+
+def horner_derivatives(coefficients, points, derivatives, dtype=np.float32):
+    """
+    Oblicza wartość wielomianu i jego pierwsze pochodne w jednym przejściu schematu Hornera
+    (odpowiednik hornerDerivatives z App/horner.cpp). Dla każdego współczynnika aktualizowane są
+    akumulatory d[j] = d[j] * x + d[j - 1], po przejściu wszystkich d[j] = p^(j)(x) / j!.
+
+    :param derivatives: Liczba pochodnych (0 - tylko wartość)
+    :return: Macierz (liczba punktów x (derivatives + 1)): p(x), p'(x), p''(x), ...
+    """
+    coefficients = np.asarray(coefficients, dtype=dtype)
+    points = np.asarray(points, dtype=dtype)
+
+    results = np.zeros((derivatives + 1,) + points.shape, dtype=dtype)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for coeff in coefficients[::-1]:
+            for j in range(derivatives, 0, -1):
+                np.multiply(results[j], points, out=results[j])
+                results[j] += results[j - 1]
+            np.multiply(results[0], points, out=results[0])
+            results[0] += coeff
+        for j in range(2, derivatives + 1):
+            results[j] *= math.factorial(j)
+    return results.T
+
+
+def _horner_blocks(blocks, x):
+    """Wartości wszystkich podwielomianów (wierszy blocks) jednocześnie metodą Hornera."""
+    partial = np.zeros((blocks.shape[0], len(x)), dtype=blocks.dtype)
+    for i in range(blocks.shape[1] - 1, -1, -1):
+        np.multiply(partial, x, out=partial)
+        partial += blocks[:, i, np.newaxis]
+    return partial
+
+
+def horner_blocked(coefficients, points, dtype=np.float32):
+    """
+    Oblicza wartości wielomianu schematem blokowym (odpowiednik hornerBlocked z App/horner.cpp).
+    Współczynniki dzielone są na około sqrt(n) bloków po m współczynników, wszystkie
+    podwielomiany P_j liczone są jednocześnie metodą Hornera (jedna operacja NumPy na
+    macierzy bloków), a następnie łączone jako suma P_j(x) * (x^m)^j (evaluate_blocked,
+    wspólne z implementacją multipoint). Zamiast n operacji na tablicy punktów wykonywanych
+    jest około 2 * sqrt(n), co przyspiesza obliczenia wielomianów wysokiego stopnia w niewielu punktach.
+
+    Parametry i wynik jak w horner.
+    """
+    coefficients = np.asarray(coefficients, dtype=dtype)
+    points = np.asarray(points, dtype=dtype)
+    return evaluate_blocked(block_matrix(coefficients, dtype), points, _horner_blocks, dtype)
+
+
+def _scaled_stirling_table(degree):
+    """
+    Zwraca tablicę T[j, k] = k! * S(j, k) (S - liczby Stirlinga drugiego rodzaju), czyli
+    k-te różnice progresywne jednomianu t^j w punkcie 0: T(j, k) = k * (T(j-1, k) + T(j-1, k-1)).
+    """
+    table = np.zeros((degree + 1, degree + 1), dtype=np.float64)
+    table[0, 0] = 1.0
+    for j in range(1, degree + 1):
+        k = np.arange(1, j + 1)
+        table[j, 1:j + 1] = k * (table[j - 1, 1:j + 1] + table[j - 1, 0:j])
+    return table
+
+
+def progression_tile_size(step):
+    """
+    Zwraca liczbę punktów kafelka schematu progression dla kroku siatki: co najwyżej
+    conf.PROGRESSION_TILE_POINTS punktów i conf.PROGRESSION_MAX_SPAN szerokości.
+    Wartość mniejsza niż conf.PROGRESSION_MIN_TILE_POINTS oznacza, że siatka jest zbyt rzadka.
+    """
+    if step == 0:
+        return conf.PROGRESSION_TILE_POINTS
+    return int(min(conf.PROGRESSION_TILE_POINTS, conf.PROGRESSION_MAX_SPAN // abs(step) + 1))
+
+
+def horner_progression(coefficients, points, dtype=np.float32):
+    """
+    Oblicza wartości wielomianu w punktach ciągu arytmetycznego (format .points:
+    start end step) metodą różnic progresywnych. Punkty dzielone są na kafelki
+    (progression_tile_size); dla każdego kafelka wielomian jest przesuwany (Taylor shift)
+    do pierwszego punktu kafelka, z czego wyznaczana jest tablica różnic, a kolejne
+    wartości to tylko dodawania: D_k += D_(k+1). Obliczenia prowadzone są w float64.
+
+    Różnice wyższych rzędów powstają z dużych, znoszących się składników (k! * S(j, k)),
+    więc błąd szybko rośnie ze stopniem - odtwarzanie tablicy w kafelkach tego nie zmienia.
+    Dlatego wielomiany z więcej niż conf.PROGRESSION_MAX_COEFFS współczynnikami oraz zbyt
+    rzadkie siatki liczone są zwykłym schematem Hornera. Parametry i wynik jak w horner.
+    """
+    points = np.asarray(points, dtype=dtype)
+    n = len(coefficients)
+    count = len(points)
+    if n > conf.PROGRESSION_MAX_COEFFS or count < 2:
+        return horner(coefficients, points, dtype)
+
+    # Krok siatki z końców bloku (punkty mogą być zaokrąglone do float32)
+    x = points.astype(np.float64)
+    step = (x[-1] - x[0]) / (count - 1)
+    tile = progression_tile_size(step)
+    if tile < conf.PROGRESSION_MIN_TILE_POINTS:
+        return horner(coefficients, points, dtype)
+
+    degree = n - 1
+    num_tiles = (count + tile - 1) // tile
+    starts = x[::tile]
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        # Taylor shift do początków kafelków (wektorowo po kafelkach):
+        # shifted[j] = suma_k c_k * C(k, j) * x0^(k-j) = P^(j)(x0) / j!
+        binomials = np.zeros((n, n), dtype=np.float64)
+        binomials[:, 0] = 1.0
+        for k in range(1, n):
+            binomials[k, 1:] = binomials[k - 1, 1:] + binomials[k - 1, :-1]
+        weighted = binomials * coefficients[:, np.newaxis]  # weighted[k, j] = c_k * C(k, j)
+
+        shifted = np.zeros((n, num_tiles), dtype=np.float64)
+        power = np.ones(num_tiles, dtype=np.float64)
+        for offset in range(n):
+            diagonal = weighted[np.arange(offset, n), np.arange(n - offset)]
+            shifted[:n - offset] += diagonal[:, np.newaxis] * power
+            power = power * starts
+
+        # Współczynniki wielomianu Q(t) = P(x0 + step * t) i różnice progresywne Q w t = 0
+        shifted *= (step ** np.arange(n))[:, np.newaxis]
+        differences = _scaled_stirling_table(degree).T @ shifted
+
+        values = np.empty((num_tiles, tile), dtype=np.float64)
+        for i in range(tile):
+            values[:, i] = differences[0]
+            differences[:-1] += differences[1:]
+
+        return values.reshape(-1)[:count].astype(dtype)
+
+
+# Schematy obliczania wartości wielomianu (klucz scheme w config.ini)
+SCHEMES = {
+    'horner': horner,
+    'blocked': horner_blocked,
+    'progression': horner_progression,
+    'sparse': horner_sparse,
+}
+
+
+def get_kernel(scheme):
+    """Zwraca funkcję kernel(coefficients, points, dtype) dla nazwy schematu obliczeń."""
+    try:
+        return SCHEMES[scheme]
+    except KeyError:
+        raise ValueError(f"Unsupported evaluation scheme: {scheme}") from None
+
+
+def write_computation_time(filename, computation_time):
+    """Zapisuje czas obliczeń w sekundach (odpowiednik writeComputationTime)."""
+    with open(filename, 'w') as f:
+        f.write(f"{computation_time:g}\n")
+
+
+def read_computation_time(filename):
+    """
+    Odczytuje czas obliczeń w sekundach zapisany przez serwer C++.
+    Znacznik błędu (COMPUTATION_ERROR_PREFIX) zgłaszany jest jako ValueError z opisem błędu.
+    """
+    with open(filename, 'r') as f:
+        content = f.read().strip()
+    if content.startswith(COMPUTATION_ERROR_PREFIX):
+        raise ValueError(content[len(COMPUTATION_ERROR_PREFIX):].strip())
+    return float(content)
+
+
+def write_worker_times(filename, busy_times):
+    """Zapisuje czasy pracy workerów w sekundach, jeden w linii (odpowiednik writeWorkerTimes)."""
+    if filename:
+        with open(filename, 'w') as f:
+            for busy_time in busy_times:
+                f.write(f"{busy_time:g}\n")
+
+
+def read_worker_times(filename):
+    """
+    Wczytuje czasy pracy workerów zapisane przez write_worker_times lub serwer C++.
+
+    Zwraca listę czasów w sekundach (pustą, jeżeli plik nie istnieje).
+    """
+    if not filename or not os.path.exists(filename):
+        return []
+    with open(filename, 'r') as f:
+        return [float(line) for line in f if line.strip()]
+
+
+def worker_imbalance(busy_times):
+    """
+    Zwraca miarę nierównomierności podziału pracy: stosunek najdłuższego czasu pracy
+    workera do średniego (1.0 - idealny podział). Dla pustej listy zwraca None.
+    """
+    if not busy_times:
+        return None
+    mean = sum(busy_times) / len(busy_times)
+    return max(busy_times) / mean if mean > 0 else 1.0
+
+
+def write_error_estimate(filename, estimate):
+    """Zapisuje oszacowanie błędu względnego obliczeń (implementacja multipoint)."""
+    if filename:
+        with open(filename, 'w') as f:
+            f.write(f"{estimate:g}\n")
+
+
+def read_error_estimate(filename):
+    """Wczytuje oszacowanie błędu względnego. Zwraca None, jeżeli plik nie istnieje."""
+    if not filename or not os.path.exists(filename):
+        return None
+    with open(filename, 'r') as f:
+        content = f.read().strip()
+    return float(content) if content else None
+
+
+def write_progress(filename, progress):
+    """Zapisuje postęp obliczeń w procentach (odpowiednik writeProgress)."""
+    if filename:
+        with open(filename, 'w') as f:
+            f.write(f"{progress}\n")
+
+
+def _write_results(settings, results, dtype, start, end, step, progress_callback):
+    """Zapisuje gotowe wyniki (np. z aktualizacji przyrostowej) blokami conf.POINTS_CHUNK_SIZE."""
+    output = None
+    if settings['save_results']:
+        output = open_results_writer(settings['output_file'], settings['results_format'], dtype, start, end, step)
+    try:
+        for first in range(0, len(results), conf.POINTS_CHUNK_SIZE):
+            last = min(first + conf.POINTS_CHUNK_SIZE, len(results))
+            if output is not None:
+                output.write(results[first:last])
+            progress_callback((last * 100) // len(results))
+    finally:
+        if output is not None:
+            output.close()
+
+
+def _serve_cached_results(settings, cached, progress_callback):
+    """Zapisuje wyniki z wpisu pamięci podręcznej i artefakty zlecenia (czas obliczeń 0)."""
+    if settings['save_results']:
+        results_cache.copy_results(cached, settings['output_file'], settings['results_format'])
+    progress_callback(100)
+    write_computation_time(settings['computation_time_file'], 0.0)
+    write_worker_times(settings['worker_times_file'], [0.0])
+
+
+def server_cache_key(settings):
+    """
+    Zwraca klucz pamięci podręcznej wyników zlecenia serwera C++/ASM (albo lokalnego procesu,
+    który go zastępuje) lub None, gdy wyniki nie mogą być współdzielone (reuse_results=0,
+    tryb wsadowy). Serwer liczy zawsze w float32 schematem horner, blocked lub progression,
+    a implementacje i AVX różnią się zaokrągleniami, więc należą do klucza. Należy do niego
+    także format wyników - wyniki tekstowe serwera mają 6 cyfr znaczących i nie mogą zastąpić binarnych.
+    """
+    if not settings['reuse_results'] or settings['batch']:
+        return None
+    coefficients = read_coefficients(settings['input_coeffs_file'], np.float32)
+    start, end, step = read_points_range(settings['input_points_file'])
+    scheme = settings['scheme'] if settings['scheme'] in ('blocked', 'progression') else 'horner'
+    label = f"{settings['implementation']}{'-avx' if settings['avx'] else ''}-{scheme}-{settings['results_format']}"
+    return results_cache.cache_key(coefficients, start, end, step, np.float32, label, settings['derivatives'] + 1)
+
+
+def use_cached_results(settings, key, progress_callback=None):
+    """
+    Szuka wyników zlecenia serwera w pamięci podręcznej (klucz z server_cache_key). Przy trafieniu
+    kopiuje je do pliku wyników zlecenia, zapisuje czas obliczeń 0 i zwraca True - serwer
+    nie jest wtedy uruchamiany.
+    """
+    cached = results_cache.lookup(key)
+    if cached is None:
+        return False
+    if progress_callback is None:
+        progress_callback = lambda progress: write_progress(settings['progress_file'], progress)
+    _serve_cached_results(settings, cached, progress_callback)
+    return True
+
+
+def store_cached_results(settings, key):
+    """Zapisuje wyniki zakończonego zlecenia serwera (plik output_file) w pamięci podręcznej."""
+    start, end, step = read_points_range(settings['input_points_file'])
+    results = results_io.read_results(settings['output_file'])
+    columns = settings['derivatives'] + 1
+    if not results_cache.fits(len(results), np.float32, columns):
+        return
+    cache = results_cache.CacheWriter(key, np.float32, start, end, step, columns)
+    try:
+        for first in range(0, len(results), conf.POINTS_CHUNK_SIZE):
+            cache.write(results[first:first + conf.POINTS_CHUNK_SIZE])
+    except Exception:
+        cache.discard()
+        raise
+    cache.commit()
+
+
+def compute_polynomial(settings, progress_callback=None):
+    """
+    Wykonuje obliczenia dla podanych ustawień w bieżącym procesie - odpowiednik
+    computePolynomial z App/horner.cpp. Punkty są generowane i obliczane blokami
+    (conf.POINTS_CHUNK_SIZE), a wyniki strumieniowo dopisywane do pliku wyników,
+    więc zużycie pamięci nie zależy od długości zakresu. Przy włączonej wielowątkowości
+    większe bloki (gui/parallel.py: chunk_size) liczone są równolegle przez threads_number procesów.
+    Tworzy te same artefakty co serwer C++: plik z czasem obliczeń oraz (opcjonalnie)
+    plik wyników w formacie tekstowym lub binarnym (klucz results_format). Z kluczem derivatives = k
+    każdy punkt ma k + 1 kolumn wyników: wartość i k pierwszych pochodnych (horner_derivatives).
+    Dla implementacji numpy wyniki są zapamiętywane w pamięci podręcznej na dysku
+    (gui/results_cache.py, klucz reuse_results) i przy tych samych danych wejściowych kopiowane.
+    Zlecenia serwera C++/ASM korzystają z tej samej pamięci w JobScheduler (server_cache_key).
+
+    :param settings: Ustawienia wczytane przez read_config_file
+    :param progress_callback: Funkcja wywoływana z postępem w procentach
+                              (domyślnie postęp zapisywany jest do progress_file)
+    :return: Czas obliczeń w sekundach
+    """
+    # Implementacja multipoint liczy zawsze w precyzji float64
+    multipoint = settings['implementation'] == 'multipoint'
+    dtype = np.float64 if multipoint else get_dtype(settings['precision'])
+    get_kernel(settings['scheme'])  # Sprawdź schemat przed rozpoczęciem obliczeń
+
+    coefficients = read_coefficients(settings['input_coeffs_file'], dtype)
+    start, end, step = read_points_range(settings['input_points_file'])
+    grid = PointGrid(start, end, step)
+    total_points = len(grid)
+
+    # Pochodne liczone są jednym przejściem Hornera, niezależnie od schematu i implementacji
+    derivatives = settings['derivatives']
+
+    # Dla małych rozmiarów multipoint przechodzi na zwykły schemat (próg opłacalności)
+    use_multipoint = multipoint and not derivatives and should_use_multipoint(len(coefficients), total_points)
+    max_error = 0.0
+
+    # Wielomian rzadki liczony jest tylko po niezerowych wyrazach, gdy to tańsze od schematu Hornera
+    scheme = settings['scheme']
+    if scheme == 'horner' and not use_multipoint and not derivatives and should_use_sparse(
+            coefficients, is_sparse_format(settings['input_coeffs_file'])):
+        scheme = 'sparse'
+
+    if progress_callback is None:
+        progress_callback = lambda progress: write_progress(settings['progress_file'], progress)
+
+    # Wyniki tych samych danych wejściowych są kopiowane z pamięci podręcznej na dysku
+    # (gui/results_cache.py) bez obliczeń - czas obliczeń wynosi wtedy 0
+    cache_key = None
+    if settings['implementation'] == 'numpy' and settings['reuse_results']:
+        cache_key = results_cache.cache_key(coefficients, start, end, step, dtype, scheme, derivatives + 1)
+        cached = results_cache.lookup(cache_key)
+        if cached is not None:
+            _serve_cached_results(settings, cached, progress_callback)
+            return 0.0
+
+    # Po niewielkiej zmianie współczynników lub zakresu aktualizowane są zapamiętane wyniki
+    # poprzedniego obliczenia (gui/incremental.py) zamiast liczenia wszystkiego od nowa
+    reusable = incremental.is_eligible(settings, total_points)
+    if reusable:
+        update = incremental.try_update(coefficients, grid, dtype, get_kernel(scheme), scheme)
+        if update is not None:
+            results, computation_time = update
+            _write_results(settings, results, dtype, start, end, step, progress_callback)
+            if cache_key is not None and results_cache.fits(total_points, dtype):
+                cache = results_cache.CacheWriter(cache_key, dtype, start, end, step)
+                cache.write(results)
+                cache.commit()
+            write_computation_time(settings['computation_time_file'], computation_time)
+            write_worker_times(settings['worker_times_file'], [computation_time])
+            return computation_time
+    collected = [] if reusable else None
+
+    evaluator = None
+    chunk_points = conf.POINTS_CHUNK_SIZE
+    # multipoint korzysta z wielowątkowego BLAS, bez puli procesów
+    if settings['multithreading'] and settings['threads_number'] > 1 and not use_multipoint and not derivatives:
+        from gui.parallel import ParallelEvaluator, chunk_size
+        # Pula dostaje po wiele kafelków na workera w jednym wywołaniu
+        chunk_points = chunk_size(settings['threads_number'])
+        evaluator = ParallelEvaluator(
+            coefficients, settings['threads_number'], min(chunk_points, total_points), dtype, scheme
+        )
+
+    output = None
+    if settings['save_results']:
+        output = open_results_writer(
+            settings['output_file'], settings['results_format'], dtype, start, end, step, columns=derivatives + 1
+        )
+    cache = None
+    if cache_key is not None and results_cache.fits(total_points, dtype, derivatives + 1):
+        cache = results_cache.CacheWriter(cache_key, dtype, start, end, step, derivatives + 1)
+    completed = False
+    try:
+        computation_time = 0.0
+        evaluate = None
+        if use_multipoint:
+            evaluate = lambda points: evaluate_multipoint(coefficients, points)
+        if derivatives:
+            evaluate = lambda points: horner_derivatives(coefficients, points, derivatives, dtype)
+        chunks = evaluate_chunks(coefficients, grid, chunk_points, dtype, evaluate, scheme, evaluator)
+        for first, last, results, chunk_time in chunks:
+            # Mierzymy tylko czas obliczeń, bez generowania punktów i zapisu wyników
+            computation_time += chunk_time
+
+            if multipoint:
+                # Oszacowanie błędu w próbce punktów bloku (poza pomiarem czasu)
+                sample = slice(None, None, max(1, (last - first) // conf.MULTIPOINT_ERROR_SAMPLES))
+                values = results[:, 0] if derivatives else results
+                points = grid.at(np.arange(first, last)[sample], dtype)
+                estimate = error_estimate(coefficients, points, values[sample], horner=not use_multipoint)
+                if estimate is not None:
+                    max_error = max(max_error, estimate)
+
+            if output is not None:
+                output.write(results)
+            if cache is not None:
+                cache.write(results)
+            if collected is not None:
+                collected.append(results)
+
+            progress_callback((last * 100) // total_points)
+        completed = True
+    finally:
+        if output is not None:
+            output.close()
+        if cache is not None:
+            if completed:
+                cache.commit()
+            else:
+                cache.discard()
+        if evaluator is not None:
+            evaluator_busy_times = evaluator.worker_busy_times()
+            evaluator.close()
+
+    if collected is not None:
+        incremental.remember(coefficients, start, step, np.concatenate(collected), scheme)
+
+    write_computation_time(settings['computation_time_file'], computation_time)
+    busy_times = evaluator_busy_times if evaluator is not None else [computation_time]
+    write_worker_times(settings['worker_times_file'], busy_times)
+    if multipoint:
+        write_error_estimate(settings['error_estimate_file'], max_error)
+
+    return computation_time
+
+
+def compute_batch(settings, progress_callback=None):
+    """
+    Tryb wsadowy: oblicza wartości wielu wielomianów (katalog plików .coeffs lub plik
+    wielokolumnowy, patrz gui/batch.py) na jednej siatce punktów w jednym przejściu.
+    Punkty każdego bloku są generowane raz dla wszystkich wielomianów, a wyniki zapisywane
+    są zawsze w formacie binarnym jako macierz (punkty x wielomiany) - kolumny w kolejności
+    nazw plików katalogu lub kolumn pliku. Obliczenia są jednowątkowe (multithreading
+    i threads_number nie mają wpływu na tryb wsadowy).
+
+    :param settings: Ustawienia wczytane przez read_config_file
+    :param progress_callback: Funkcja wywoływana z postępem w procentach
+    :return: Czas obliczeń w sekundach
+    """
+    # Implementacja multipoint liczy zawsze w precyzji float64
+    dtype = np.float64 if settings['implementation'] == 'multipoint' else get_dtype(settings['precision'])
+    if settings['derivatives']:
+        raise ValueError("Derivatives are not supported in batch mode")
+    matrix = load_coefficients_batch(settings['input_coeffs_file'], dtype)
+    start, end, step = read_points_range(settings['input_points_file'])
+    grid = PointGrid(start, end, step)
+
+    if progress_callback is None:
+        progress_callback = lambda progress: write_progress(settings['progress_file'], progress)
+
+    # Horner po wierszach macierzy w bieżącym procesie - tryb wsadowy nie korzysta z puli procesów
+    # ani z threads_number (ustawienia wielowątkowości są tu ignorowane)
+    evaluator = BatchEvaluator(matrix, dtype)
+
+    output = None
+    if settings['save_results']:
+        output = open_results_writer(
+            settings['output_file'], 'binary', dtype, start, end, step, columns=evaluator.num_polynomials
+        )
+    try:
+        computation_time = 0.0
+        chunk_size = batch_chunk_size(evaluator.num_polynomials)
+        for first, last, results, chunk_time in evaluate_chunks(matrix, grid, chunk_size, dtype, evaluator.evaluate):
+            computation_time += chunk_time
+            if output is not None:
+                output.write(results)
+
+            progress_callback((last * 100) // len(grid))
+    finally:
+        if output is not None:
+            output.close()
+
+    write_computation_time(settings['computation_time_file'], computation_time)
+    write_worker_times(settings['worker_times_file'], [computation_time])
+    return computation_time
+
+
+def compute_from_config(filename=conf.CONFIG_FILE, progress_callback=None):
+    """
+    Wczytuje config.ini i wykonuje obliczenia silnikiem NumPy.
+
+    Zwraca czas obliczeń w sekundach.
+    """
+    if not os.path.exists(conf.TEMP_DIR):
+        os.makedirs(conf.TEMP_DIR)
+
+    settings = read_config_file(filename)
+    if settings['batch']:
+        return compute_batch(settings, progress_callback)
+    return compute_polynomial(settings, progress_callback)
@@ -1,14 +1,28 @@
 import os
 import time
-import win32event
-import win32api
-import win32con
-from tkinter import messagebox
+import signal
+import shutil
+import multiprocessing
+
+# pywin32 jest dostępny tylko na Windows - bez niego działa wyłącznie lokalny worker
+try:
+    import win32event
+    import win32api
+    import win32con
+except ImportError:
+    win32event = None
 
 import gui.config as conf
+from gui.engine import compute_from_config, read_config_file, read_computation_time
 from gui.file_utils import read_results_and_display
 
 
+# Typy komunikatów przesyłanych przez transport: (typ, wartość)
+MSG_PROGRESS = 'progress'   # wartość: postęp w procentach
+MSG_DONE = 'done'           # wartość: czas obliczeń w sekundach
+MSG_ERROR = 'error'         # wartość: opis błędu
+
+
 def trigger_event(event_name):
     hEvent = win32event.OpenEvent(win32con.EVENT_MODIFY_STATE, False, event_name)
     if not hEvent:
@@ -17,42 +31,246 @@ def trigger_event(event_name):
     win32api.CloseHandle(hEvent)
 
 
-def monitor_progress_and_completion(app):
-    try:
-        progress_file = os.path.abspath(conf.PROGRESS_FILE)
+class Transport(object):
+    """
+    Kanał komunikacji między GUI a procesem wykonującym obliczenia.
+    Zlecenie wskazuje plik config.ini, a zwrotnie przesyłane są komunikaty
+    (MSG_PROGRESS, postęp), (MSG_DONE, czas) lub (MSG_ERROR, opis).
+    """
+    def submit(self, config_file):
+        """Zleca obliczenia dla podanego pliku konfiguracyjnego."""
+        raise NotImplementedError
+
+    def poll(self, timeout):
+        """Czeka co najwyżej timeout sekund na komunikat. Zwraca komunikat lub None."""
+        raise NotImplementedError
+
+    def reset(self):
+        """Porzuca bieżące zlecenie (np. po przekroczeniu czasu), aby transport był gotowy na kolejne."""
+        pass
 
-        # Otwórz zdarzenie zakończenia
-        hCompletionEvent = win32event.OpenEvent(win32con.SYNCHRONIZE, False, conf.COMPLETION_EVENT_NAME)
-        if not hCompletionEvent:
+    def close(self):
+        """Zwalnia zasoby transportu."""
+        pass
+
+
+class Win32EventTransport(Transport):
+    """
+    Transport do serwera App (Windows): zdarzenia systemowe EVENT_NAME/COMPLETION_EVENT_NAME
+    oraz pliki postępu i czasu obliczeń wskazane w config.ini zlecenia.
+    Serwer czyta zawsze conf.CONFIG_FILE, więc config zlecenia jest tam kopiowany.
+    """
+    def __init__(self):
+        self.hCompletionEvent = None
+        self.last_progress = None
+        self.progress_file = conf.PROGRESS_FILE
+        self.computation_time_file = conf.COMPUTATION_TIME_FILE
+
+    def submit(self, config_file):
+        settings = read_config_file(config_file)
+        self.progress_file = settings['progress_file']
+        self.computation_time_file = settings['computation_time_file']
+        if os.path.abspath(config_file) != os.path.abspath(conf.CONFIG_FILE):
+            shutil.copyfile(config_file, conf.CONFIG_FILE)
+
+        # Otwórz zdarzenie zakończenia przed wyzwoleniem obliczeń, aby nie przegapić sygnału
+        self.hCompletionEvent = win32event.OpenEvent(win32con.SYNCHRONIZE, False, conf.COMPLETION_EVENT_NAME)
+        if not self.hCompletionEvent:
             raise Exception("Failed to open completion event.")
+        self.last_progress = None
+        # Plik czasu obliczeń poprzedniego zlecenia nie może zostać odczytany jako wynik tego zlecenia
+        if os.path.exists(self.computation_time_file):
+            os.remove(self.computation_time_file)
+        trigger_event(conf.EVENT_NAME)
+
+    def poll(self, timeout):
+        result = win32event.WaitForSingleObject(self.hCompletionEvent, int(timeout * 1000))
+        if result == win32con.WAIT_OBJECT_0:
+            win32api.CloseHandle(self.hCompletionEvent)
+            self.hCompletionEvent = None
+            # Po błędzie serwer zapisuje znacznik zamiast czasu (lub nie zapisuje pliku wcale)
+            try:
+                return MSG_DONE, read_computation_time(self.computation_time_file)
+            except (OSError, ValueError) as e:
+                return MSG_ERROR, f"Server computation failed: {e}"
+
+        # Odczytaj postęp
+        if os.path.exists(self.progress_file):
+            with open(self.progress_file, 'r') as f:
+                progress = f.read().strip()
+            if progress and progress != self.last_progress:
+                self.last_progress = progress
+                return MSG_PROGRESS, int(progress)
+        return None
+
+    def reset(self):
+        self.close()
+
+    def close(self):
+        if self.hCompletionEvent:
+            win32api.CloseHandle(self.hCompletionEvent)
+            self.hCompletionEvent = None
+
+
+def _local_worker(conn):
+    """
+    Pętla lokalnego procesu obliczeniowego zastępującego serwer App: odbiera zlecenia
+    przez potok i liczy je silnikiem NumPy, odsyłając postęp i wynik jako komunikaty.
+    Ctrl+C jest ignorowany - proces kończy GUI lub CLI (polecenie 'stop' albo terminate).
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            command, config_file = conn.recv()
+        except EOFError:
+            break  # Proces GUI zakończył działanie
+        if command == 'stop':
+            break
+        try:
+            computation_time = compute_from_config(
+                config_file,
+                progress_callback=lambda progress: conn.send((MSG_PROGRESS, progress))
+            )
+            conn.send((MSG_DONE, computation_time))
+        except Exception as e:
+            conn.send((MSG_ERROR, str(e)))
+    conn.close()
+
+    # Proces multiprocessing kończy się bez funkcji atexit - pulę workerów (gui/parallel.py)
+    # trzeba zamknąć jawnie, inaczej jej procesy zostają osierocone
+    from gui.parallel import shutdown_worker_pool
+    shutdown_worker_pool()
+
+
+class LocalWorkerTransport(Transport):
+    """
+    Przenośny transport (multiprocessing.Pipe) do lokalnego procesu obliczeniowego.
+    Nie wymaga Windows ani serwera App.
+    """
+    def __init__(self):
+        self._start()
+
+    def _start(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        # Nie jako daemon - worker tworzy własną pulę procesów (gui/parallel.py)
+        self.process = multiprocessing.Process(target=_local_worker, args=(child_conn,))
+        self.process.start()
+        child_conn.close()
+
+    def submit(self, config_file):
+        self.conn.send(('submit', os.path.abspath(config_file)))
 
+    def poll(self, timeout):
+        if self.conn.poll(timeout):
+            return self.conn.recv()
+        return None
+
+    def reset(self):
+        # Proces może wciąż liczyć porzucone zlecenie - zastąp go nowym
+        self.process.terminate()
+        self.process.join(timeout=1)
+        self.conn.close()
+        self._start()
+
+    def close(self):
+        if self.process.is_alive():
+            self.conn.send(('stop', None))
+            self.process.join(timeout=1)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.conn.close()
+
+
+def _server_available():
+    """Sprawdza, czy serwer App działa (czy istnieje jego zdarzenie systemowe)."""
+    if win32event is None:
+        return False
+    try:
+        hEvent = win32event.OpenEvent(win32con.EVENT_MODIFY_STATE, False, conf.EVENT_NAME)
+    except Exception:
+        return False
+    if not hEvent:
+        return False
+    win32api.CloseHandle(hEvent)
+    return True
+
+
+def resolve_backend(backend=None):
+    """
+    Zwraca backend obliczeń wybrany przez conf.IPC_BACKEND:
+      - 'win32' - serwer App przez zdarzenia systemowe Windows,
+      - 'local' - lokalny proces obliczeniowy (silnik NumPy),
+      - 'auto'  - 'win32', jeżeli serwer App działa, w przeciwnym razie 'local'.
+    """
+    if backend is None:
+        backend = conf.IPC_BACKEND
+    if backend == 'auto':
+        backend = 'win32' if _server_available() else 'local'
+    if backend not in ('win32', 'local'):
+        raise ValueError(f"Unsupported IPC backend: {backend}")
+    return backend
+
+
+def create_transport(backend):
+    """Tworzy nowy transport dla backendu zwróconego przez resolve_backend."""
+    if backend == 'win32':
+        return Win32EventTransport()
+    return LocalWorkerTransport()
+
+
+def wait_for_completion(transport, timeout=conf.TIMEOUT_SECONDS, on_progress=None):
+    """
+    Czeka na zakończenie zleconych obliczeń.
+
+    :param transport: Transport, przez który zlecono obliczenia
+    :param timeout: Maksymalny czas oczekiwania w sekundach
+    :param on_progress: Opcjonalna funkcja wywoływana z postępem w procentach
+    :return: Czas obliczeń w sekundach
+    """
+    deadline = time.time() + timeout
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise TimeoutError("Computation did not finish in time.")
+
+        message = transport.poll(min(remaining, conf.POLL_INTERVAL))
+        if message is None:
+            continue
+
+        kind, value = message
+        if kind == MSG_DONE:
+            return value
+        if kind == MSG_ERROR:
+            raise Exception(value)
+        if kind == MSG_PROGRESS and on_progress is not None:
+            on_progress(value)
+
+
+def monitor_progress_and_completion(app, job):
+    from tkinter import messagebox  # Tylko GUI - moduł działa też bez Tk (python -m gui.experiment)
+    try:
         # Reset paska postępu
         app.progress['value'] = 0
+        last_progress = None
 
         while app.is_running:
-            # Sprawdź, czy obliczenia zostały zakończone
-            result = win32event.WaitForSingleObject(hCompletionEvent, 100)  # Timeout ustawiony na 100 ms
-            if result == win32con.WAIT_OBJECT_0:
+            if job.wait(conf.POLL_INTERVAL):
+                if job.error is not None:
+                    raise Exception(job.error)
                 # Obliczenia zakończone
                 app.master.after(0, app.status_label.config, {"text": "Computation Complete."})
                 break  # Przerwij pętlę po wykryciu zakończenia
 
-            # Odczytaj postęp
-            if os.path.exists(progress_file):
-                with open(progress_file, 'r') as f:
-                    progress = f.read().strip()
-                    if progress:
-                        progress = int(progress)
-                        app.master.after(0, lambda: app.progress.config(value=progress))
-                        app.master.after(0, app.status_label.config, {"text": f"Computing... {progress}%"})
-
-            time.sleep(0.1)
-
-        win32api.CloseHandle(hCompletionEvent)
+            progress = job.progress
+            if progress != last_progress:
+                last_progress = progress
+                app.master.after(0, lambda value=progress: app.progress.config(value=value))
+                app.master.after(0, app.status_label.config, {"text": f"Computing... {progress}%"})
 
         if app.is_running:
             # Odczytaj czas obliczeń i wyniki tylko jeśli aplikacja nadal działa
-            read_results_and_display(app)
+            read_results_and_display(app, job.computation_time_file, job.error_estimate_file)
 
     except Exception as e:
         if app.is_running:
@@ -60,10 +278,14 @@ def monitor_progress_and_completion(app):
             app.compute_button.config(state='normal')
             app.status_label.config(text="Error")
             app.progress.stop()
+    finally:
+        # Katalog zlecenia usuwany jest także po błędzie lub zamknięciu okna
+        if job.wait(0):
+            job.cleanup()
 
 
 def on_closing(self):
     self.is_running = False  # Ustaw flagę na False
     self.master.destroy()
     if hasattr(self, 'monitor_thread') and self.monitor_thread.is_alive():
-        self.monitor_thread.join(timeout=1)
\ No newline at end of file
+        self.monitor_thread.join(timeout=1)
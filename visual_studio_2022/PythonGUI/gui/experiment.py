@@ -1,256 +1,674 @@
 import os
 import csv
+import sys
+import json
 import time
+import hashlib
+import argparse
+import platform
 
-from tkinter import messagebox
+import numpy as np
 
-from gui.config import (
-    TEMP_DIR,
-    COMPUTATION_TIME_FILE,
-    TIMEOUT_SECONDS,
-    EVENT_NAME
-)
-from gui.events import trigger_event
-from gui.file_utils import (
-    generate_coefficients_file,
-    generate_points_file,
-    write_config_file
+from gui.stats import relative_ci_width, summarize
+from gui.file_utils import _generate_coefficients, _generate_points
+from gui.engine import read_worker_times, worker_imbalance
+from gui.jobs import create_job, run_job_in_process, get_scheduler, ENGINE_IMPLEMENTATIONS
+from gui.experiment_spec import (
+    DEFAULT_SPEC_FILE,
+    load_spec,
+    validate_spec,
+    expand_matrix,
+    parse_shard,
+    parse_threads,
+    select_shard,
+    spec_digest,
 )
 
 
-def show_experiment_info():
+# Nazwa pliku CSV z wynikami
+CSV_FILENAME = "experiment_results.csv"
+
+FIELDNAMES = ["scenario", "implementation", "avx", "threads", "run_number", "input_hash", "time_seconds", "imbalance"]
+# Kolumny identyfikujące uruchomienie - przy wznowieniu pomijane są uruchomienia już zapisane w CSV
+FINGERPRINT_FIELDS = ["scenario", "implementation", "avx", "threads", "run_number", "input_hash"]
+# Plik scalony (merge_results) ma dodatkowo część i maszynę, na której wykonano uruchomienie
+MERGED_FIELDNAMES = FIELDNAMES + ["shard", "host"]
+# Kolumny podsumowania (summarize_results) - jeden wiersz na konfigurację
+SUMMARY_FIELDNAMES = ["scenario", "implementation", "avx", "threads", "input_hash", "samples", "failed",
+                      "median", "p95", "mean", "stddev", "ci_low", "ci_high", "ci_rel_width", "outliers", "converged"]
+
+# Kody wyjścia python -m gui.experiment
+EXIT_OK = 0
+EXIT_RUN_FAILED = 1  # Część uruchomień nie powiodła się albo brakuje części przy scalaniu
+EXIT_USAGE = 2  # Błędne argumenty (kod argparse) lub niepoprawna specyfikacja/pliki
+EXIT_INTERRUPTED = 130  # Przerwano (Ctrl+C)
+
+
+def metadata_filename(csv_filename):
+    """Plik metadanych (maszyna, część, specyfikacja) zapisywany obok pliku CSV wyników."""
+    return csv_filename + ".meta.json"
+
+
+def host_metadata():
+    """Opis maszyny wykonującej pomiary."""
+    return {
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def summary_filename(csv_filename):
+    """Plik podsumowania (statystyki każdej konfiguracji) zapisywany obok pliku CSV wyników."""
+    return os.path.splitext(csv_filename)[0] + ".summary.csv"
+
+
+def _write_metadata(csv_filename, metadata):
+    # Zapis przez plik tymczasowy - przerwanie nie zostawia uszkodzonych metadanych
+    filename = metadata_filename(csv_filename)
+    with open(filename + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(filename + ".tmp", filename)
+
+
+def _read_metadata(csv_filename):
+    try:
+        with open(metadata_filename(csv_filename), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def input_hash(coefficients_file, points_file):
+    """Skrót zawartości plików wejściowych scenariusza (część identyfikatora uruchomienia)."""
+    digest = hashlib.sha256()
+    for filename in (coefficients_file, points_file):
+        with open(filename, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def fingerprint(row):
+    """Identyfikator uruchomienia: scenariusz, implementacja, AVX, wątki, numer uruchomienia i skrót danych."""
+    return tuple(str(row[field]) for field in FINGERPRINT_FIELDS)
+
+
+def _load_completed_runs(csv_filename):
     """
-    Wyświetla w okienku informacyjnym opis eksperymentu:
-    - 3 scenariusze (n=10/100/1000, różne kroki),
-    - implementacja: {cpp, asm},
-    - AVX: {False, True},
-    - multithreading: zawsze True, ale threads=1..16,
-    - 10 uruchomień każdej konfiguracji,
-    - brak progress.tmp (nie śledzimy postępu w jednym uruchomieniu),
-    - brak zapisu wyników, brak generowania wykresu,
-    - odczytujemy finalny czas z computation.time.
+    Wczytuje uruchomienia zapisane w CSV przerwanego eksperymentu.
+    Niepełna ostatnia linia (przerwany zapis) jest obcinana, aby kolejne wiersze
+    dopisywane były od początku linii.
+
+    :return: Słownik fingerprint -> wiersz
     """
-    info_text = (
-        "EXPERIMENT DESCRIPTION:\n\n"
-        "We run 5 scenarios:\n"
-        " 1) Scenario 1:\n"
-        "    Coefficients: n=10,   min=-1, max=1\n"
-        "    Points: min=-100, max=100, step=0.001\n\n"
-        " 2) Scenario 2:\n"
-        "    Coefficients: n=100,  min=-1, max=1\n"
-        "    Points: min=-100, max=100, step=0.001\n\n"
-        " 3) Scenario 3:\n"
-        "    Coefficients: n=1000, min=-1, max=1\n"
-        "    Points: min=-100, max=100, step=0.001\n\n"
-        " 4) Scenario 4:\n"
-        "    Coefficients: n=10000, min=-1, max=1\n"
-        "    Points: min=-100, max=100, step=0.001\n\n"
-        " 5) Scenario 5:\n"
-        "    Coefficients: n=10000, min=-1, max=1\n"
-        "    Points: min=-100, max=100, step=0.001\n\n"
+    with open(csv_filename, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            f.truncate(end)
+
+    completed = {}
+    with open(csv_filename, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != FIELDNAMES:
+            raise ValueError(f"Unexpected columns in {csv_filename} - cannot resume, start a fresh experiment")
+        for row in reader:
+            if None not in row.values():
+                completed[fingerprint(row)] = row
+    return completed
+
+
+def describe_spec(spec):
+    """Zwraca opis macierzy eksperymentu (okno Experiment Info)."""
+    lines = [f"EXPERIMENT DESCRIPTION:\n\nWe run {len(spec['scenarios'])} scenarios:"]
+    for i, scenario in enumerate(spec['scenarios'], 1):
+        lines.append(
+            f" {i}) {scenario['name']}:\n"
+            f"    Coefficients: n={scenario['coeff_n']}, min={scenario['coeff_min']}, max={scenario['coeff_max']}\n"
+            f"    Points: min={scenario['points_min']}, max={scenario['points_max']}, step={scenario['points_step']}\n"
+        )
+    threads = spec['threads']
+    if threads == list(range(threads[0], threads[-1] + 1)):
+        threads_text = f"{threads[0]}..{threads[-1]}"
+    else:
+        threads_text = ", ".join(map(str, threads))
+    lines.append(
         "For each scenario, we test:\n"
-        " - Implementation: {cpp, asm}\n"
-        " - AVX: {False, True}\n"
-        " - Multithreading: always True, Number of Threads=1..16,\n"
-        "We run each config 5 times.\n\n"
+        f" - Implementation: {{{', '.join(spec['implementations'])}}}\n"
+        f" - AVX: {{{', '.join(map(str, spec['avx']))}}}\n"
+        f" - Multithreading: always True, Number of Threads={threads_text}\n"
+    )
+    if spec['include'] or spec['exclude']:
+        lines.append(f"Include rules: {len(spec['include'])}, exclude rules: {len(spec['exclude'])} "
+                     f"({len(expand_matrix(spec))} configurations).\n")
+    if spec['warmup']:
+        lines.append(f"Each config starts with {spec['warmup']} warm-up run(s) that are not recorded.")
+    if spec['ci_target'] is not None and spec['max_runs'] > spec['runs']:
+        lines.append(
+            f"We run each config {spec['runs']} to {spec['max_runs']} times - until the "
+            f"{spec['confidence']:.0%} confidence interval of the median time\n"
+            f"is narrower than {spec['ci_target']:.1%} of the median.\n"
+        )
+    else:
+        lines.append(f"We run each config {spec['runs']} times.\n")
+    lines.append(
+        "Coefficients are generated with a fixed seed per scenario, so inputs are reproducible.\n"
         "No polynomial results are saved, no chart is generated.\n"
-        "All execution times in seconds are saved in 'experiment_results.csv'.\n"
+        f"All execution times in seconds are saved in '{CSV_FILENAME}',\n"
+        "together with the load imbalance (slowest thread / average thread busy time).\n"
+        f"Median, p95, standard deviation, confidence interval and outliers of each config\n"
+        f"are saved in '{summary_filename(CSV_FILENAME)}'.\n"
+        f"The matrix is defined in {os.path.basename(DEFAULT_SPEC_FILE)}."
     )
+    return "\n".join(lines)
+
+
+def show_experiment_info():
+    """
+    Wyświetla w okienku informacyjnym opis eksperymentu na podstawie specyfikacji
+    (experiment.json): scenariusze, implementacje, AVX, liczby wątków i liczba uruchomień.
+    """
+    from tkinter import messagebox
+    try:
+        info_text = describe_spec(load_spec())
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Experiment Info", f"Failed to load experiment spec: {e}")
+        return
     messagebox.showinfo("Experiment Info", info_text)
 
 
-def run_experiment(app):
+def run_scenarios(csv_filename=CSV_FILENAME, spec=None, shard=(1, 1), progress_callback=None, resume=True):
     """
-    Uruchamia eksperyment iteracyjnie - 
-    1) Generuje pliki współczynników i punktów,
-    2) Zapisuje config.ini,
-    3) trigger_event(EVENT_NAME),
-    4) czeka na pojawienie się computation.time,
-    5) odczytuje i zapisuje w pliku CSV.
-    
-    Brak użycia progress.tmp. Postęp wypisujemy w GUI (status_label).
+    Wykonuje macierz uruchomień eksperymentu bez GUI (bez obiektów Tk):
+    1) Generuje pliki współczynników i punktów każdego scenariusza,
+    2) Tworzy zlecenie z własnym config.ini (create_job),
+    3) przekazuje je do kolejki zleceń (get_scheduler) albo liczy silnikiem NumPy w tym procesie,
+    4) czeka na zakończenie zlecenia i odczytuje czas obliczeń,
+    5) dopisuje wiersz do pliku CSV i wymusza jego zapis na dysk (fsync).
+    Obok pliku CSV zapisywane są metadane (metadata_filename) potrzebne do scalenia części
+    oraz, po zakończeniu, podsumowanie statystyk konfiguracji (summarize_results).
+
+    Każdą konfigurację poprzedza spec['warmup'] uruchomień rozgrzewkowych (niezapisywanych).
+    Po spec['runs'] pomiarach kolejne są wykonywane, dopóki względna szerokość przedziału
+    ufności mediany przekracza spec['ci_target'] - najwyżej do spec['max_runs'] pomiarów.
+    Konfiguracja z nieudanym uruchomieniem nie jest powtarzana ponad spec['runs'].
+
+    Jeżeli metadane wskazują niezakończony eksperyment z tą samą specyfikacją i częścią,
+    jest on wznawiany: uruchomienia, których identyfikator (fingerprint) jest już w CSV,
+    są pomijane (ich czasy wchodzą do statystyk). Zakończony eksperyment (lub resume=False)
+    zaczynany jest od nowa.
+
+    :param spec: Specyfikacja eksperymentu (gui/experiment_spec.py), domyślnie experiment.json
+    :param shard: Krotka (i, N) - wykonywana jest tylko i-ta z N części macierzy (select_shard)
+    :param progress_callback: Funkcja progress_callback(done, total, row) wywoływana
+                              po każdym uruchomieniu (row - wiersz zapisany do CSV); total
+                              rośnie, gdy konfiguracja wymaga dodatkowych pomiarów
+    :param resume: Czy wznawiać przerwany eksperyment
+    :return: Krotka (liczba uruchomień, liczba nieudanych uruchomień), łącznie z wcześniej zapisanymi
     """
+    spec = load_spec() if spec is None else spec
+    configurations = select_shard(expand_matrix(spec), *shard)
+
+    # Kolejka zleceń (serwer App lub lokalne workery) - tylko dla implementacji C++/ASM
+    scheduler = None
+
+    def execute(impl, avx, threads, coefficients_file, points_file):
+        """Wykonuje jedno uruchomienie, zwraca (czas lub -1 przy błędzie, niezrównoważenie lub None)."""
+        nonlocal scheduler
+        # --- Tworzymy zlecenie (własny katalog i config.ini) ---
+        job = create_job(
+            impl,                       # implementation
+            True,                       # use_multithreading
+            threads,                    # threads_number
+            avx,                        # use_avx
+            False,                      # save_results
+            False,                      # generate_chart
+            "",                         # output_file (pusty)
+            coefficients_file,
+            points_file,
+            reuse_results=False         # pomiar czasu - zawsze pełne obliczenia
+        )
+
+        if impl in ENGINE_IMPLEMENTATIONS:
+            # Silnik NumPy liczy w tym procesie - bez kolejki i workerów
+            try:
+                time_elapsed = run_job_in_process(job)
+            except Exception:
+                time_elapsed = -1
+        else:
+            # Zlecamy obliczenia (serwer C++/ASM lub lokalny proces)
+            # i czekamy na zakończenie (timeout obsługuje scheduler)
+            if scheduler is None:
+                scheduler = get_scheduler()
+            scheduler.submit(job)
+            job.wait()
+            time_elapsed = job.computation_time if job.error is None else -1  # -1: błąd lub timeout
+        # Stosunek najdłuższego czasu pracy wątku do średniego (1.0 - równy podział)
+        imbalance = worker_imbalance(read_worker_times(job.worker_times_file))
+        job.cleanup()
+        return time_elapsed, imbalance
+
+    runs_per_config = spec['runs']
+    # Liczba uruchomień do wykonania - zwiększana o każdy dodatkowy pomiar ponad spec['runs']
+    total_runs = len(configurations) * runs_per_config
+    digest = spec_digest(spec)
+    shard_text = f"{shard[0]}/{shard[1]}"
+
+    # Wznowienie przerwanego eksperymentu (ta sama specyfikacja i część)
+    completed = {}
+    previous = _read_metadata(csv_filename) if resume and os.path.exists(csv_filename) else None
+    if previous is not None and previous.get("finished") is None:
+        if previous.get("spec_digest") != digest or previous.get("shard") != shard_text:
+            raise ValueError(f"{csv_filename} holds an unfinished experiment with a different spec or shard - "
+                             "start a fresh experiment or use another output file")
+        completed = _load_completed_runs(csv_filename)
+
+    metadata = host_metadata()
+    metadata.update({
+        "spec_digest": digest,
+        "shard": shard_text,
+        "runs": total_runs,
+        "confidence": spec['confidence'],
+        "ci_target": spec['ci_target'],
+        "started": previous["started"] if completed else time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "resumed": previous.get("resumed", 0) + 1 if completed else 0,
+        "finished": None,
+    })
+    _write_metadata(csv_filename, metadata)
 
-    # Nazwa pliku CSV z wynikami
-    csv_filename = "experiment_results.csv"
-
-    # Definicja scenariuszy
-    scenarios = [
-        {
-            "name": "Scenario1",
-            "coeff_n": 10,
-            "coeff_min": -1,
-            "coeff_max": 1,
-            "points_min": -100,
-            "points_max": 100,
-            "points_step": 0.001
-        },
-        {
-            "name": "Scenario2",
-            "coeff_n": 100,
-            "coeff_min": -1,
-            "coeff_max": 1,
-            "points_min": -100,
-            "points_max": 100,
-            "points_step": 0.001
-        },
-        {
-            "name": "Scenario3",
-            "coeff_n": 1000,
-            "coeff_min": -1,
-            "coeff_max": 1,
-            "points_min": -100,
-            "points_max": 100,
-            "points_step": 0.001
-        },
-        {
-            "name": "Scenario4",
-            "coeff_n": 10000,
-            "coeff_min": -1,
-            "coeff_max": 1,
-            "points_min": -100,
-            "points_max": 100,
-            "points_step": 0.001
-        },
-        {
-            "name": "Scenario5",
-            "coeff_n": 100000,
-            "coeff_min": -1,
-            "coeff_max": 1,
-            "points_min": -100,
-            "points_max": 100,
-            "points_step": 0.001
-        }
-    ]
-
-    implementations = ["cpp", "asm"]
-    avx_options = [False, True]
-
-    runs_per_config = 5
-    threads_range = range(1, 17)  # 1..16
-
-    # Obliczamy liczbę wszystkich uruchomień
-    total_runs = len(scenarios) * len(implementations) * len(avx_options) * len(threads_range) * runs_per_config
     done = 0  # liczba zakończonych uruchomień
+    failed = 0
+
+    # Nowy eksperyment zaczyna plik od nagłówka, wznawiany dopisuje kolejne wiersze
+    with open(csv_filename, mode="a" if completed else "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        if not completed:
+            writer.writeheader()
+
+        current_scenario = None
+        for configuration in configurations:
+            scenario = configuration.scenario
+            if scenario is not current_scenario:
+                # Generujemy pliki wejściowe (bez okien) - konfiguracje są uporządkowane scenariuszami
+                coefficients_file = _generate_coefficients(
+                    scenario["coeff_n"], scenario["coeff_min"], scenario["coeff_max"], scenario["seed"]
+                )
+                points_file = _generate_points(scenario["points_min"], scenario["points_max"], scenario["points_step"])
+                inputs = input_hash(coefficients_file, points_file)
+                current_scenario = scenario
+
+            impl, avx, threads = configuration.implementation, configuration.avx, configuration.threads
+            samples = []  # czasy udanych pomiarów tej konfiguracji
+            config_failed = False
+            warmed_up = False
+            run_idx = 0
+            while True:
+                run_idx += 1
+                if run_idx > runs_per_config:
+                    total_runs += 1  # pomiar dodatkowy (przedział ufności wciąż za szeroki)
+
+                key = fingerprint({
+                    "scenario": scenario["name"], "implementation": impl, "avx": avx,
+                    "threads": threads, "run_number": run_idx, "input_hash": inputs
+                })
+                if key in completed:
+                    # Uruchomienie zapisane przed przerwaniem
+                    time_elapsed = float(completed[key]["time_seconds"])
+                else:
+                    if not warmed_up:
+                        # Rozgrzewka (pamięć podręczna, zegar procesora, start workerów) - czasy pomijamy
+                        for _ in range(spec['warmup']):
+                            execute(impl, avx, threads, coefficients_file, points_file)
+                        warmed_up = True
+
+                    time_elapsed, imbalance = execute(impl, avx, threads, coefficients_file, points_file)
+                    row = {
+                        "scenario": scenario["name"],
+                        "implementation": impl,
+                        "avx": avx,
+                        "threads": threads,
+                        "run_number": run_idx,
+                        "input_hash": inputs,
+                        "time_seconds": time_elapsed,
+                        "imbalance": "" if imbalance is None else f"{imbalance:.3f}"
+                    }
+                    writer.writerow(row)
+                    # Wiersz trafia na dysk od razu - przerwanie nie traci zakończonych uruchomień
+                    csvfile.flush()
+                    os.fsync(csvfile.fileno())
+
+                done += 1
+                if time_elapsed < 0:
+                    failed += 1
+                    config_failed = True
+                else:
+                    samples.append(time_elapsed)
+                if key not in completed and progress_callback is not None:
+                    progress_callback(done, total_runs, row)
+
+                if run_idx < runs_per_config:
+                    continue
+                if (config_failed or spec['ci_target'] is None or run_idx >= spec['max_runs']
+                        or relative_ci_width(samples, spec['confidence']) <= spec['ci_target']):
+                    break
+
+    metadata.update({"runs": done, "finished": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "failed": failed})
+    _write_metadata(csv_filename, metadata)
+    summarize_results(csv_filename, summary_filename(csv_filename), spec['confidence'], spec['ci_target'])
+    return done, failed
+
+
+def _format_stat(value, digits=6):
+    return "" if value is None else f"{value:.{digits}f}"
+
 
-    # Tworzymy/otwieramy plik CSV
-    fieldnames = ["scenario", "implementation", "avx", "threads", "run_number", "time_seconds"]
-    with open(csv_filename, mode="w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+def summarize_results(csv_filename, output, confidence=0.95, ci_target=None):
+    """
+    Zapisuje podsumowanie pliku CSV wyników - jeden wiersz na konfigurację (scenariusz,
+    implementacja, AVX, wątki, skrót danych): liczba udanych i nieudanych pomiarów, mediana,
+    95. percentyl, średnia, odchylenie standardowe, przedział ufności mediany, numery
+    uruchomień odstających (gui/stats.py, oddzielone ';') i czy osiągnięto ci_target.
+    Nieudane uruchomienia (czas -1) nie wchodzą do statystyk.
+
+    :return: Liczba konfiguracji
+    """
+    groups = {}
+    with open(csv_filename, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            key = tuple(row[field] for field in SUMMARY_FIELDNAMES[:5])
+            groups.setdefault(key, []).append(row)
+
+    with open(output + ".tmp", mode="w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=SUMMARY_FIELDNAMES)
         writer.writeheader()
+        for key, rows in groups.items():
+            valid = [row for row in rows if float(row["time_seconds"]) >= 0]
+            stats = summarize([float(row["time_seconds"]) for row in valid], confidence)
+            outliers = [row["run_number"] for row, outlier in zip(valid, stats["outliers"]) if outlier]
+            if ci_target is None or stats["ci_rel_width"] is None:
+                converged = "" if ci_target is None else False
+            else:
+                converged = stats["ci_rel_width"] <= ci_target
+            summary = dict(zip(SUMMARY_FIELDNAMES[:5], key))
+            summary.update({
+                "samples": stats["samples"],
+                "failed": len(rows) - len(valid),
+                "median": _format_stat(stats["median"]),
+                "p95": _format_stat(stats["p95"]),
+                "mean": _format_stat(stats["mean"]),
+                "stddev": _format_stat(stats["stddev"]),
+                "ci_low": _format_stat(stats["ci_low"]),
+                "ci_high": _format_stat(stats["ci_high"]),
+                "ci_rel_width": _format_stat(stats["ci_rel_width"], 4),
+                "outliers": ";".join(outliers),
+                "converged": converged,
+            })
+            writer.writerow(summary)
+    os.replace(output + ".tmp", output)
+    return len(groups)
+
+
+def merge_results(csv_files, output=CSV_FILENAME):
+    """
+    Scala pliki CSV części eksperymentu (run_scenarios z shard=(i, N)) w jeden plik
+    z dodatkowymi kolumnami shard i host. Wszystkie części muszą pochodzić z tej samej
+    specyfikacji (spec_digest w metadanych) i mieć tę samą liczbę części N.
+    Obok pliku wynikowego zapisywane są metadane wszystkich części i podsumowanie statystyk.
+
+    :return: Krotka (liczba scalonych wierszy, lista numerów brakujących części)
+    """
+    parts = []
+    for filename in csv_files:
+        metadata = _read_metadata(filename)
+        if metadata is None:
+            raise ValueError(f"Missing metadata file: {metadata_filename(filename)}")
+        if metadata.get("finished") is None:
+            raise ValueError(f"Shard {metadata.get('shard')} in {filename} did not finish")
+        parts.append((parse_shard(metadata["shard"]), metadata, filename))
+
+    if not parts:
+        raise ValueError("No results files to merge")
+    digests = {metadata["spec_digest"] for _, metadata, _ in parts}
+    counts = {count for (_, count), _, _ in parts}
+    if len(digests) > 1 or len(counts) > 1:
+        raise ValueError("Results files come from different experiment specs or shard counts")
+    indices = [index for (index, _), _, _ in parts]
+    if len(set(indices)) != len(indices):
+        raise ValueError("The same shard is listed more than once")
+    missing = sorted(set(range(1, counts.pop() + 1)) - set(indices))
+    parts.sort(key=lambda part: part[0])
+
+    rows = 0
+    with open(output, mode="w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=MERGED_FIELDNAMES)
+        writer.writeheader()
+        for _, metadata, filename in parts:
+            with open(filename, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    row["shard"] = metadata["shard"]
+                    row["host"] = metadata["host"]
+                    writer.writerow(row)
+                    rows += 1
+
+    _write_metadata(output, {
+        "spec_digest": digests.pop(),
+        "shards": [metadata for _, metadata, _ in parts],
+        "missing_shards": missing,
+    })
+    first = parts[0][1]
+    summarize_results(output, summary_filename(output), first.get("confidence", 0.95), first.get("ci_target"))
+    return rows, missing
+
+
+def _print_progress(done, total, row):
+    """Raportuje postęp uruchomienia na stdout (jedna linia na uruchomienie)."""
+    print(f"[{done}/{total}] "
+          f"scenario={row['scenario']}, impl={row['implementation']}, avx={row['avx']}, "
+          f"threads={row['threads']}, run={row['run_number']}, time={row['time_seconds']}", flush=True)
+
+
+def run_experiment(app):
+    """
+    Uruchamia eksperyment z GUI (run_scenarios, macierz z experiment.json) - postęp
+    wypisujemy w GUI (status_label) i na stdout. Brak użycia progress.tmp.
+    Eksperyment przerwany (np. zamknięciem okna) jest wznawiany przy kolejnym uruchomieniu.
+    """
+    from tkinter import messagebox
+
+    try:
+        spec = load_spec()
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"Failed to load experiment spec: {e}")
+        return
+
+    # Ustaw w app: brak zapisu wyników, brak wykresu, multithreading=ON
+    app.save_results.set(False)
+    app.generate_chart.set(False)
+    app.use_multithreading.set(True)
+
+    # Zablokuj przycisk w GUI:
+    app.compute_button.config(state='disabled')
+    app.status_label.config(text="Experiment running...")
+    app.progress['value'] = 0
+
+    def report(done, total, row):
+        _print_progress(done, total, row)
+
+        # Aktualizacja GUI (status_label, progress)
+        app.status_label.config(
+            text=f"Exp: {done}/{total} runs done. "
+                 f"Scenario={row['scenario']}, impl={row['implementation']}, avx={row['avx']}, threads={row['threads']}"
+        )
+        app.progress['value'] = (done / total) * 100.0
 
-        # Zablokuj przycisk w GUI:
-        app.compute_button.config(state='disabled')
-        app.status_label.config(text="Experiment running...")
-        app.progress['value'] = 0
-
-        for scenario in scenarios:
-            # Ustaw w app: brak zapisu wyników, brak wykresu, multithreading=ON
-            app.save_results.set(False)
-            app.generate_chart.set(False)
-            app.use_multithreading.set(True)
-
-            # Generujemy pliki wejściowe (bez okien)
-            coeff_file = generate_coefficients_file(
-                app,
-                n=scenario["coeff_n"],
-                coeff_min=scenario["coeff_min"],
-                coeff_max=scenario["coeff_max"]
-            )
-            points_file = generate_points_file(
-                app,
-                start=scenario["points_min"],
-                end=scenario["points_max"],
-                step=scenario["points_step"]
-            )
-            app.coefficients_file = coeff_file
-            app.points_file = points_file
-
-            for impl in implementations:
-                for avx in avx_options:
-                    for threads in threads_range:
-                        # Dla każdej konfiguracji 10 uruchomień
-                        for run_idx in range(1, runs_per_config + 1):
-                            if os.path.exists(COMPUTATION_TIME_FILE):
-                                os.remove(COMPUTATION_TIME_FILE)
-                                
-                            # --- Tworzymy config.ini ---
-                            write_config_file(
-                                impl,                       # implementation
-                                True,                       # use_multithreading
-                                threads,                    # threads_number
-                                avx,                        # use_avx
-                                False,                      # save_results
-                                False,                      # generate_chart
-                                "",                         # output_file (pusty)
-                                app.coefficients_file,
-                                app.points_file
-                            )
-
-                            # Tworzymy katalog temp (na wszelki wypadek)
-                            if not os.path.exists(TEMP_DIR):
-                                os.makedirs(TEMP_DIR)
-
-                            # Wyzwalamy zdarzenie - program C++/ASM startuje
-                            trigger_event(EVENT_NAME)
-
-                            # Teraz czekamy, aż pojawi się computation.time
-                            # w pętli (z timeoutem), bo nie używamy progress.tmp
-
-                            start_wait = time.time()
-                            time_elapsed = -1  # Domyślnie błąd
-                            while True:
-                                if os.path.exists(COMPUTATION_TIME_FILE):
-                                    # Odczytujemy zawartość
-                                    with open(COMPUTATION_TIME_FILE, 'r') as f:
-                                        content = f.read().strip()
-                                        if content:
-                                            try:
-                                                time_elapsed = float(content)
-                                            except ValueError:
-                                                time_elapsed = -1
-                                            break
-                                # Sprawdzamy timeout
-                                if (time.time() - start_wait) > TIMEOUT_SECONDS:
-                                    # Błąd - nie doczekaliśmy się
-                                    break
-                                time.sleep(0.1)
-
-                            # Zapisujemy w CSV
-                            writer.writerow({
-                                "scenario": scenario["name"],
-                                "implementation": impl,
-                                "avx": avx,
-                                "threads": threads,
-                                "run_number": run_idx,
-                                "time_seconds": time_elapsed
-                            })
-
-                            # Raportowanie postępu
-                            done += 1
-                            progress_percent = (done / total_runs) * 100.0
-
-                            print(f"[{done}/{total_runs}] "
-                                  f"scenario={scenario['name']}, impl={impl}, avx={avx}, "
-                                  f"threads={threads}, run={run_idx}, time={time_elapsed}")
-
-                            # Aktualizacja GUI (status_label, progress)
-                            app.status_label.config(
-                                text=f"Exp: {done}/{total_runs} runs done. "
-                                     f"Scenario={scenario['name']}, impl={impl}, avx={avx}, threads={threads}"
-                            )
-                            app.progress['value'] = progress_percent
-
-                            # Pozwalamy na odświeżenie interfejsu
-                            app.master.update()
+        # Pozwalamy na odświeżenie interfejsu
+        app.master.update()
 
+    # Status "zakończony" tylko po udanym przejściu całej macierzy - błąd lub przerwanie
+    # (np. Ctrl+C) zostawia postęp na ostatnim zakończonym uruchomieniu
+    status = "Experiment failed."
+    try:
+        done, failed = run_scenarios(CSV_FILENAME, spec, progress_callback=report)
+        status = f"Experiment finished: {done} runs, {failed} failed."
+    except KeyboardInterrupt:
+        status = "Experiment interrupted - run it again to resume."
+        raise
+    except Exception as e:
+        messagebox.showerror("Error", f"Experiment failed: {e}")
+        return
+    finally:
         # Koniec całej pętli
         app.compute_button.config(state='normal')
-        app.status_label.config(text="Experiment finished.")
-        app.progress['value'] = 100
+        app.status_label.config(text=status)
+
+    app.progress['value'] = 100
 
     # Komunikat
     messagebox.showinfo(
         "Experiment Completed",
-        f"Experiment finished!\nResults saved to {csv_filename}"
+        f"{status}\nResults saved to {CSV_FILENAME}\n"
+        f"Summary saved to {summary_filename(CSV_FILENAME)}"
     )
+
+
+def _argument_type(parse):
+    """Zamienia ValueError funkcji parsującej na błąd argumentu argparse."""
+    def convert(value):
+        try:
+            return parse(value)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e)) from None
+    return convert
+
+
+def _comma_list(value):
+    return [item for item in value.split(',') if item]
+
+
+def _apply_overrides(spec, args):
+    """Zawęża specyfikację argumentami wiersza poleceń (--scenarios, --implementations, ...)."""
+    spec = dict(spec)
+    if args.scenarios is not None:
+        names = [scenario['name'] for scenario in spec['scenarios']]
+        unknown = [name for name in args.scenarios if name not in names]
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(unknown)} (spec has: {', '.join(names)})")
+        spec['scenarios'] = [scenario for scenario in spec['scenarios'] if scenario['name'] in args.scenarios]
+    if args.implementations is not None:
+        spec['implementations'] = args.implementations
+    if args.avx != "spec":
+        spec['avx'] = {"both": [False, True], "off": [False], "on": [True]}[args.avx]
+    if args.threads is not None:
+        spec['threads'] = args.threads
+    if args.runs is not None:
+        spec['runs'] = args.runs
+    if args.warmup is not None:
+        spec['warmup'] = args.warmup
+    if args.max_runs is not None:
+        spec['max_runs'] = args.max_runs
+    if args.ci_target is not None:
+        # 0 wyłącza powtarzanie adaptacyjne (dokładnie --runs pomiarów)
+        spec['ci_target'] = args.ci_target or None
+    return validate_spec(spec)
+
+
+def _run_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m gui.experiment",
+        description="Run the polynomial evaluation benchmark matrix without the GUI. "
+                    "Use 'python -m gui.experiment merge' to combine shard results and "
+                    "'python -m gui.experiment report' to build a speedup/efficiency report."
+    )
+    parser.add_argument("-o", "--output", default=CSV_FILENAME, help="CSV results file (default: %(default)s)")
+    parser.add_argument("--spec", default=DEFAULT_SPEC_FILE, help="experiment spec file (default: experiment.json)")
+    parser.add_argument("--shard", type=_argument_type(parse_shard), default=(1, 1),
+                        help="run only shard i of N of the matrix, e.g. 2/4 (default: 1/1)")
+    parser.add_argument("--scenarios", type=_comma_list, help="comma-separated scenario names (default: spec)")
+    parser.add_argument("--implementations", type=_comma_list, help="comma-separated implementations (default: spec)")
+    parser.add_argument("--avx", choices=("spec", "both", "off", "on"), default="spec",
+                        help="AVX settings to run (default: %(default)s)")
+    parser.add_argument("--threads", type=_argument_type(parse_threads),
+                        help='thread counts, e.g. "1-16" or "1,2,4,8" (default: spec)')
+    parser.add_argument("--runs", type=int, help="(minimum) measured runs per configuration (default: spec)")
+    parser.add_argument("--warmup", type=int, help="unrecorded warm-up runs before each configuration (default: spec)")
+    parser.add_argument("--max-runs", type=int,
+                        help="cap on measured runs per configuration when repeating adaptively (default: spec)")
+    parser.add_argument("--ci-target", type=float,
+                        help="repeat until the median's confidence interval is narrower than this fraction "
+                             "of the median, e.g. 0.05; 0 disables adaptive repetition (default: spec)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="start over instead of resuming an interrupted experiment in the output file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print per-run progress")
+    args = parser.parse_args(argv)
+
+    try:
+        spec = _apply_overrides(load_spec(args.spec), args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    try:
+        done, failed = run_scenarios(
+            args.output, spec, args.shard, progress_callback=None if args.quiet else _print_progress,
+            resume=not args.fresh
+        )
+    except ValueError as e:
+        print(f"Experiment failed: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        print("Experiment interrupted - run the same command again to resume.", file=sys.stderr)
+        return EXIT_INTERRUPTED
+
+    print(f"Experiment finished: {done} runs, {failed} failed. Results saved to {args.output}, "
+          f"summary to {summary_filename(args.output)}")
+    return EXIT_RUN_FAILED if failed else EXIT_OK
+
+
+def _merge_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m gui.experiment merge",
+        description="Merge per-shard experiment results into one CSV file with host metadata."
+    )
+    parser.add_argument("inputs", nargs="+", help="per-shard CSV results files")
+    parser.add_argument("-o", "--output", default=CSV_FILENAME, help="merged CSV file (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    try:
+        rows, missing = merge_results(args.inputs, args.output)
+    except (OSError, ValueError) as e:
+        print(f"Merge failed: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    print(f"Merged {rows} rows from {len(args.inputs)} files into {args.output} "
+          f"(summary: {summary_filename(args.output)})")
+    if missing:
+        print(f"Missing shards: {', '.join(map(str, missing))}", file=sys.stderr)
+        return EXIT_RUN_FAILED
+    return EXIT_OK
+
+
+def main(argv=None):
+    """
+    Punkt wejścia python -m gui.experiment: macierz ze specyfikacji (experiment.json),
+    bez wyświetlacza (np. nocne pomiary na serwerach bez interfejsu graficznego).
+    Z --shard i/N wykonywana jest tylko jedna z N części, a podpolecenie merge scala
+    pliki CSV części z różnych maszyn. Podpolecenie report tworzy raport HTML/PNG (gui/report.py).
+
+    Zwraca kod wyjścia: EXIT_OK, EXIT_RUN_FAILED (część uruchomień nie powiodła się
+    lub brakuje części), EXIT_USAGE lub EXIT_INTERRUPTED.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "merge":
+        return _merge_main(argv[1:])
+    if argv and argv[0] == "report":
+        from gui.report import main as report_main
+        return report_main(argv[1:])
+    return _run_main(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import os
+import json
+import hashlib
+from collections import namedtuple
+
+
+# Domyślna specyfikacja eksperymentu (plik w katalogu projektu PythonGUI)
+DEFAULT_SPEC_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'experiment.json')
+
+# Klucze, po których reguły include/exclude wybierają konfiguracje
+RULE_KEYS = ('scenario', 'implementation', 'avx', 'threads')
+
+SCENARIO_KEYS = ('name', 'coeff_n', 'coeff_min', 'coeff_max', 'points_min', 'points_max', 'points_step', 'seed')
+
+# Jedna konfiguracja macierzy eksperymentu - mierzona od spec['runs'] do spec['max_runs'] razy na tej samej maszynie
+Configuration = namedtuple('Configuration', ['scenario', 'implementation', 'avx', 'threads'])
+
+
+def parse_threads(value):
+    """Zamienia "1-16", "1,2,4,8" (lub listę liczb) na listę liczb wątków."""
+    if isinstance(value, list):
+        threads = value
+    else:
+        threads = []
+        try:
+            for part in str(value).split(','):
+                if '-' in part:
+                    first, last = part.split('-', 1)
+                    threads.extend(range(int(first), int(last) + 1))
+                else:
+                    threads.append(int(part))
+        except ValueError:
+            raise ValueError(f"Invalid threads specification: {value}") from None
+    if not threads or not all(isinstance(t, int) and t >= 1 for t in threads):
+        raise ValueError(f"Invalid threads specification: {value}")
+    return list(threads)
+
+
+def _check_rule(rule):
+    if not isinstance(rule, dict) or not rule:
+        raise ValueError(f"Invalid rule in experiment spec: {rule!r}")
+    unknown = set(rule) - set(RULE_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown rule keys in experiment spec: {', '.join(sorted(unknown))}")
+
+
+def validate_spec(spec):
+    """
+    Sprawdza specyfikację eksperymentu i zwraca jej znormalizowaną kopię
+    (threads jako lista liczb, brakujące klucze opcjonalne z wartościami domyślnymi).
+    """
+    try:
+        scenarios = spec['scenarios']
+        implementations = spec['implementations']
+        avx = spec['avx']
+        threads = parse_threads(spec['threads'])
+        runs = spec['runs']
+    except KeyError as e:
+        raise ValueError(f"Missing key in experiment spec: {e.args[0]}") from None
+
+    if not scenarios or not implementations or not avx:
+        raise ValueError("Experiment spec must list at least one scenario, implementation and AVX option")
+    names = set()
+    for scenario in scenarios:
+        missing = [key for key in SCENARIO_KEYS if key not in scenario]
+        if missing:
+            raise ValueError(f"Scenario {scenario.get('name', '?')} is missing: {', '.join(missing)}")
+        if scenario['name'] in names:
+            raise ValueError(f"Duplicate scenario name in experiment spec: {scenario['name']}")
+        names.add(scenario['name'])
+    if not isinstance(runs, int) or runs < 1:
+        raise ValueError(f"Invalid number of runs in experiment spec: {runs}")
+
+    warmup = spec.get('warmup', 0)
+    max_runs = spec.get('max_runs', runs)
+    ci_target = spec.get('ci_target')
+    confidence = spec.get('confidence', 0.95)
+    if not isinstance(warmup, int) or warmup < 0:
+        raise ValueError(f"Invalid number of warm-up runs in experiment spec: {warmup}")
+    if not isinstance(max_runs, int) or max_runs < 1:
+        raise ValueError(f"Invalid maximum number of runs in experiment spec: {max_runs}")
+    if ci_target is not None and not (isinstance(ci_target, (int, float)) and ci_target > 0):
+        raise ValueError(f"Invalid CI target in experiment spec: {ci_target}")
+    if not (isinstance(confidence, float) and 0 < confidence < 1):
+        raise ValueError(f"Invalid confidence level in experiment spec: {confidence}")
+
+    include = spec.get('include', [])
+    exclude = spec.get('exclude', [])
+    for rule in include + exclude:
+        _check_rule(rule)
+
+    return {
+        'scenarios': [dict(scenario) for scenario in scenarios],
+        'implementations': list(implementations),
+        'avx': [bool(option) for option in avx],
+        'threads': threads,
+        'runs': runs,
+        'warmup': warmup,
+        'max_runs': max(max_runs, runs),
+        'ci_target': ci_target,
+        'confidence': confidence,
+        'include': include,
+        'exclude': exclude,
+    }
+
+
+def load_spec(filename=DEFAULT_SPEC_FILE):
+    """
+    Wczytuje specyfikację eksperymentu z pliku JSON (patrz experiment.json):
+      scenarios       - lista scenariuszy (name, coeff_n, coeff_min, coeff_max,
+                        points_min, points_max, points_step, seed),
+      implementations - implementacje, avx - lista wartości AVX,
+      threads         - liczby wątków ("1-16", "1,2,4,8" lub lista),
+      runs            - (minimalna) liczba pomiarów każdej konfiguracji,
+      warmup          - liczba uruchomień rozgrzewkowych przed pomiarami (bez zapisu, domyślnie 0),
+      max_runs        - maksymalna liczba pomiarów przy powtarzaniu adaptacyjnym (domyślnie runs),
+      ci_target       - docelowa względna szerokość przedziału ufności mediany - pomiary są
+                        powtarzane (do max_runs), dopóki jest szerszy (domyślnie brak),
+      confidence      - poziom ufności przedziału (domyślnie 0.95),
+      include/exclude - reguły wyboru konfiguracji (matches_rule).
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        return validate_spec(json.load(f))
+
+
+def matches_rule(configuration, rule):
+    """
+    Sprawdza, czy konfiguracja spełnia regułę: każdy klucz reguły (scenario, implementation,
+    avx, threads) ma pojedynczą wartość albo listę dozwolonych wartości.
+    """
+    for key, allowed in rule.items():
+        value = configuration.scenario['name'] if key == 'scenario' else getattr(configuration, key)
+        if value not in (allowed if isinstance(allowed, list) else [allowed]):
+            return False
+    return True
+
+
+def expand_matrix(spec):
+    """
+    Rozwija specyfikację do listy konfiguracji w stałej kolejności (scenariusz, implementacja,
+    AVX, wątki). Przy niepustym include zostają tylko konfiguracje spełniające którąś regułę
+    include, a następnie usuwane są konfiguracje spełniające którąś regułę exclude.
+    """
+    configurations = []
+    for scenario in spec['scenarios']:
+        for implementation in spec['implementations']:
+            for avx in spec['avx']:
+                for threads in spec['threads']:
+                    configuration = Configuration(scenario, implementation, avx, threads)
+                    if spec['include'] and not any(matches_rule(configuration, r) for r in spec['include']):
+                        continue
+                    if any(matches_rule(configuration, r) for r in spec['exclude']):
+                        continue
+                    configurations.append(configuration)
+    return configurations
+
+
+def parse_shard(value):
+    """Zamienia "i/N" na krotkę (i, N), 1 <= i <= N."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard specification (expected i/N): {value}") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard specification (expected 1 <= i <= N): {value}")
+    return index, count
+
+
+def select_shard(configurations, index, count):
+    """
+    Zwraca konfiguracje części index z count (numeracja od 1). Konfiguracje przydzielane są
+    na przemian (co count-ta), więc kosztowne scenariusze rozkładają się równo między części,
+    a wszystkie uruchomienia jednej konfiguracji trafiają na tę samą maszynę.
+    """
+    return configurations[index - 1::count]
+
+
+def spec_digest(spec):
+    """Skrót znormalizowanej specyfikacji - części jednego eksperymentu muszą mieć ten sam."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
@@ -1,19 +1,40 @@
 import os
-import random
 import configparser
-from tkinter import filedialog, messagebox, Toplevel, Entry, Label, Button
+
+import numpy as np
 
 import gui.config as conf
+from gui import coeffs_cache
+from gui.engine import read_points_range, read_error_estimate
+from gui.grid import PointGrid
+from gui.results_io import read_results
+
+
+# tkinter importowany jest w funkcjach okien - funkcje generowania plików i config.ini
+# działają bez Tk (np. python -m gui.experiment na serwerze bez interfejsu graficznego)
 
 
 def load_file(title, filetypes):
+    from tkinter import filedialog
     return filedialog.askopenfilename(title=title, filetypes=filetypes)
 
 
-def _generate_coefficients(n: int, coeff_min: float, coeff_max: float) -> str:
+def _write_values_text(f, values, fmt='%.17g'):
+    """
+    Zapisuje wartości tekstowo (jedna w linii), formatując całe bloki
+    conf.WRITE_BLOCK_SIZE wartości jedną operacją zamiast osobnego zapisu dla każdej.
+    """
+    for first in range(0, len(values), conf.WRITE_BLOCK_SIZE):
+        block = values[first:first + conf.WRITE_BLOCK_SIZE].tolist()
+        f.write((fmt + '\n') * len(block) % tuple(block))
+
+
+def _generate_coefficients(n: int, coeff_min: float, coeff_max: float, seed=None) -> str:
     """
     Funkcja 'niższego poziomu' generująca n współczynników
     z zakresu [coeff_min, coeff_max] i zapisująca do pliku w conf.TEMP_DIR.
+    Współczynniki losowane są hurtowo generatorem NumPy - podanie seed
+    daje te same dane wejściowe przy każdym uruchomieniu i na każdej maszynie.
     
     Zwraca ścieżkę do wygenerowanego pliku.
     """
@@ -22,11 +43,14 @@ def _generate_coefficients(n: int, coeff_min: float, coeff_max: float) -> str:
     
     filepath = os.path.abspath(os.path.join(conf.TEMP_DIR, 'generated.coeffs'))
     
-    coefficients = [random.uniform(coeff_min, coeff_max) for _ in range(n)]
+    rng = np.random.default_rng(seed)
+    coefficients = rng.uniform(coeff_min, coeff_max, n)
     
     with open(filepath, 'w') as f:
-        for coeff in coefficients:
-            f.write(f"{coeff}\n")
+        _write_values_text(f, coefficients)
+
+    # Plik został nadpisany - od razu zapisz jego binarną postać w pamięci podręcznej
+    coeffs_cache.store(filepath, coefficients)
     
     return filepath
 
@@ -49,24 +73,26 @@ def _generate_points(start: float, end: float, step: float) -> str:
     return filepath
 
 
-def generate_coefficients_file(app, n=None, coeff_min=None, coeff_max=None):
+def generate_coefficients_file(app, n=None, coeff_min=None, coeff_max=None, seed=None):
     """
     Funkcja do generowania współczynników:
       - Jeśli n, coeff_min, coeff_max != None, to generujemy bez okna dialogowego
         i zwracamy ścieżkę (zapisujemy też w app.coefficients_file).
       - Jeśli parametry są None, to wyświetlamy okno Toplevel, by użytkownik wprowadził dane.
+      - seed (opcjonalny) ustala ziarno generatora, aby dane były powtarzalne.
     """
 
     # Sprawdź, czy parametry zostały przekazane.
     # Jeśli TAK -> generujemy w tle (bez GUI).
     if n is not None and coeff_min is not None and coeff_max is not None:
         # Generuj i zapisz do pliku
-        filepath = _generate_coefficients(n, coeff_min, coeff_max)
+        filepath = _generate_coefficients(n, coeff_min, coeff_max, seed)
         app.coefficients_file = filepath
         # Nie wysyłamy messageboxa w trybie eksperymentu
         return filepath
 
     # Jeżeli parametry są None, to jesteśmy w trybie GUI -> pokaż okno:
+    from tkinter import messagebox, Toplevel, Entry, Label, Button
     gen_coeff_window = Toplevel(app.master)
     gen_coeff_window.title("Generate Coefficients")
 
@@ -82,17 +108,23 @@ def generate_coefficients_file(app, n=None, coeff_min=None, coeff_max=None):
     max_coeff_entry = Entry(gen_coeff_window)
     max_coeff_entry.grid(row=2, column=1, padx=5, pady=5)
 
+    Label(gen_coeff_window, text="Seed (optional):").grid(row=3, column=0, padx=5, pady=5)
+    seed_entry = Entry(gen_coeff_window)
+    seed_entry.grid(row=3, column=1, padx=5, pady=5)
+
     def generate():
         try:
             num_coeffs = int(num_coeffs_entry.get())
             mn = float(min_coeff_entry.get())
             mx = float(max_coeff_entry.get())
+            seed_text = seed_entry.get().strip()
+            sd = int(seed_text) if seed_text else None
 
             if num_coeffs <= 0:
                 raise ValueError("Number of coefficients must be positive.")
 
             # Generowanie
-            filepath = _generate_coefficients(num_coeffs, mn, mx)
+            filepath = _generate_coefficients(num_coeffs, mn, mx, sd)
             
             app.coefficients_file = filepath
             app.coeff_file_label.config(text=os.path.basename(filepath))
@@ -103,7 +135,7 @@ def generate_coefficients_file(app, n=None, coeff_min=None, coeff_max=None):
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
 
-    Button(gen_coeff_window, text="Generate", command=generate).grid(row=3, column=0, columnspan=2, pady=10)
+    Button(gen_coeff_window, text="Generate", command=generate).grid(row=4, column=0, columnspan=2, pady=10)
 
 
 def generate_points_file(app, start=None, end=None, step=None):
@@ -121,11 +153,10 @@ def generate_points_file(app, start=None, end=None, step=None):
         return filepath
 
     # Jeżeli parametry są None, to jesteśmy w trybie GUI -> pokaż okno:
+    from tkinter import messagebox, Toplevel, Label, Entry, Button
     gen_points_window = Toplevel(app.master)
     gen_points_window.title("Generate Points")
 
-    from tkinter import Label, Entry, Button
-
     Label(gen_points_window, text="Start value:").grid(row=0, column=0, padx=5, pady=5)
     start_entry = Entry(gen_points_window)
     start_entry.grid(row=0, column=1, padx=5, pady=5)
@@ -163,36 +194,72 @@ def generate_points_file(app, start=None, end=None, step=None):
 
 
 def write_config_file(implementation, multithreading, threads_number, avx, save_results,
-                      generate_chart, output_file, coefficients_file, points_file):
-    progress_file = conf.PROGRESS_FILE
-    computation_time_file = conf.COMPUTATION_TIME_FILE
-    results_file = output_file if save_results else os.path.abspath(os.path.join(conf.TEMP_DIR, 'results.out'))
+                      generate_chart, output_file, coefficients_file, points_file,
+                      precision='float32', results_format='text', job_dir=None, scheme='horner',
+                      batch=False, derivatives=0, reuse_results=True):
+    """
+    Zapisuje plik config.ini z ustawieniami obliczeń.
+
+    Bez job_dir używany jest globalny conf.CONFIG_FILE i pliki w conf.TEMP_DIR.
+    Z job_dir (katalog zlecenia, patrz gui/jobs.py) config.ini oraz pliki postępu,
+    czasu i wyników tymczasowych trafiają do tego katalogu, więc zlecenia nie kolidują.
+    Z batch=True coefficients_file to katalog plików .coeffs lub plik wielokolumnowy
+    (tryb wsadowy, gui/batch.py). derivatives to liczba pochodnych zapisywanych jako
+    dodatkowe kolumny wyników. Z reuse_results=False silnik NumPy zawsze liczy od nowa,
+    bez pamięci podręcznej wyników (gui/results_cache.py) i aktualizacji przyrostowych
+    (gui/incremental.py) - np. przy pomiarach czasu.
+
+    Zwraca ścieżkę zapisanego pliku konfiguracyjnego.
+    """
+    if job_dir is None:
+        config_file = conf.CONFIG_FILE
+        progress_file = conf.PROGRESS_FILE
+        computation_time_file = conf.COMPUTATION_TIME_FILE
+        worker_times_file = conf.WORKER_TIMES_FILE
+        error_estimate_file = conf.ERROR_ESTIMATE_FILE
+        temp_dir = conf.TEMP_DIR
+    else:
+        config_file = os.path.join(job_dir, 'config.ini')
+        progress_file = os.path.join(job_dir, 'progress.tmp')
+        computation_time_file = os.path.join(job_dir, 'computation.time')
+        worker_times_file = os.path.join(job_dir, 'workers.time')
+        error_estimate_file = os.path.join(job_dir, 'error.estimate')
+        temp_dir = job_dir
+    results_file = output_file if save_results else os.path.abspath(os.path.join(temp_dir, 'results.out'))
 
     config = configparser.ConfigParser()
     config['Settings'] = {
         'implementation': implementation,
+        'scheme': scheme,
+        'batch': '1' if batch else '0',
+        'derivatives': derivatives,
+        'reuse_results': '1' if reuse_results else '0',
+        'precision': precision,
         'multithreading': '1' if multithreading else '0',
         'threads_number': threads_number,
         'avx': '1' if avx else '0',
         'save_results': '1' if save_results else '0',
+        'results_format': results_format,
         'generate_chart': '1' if generate_chart else '0',
         'output_file': results_file,
         'input_coeffs_file': os.path.abspath(coefficients_file),
         'input_points_file': os.path.abspath(points_file),
         'progress_file': progress_file,
-        'computation_time_file': computation_time_file
+        'computation_time_file': computation_time_file,
+        'worker_times_file': worker_times_file,
+        'error_estimate_file': error_estimate_file
     }
 
-    with open(conf.CONFIG_FILE, 'w') as configfile:
+    with open(config_file, 'w') as configfile:
         config.write(configfile)
 
-    return conf.CONFIG_FILE
+    return config_file
 
 
-def read_results_and_display(app):
+def read_results_and_display(app, computation_time_file=conf.COMPUTATION_TIME_FILE, error_estimate_file=None):
+    from tkinter import messagebox
     try:
         # Odczytaj czas obliczeń
-        computation_time_file = conf.COMPUTATION_TIME_FILE
         with open(computation_time_file, 'r') as time_file:
             time_content = time_file.read().strip()
             if not time_content:
@@ -204,34 +271,22 @@ def read_results_and_display(app):
         if app.save_results.get():
             # Odczytaj wyniki
             results_file = app.output_file if app.save_results.get() else os.path.abspath(os.path.join(conf.TEMP_DIR, 'results.out'))
-            with open(results_file, 'r') as results_file_obj:
-                lines = results_file_obj.readlines()
-                if not lines:
-                    raise ValueError("Results file is empty.")
-                results = [float(line.strip()) for line in lines]
+            # Plik binarny otwierany jest przez memmap, bez kopiowania danych
+            results = read_results(results_file)
+            if results.size == 0:
+                raise ValueError("Results file is empty.")
         else:
             results = None
 
-        # Odczytaj punkty do wykresu
-        with open(app.points_file, 'r') as points_file_obj:
-            content = points_file_obj.read().strip()
-            if not content:
-                raise ValueError("Points file is empty.")
-            parts = content.split()
-            if len(parts) != 3:
-                raise ValueError("Points file must contain exactly three values: start, end, and step.")
-            start, end, step = map(float, parts)
-            if step <= 0:
-                raise ValueError("Step size must be positive.")
-            points = []
-            current = start
-            while current <= end:
-                points.append(current)
-                current += step
-            if not points:
-                raise ValueError("No points generated.")
-
-        app.master.after(0, app.display_results, computation_time, points, results)
+        # Siatka punktów do wykresu - punkty generuje plot_results, tylko gdy są wyniki do narysowania
+        grid = None
+        if results is not None:
+            grid = PointGrid(*read_points_range(app.points_file))
+
+        # Oszacowanie błędu zapisuje tylko implementacja multipoint
+        error_estimate = read_error_estimate(error_estimate_file)
+
+        app.master.after(0, app.display_results, computation_time, grid, results, error_estimate)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred while reading results: {e}")
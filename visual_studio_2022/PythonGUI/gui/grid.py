@@ -0,0 +1,45 @@
+import numpy as np
+
+import gui.config as conf
+
+
+def count_points(start, end, step):
+    """Zwraca liczbę punktów start, start + step, ..., <= end (ten sam wzór co countPoints z App/utils.cpp)."""
+    return int(np.floor((end - start) / step + 1e-9)) + 1
+
+
+class PointGrid(object):
+    """
+    Siatka punktów x_i = start + i * step (i = 0..count-1) z pliku .points. Punkty dowolnego
+    przedziału indeksów są obliczane na żądanie w float64 (i dopiero potem rzutowane na dtype),
+    więc nie kumulują błędów zaokrągleń, a każdy blok lub worker generuje swój fragment
+    niezależnie - bez wspólnej tablicy punktów. Liczba punktów jest taka sama w silniku NumPy,
+    na wykresie i w serwerze C++ (readPointsChunk z App/utils.cpp).
+    """
+    def __init__(self, start, end, step):
+        self.start = start
+        self.end = end
+        self.step = step
+        self.count = count_points(start, end, step)
+
+    def __len__(self):
+        return self.count
+
+    def points(self, first=0, last=None, dtype=np.float32):
+        """Zwraca punkty o indeksach [first, last) (domyślnie do końca siatki)."""
+        last = self.count if last is None else min(last, self.count)
+        return self.at(np.arange(first, last, dtype=np.float64), dtype)
+
+    def at(self, indices, dtype=np.float32):
+        """Zwraca punkty o podanych indeksach (np. próbka punktów bloku)."""
+        return (self.start + self.step * np.asarray(indices, dtype=np.float64)).astype(dtype, copy=False)
+
+    def ranges(self, chunk_size=conf.POINTS_CHUNK_SIZE):
+        """Generator kolejnych przedziałów indeksów (first, last) po co najwyżej chunk_size punktów."""
+        for first in range(0, self.count, chunk_size):
+            yield first, min(first + chunk_size, self.count)
+
+    def chunks(self, chunk_size=conf.POINTS_CHUNK_SIZE, dtype=np.float32):
+        """Generator kolejnych bloków punktów - cały zakres nigdy nie jest przechowywany w pamięci."""
+        for first, last in self.ranges(chunk_size):
+            yield self.points(first, last, dtype)
@@ -0,0 +1,123 @@
+import time
+import threading
+
+import numpy as np
+
+import gui.config as conf
+from gui.sparse import nonzero_terms, sparse_cost, horner_sparse
+
+
+class EvaluationState(object):
+    """Współczynniki, siatka punktów i wyniki ostatniego obliczenia (w pamięci procesu)."""
+    def __init__(self, coefficients, start, step, results, scheme, updates=0):
+        self.coefficients = np.array(coefficients, dtype=np.float64)
+        self.start = start
+        self.step = step
+        self.results = results
+        self.dtype = results.dtype
+        self.scheme = scheme
+        self.updates = updates  # Liczba kolejnych aktualizacji przyrostowych od pełnego obliczenia
+
+
+_last = None
+_lock = threading.Lock()
+
+
+def is_eligible(settings, total_points):
+    """
+    Sprawdza, czy wyniki obliczeń mogą być zapamiętane i aktualizowane przyrostowo:
+    tylko silnik NumPy bez pochodnych (i bez wyłączonego klucza reuse_results), dla co najwyżej
+    conf.INCREMENTAL_MAX_POINTS punktów (wszystkie wyniki muszą mieścić się w pamięci).
+    """
+    return (settings['implementation'] == 'numpy' and settings['reuse_results'] and not settings['derivatives']
+            and total_points <= conf.INCREMENTAL_MAX_POINTS)
+
+
+def remember(coefficients, start, step, results, scheme, updates=0):
+    """Zapamiętuje wyniki pełnego obliczenia jako punkt wyjścia kolejnych aktualizacji."""
+    global _last
+    with _lock:
+        _last = EvaluationState(coefficients, start, step, results, scheme, updates)
+
+
+def forget():
+    """Usuwa zapamiętane wyniki (następne obliczenie będzie pełne)."""
+    global _last
+    with _lock:
+        _last = None
+
+
+def _coefficients_diff(state, coefficients):
+    """Zwraca różnicę nowych i zapamiętanych współczynników (dłuższa z obu długości)."""
+    n = max(len(state.coefficients), len(coefficients))
+    diff = np.zeros(n, dtype=np.float64)
+    diff[:len(coefficients)] += coefficients
+    diff[:len(state.coefficients)] -= state.coefficients
+    return diff
+
+
+def try_update(coefficients, grid, dtype, kernel, scheme):
+    """
+    Próbuje obliczyć wyniki na podstawie zapamiętanego obliczenia zamiast od zera:
+      - zmienione współczynniki k (o Δ_k) dają results += suma Δ_k * x^k, liczone schematem
+        rzadkim (horner_sparse) tylko po zmienionych wyrazach,
+      - punkty spoza zapamiętanej siatki (rozszerzony zakres) są obliczane kernelem
+        i wstawiane przed lub za zapamiętane wyniki.
+    Siatka musi mieć ten sam krok, a początek musi być przesunięty o całkowitą liczbę kroków.
+    Gdy szacowany koszt przekracza conf.INCREMENTAL_MAX_COST_RATIO kosztu pełnego obliczenia
+    (albo wykonano już conf.INCREMENTAL_MAX_UPDATES aktualizacji z rzędu - ograniczenie
+    narastania błędu zaokrągleń), zwraca None.
+
+    :param grid: Siatka punktów nowego obliczenia (PointGrid z gui/grid.py)
+    :param kernel: Funkcja kernel(coefficients, points, dtype) dla nowych punktów
+    :return: Krotka (wyniki, czas obliczeń w sekundach) albo None
+    """
+    start, step, count = grid.start, grid.step, len(grid)
+    with _lock:
+        state = _last
+    if state is None or state.dtype != np.dtype(dtype) or state.scheme != scheme or state.step != step:
+        return None
+    if state.updates >= conf.INCREMENTAL_MAX_UPDATES:
+        return None
+
+    # Liczba nowych punktów przed zapamiętaną siatką (ujemna, gdy zakres zawężono z lewej)
+    offset = round((state.start - start) / step)
+    if abs(start + offset * step - state.start) > 1e-9 * step:
+        return None
+    first = max(0, offset)
+    last = min(count, offset + len(state.results))
+    if first >= last:
+        return None
+
+    diff = _coefficients_diff(state, np.asarray(coefficients, dtype=np.float64))
+    degrees, _ = nonzero_terms(diff)
+    full_cost = 2 * len(coefficients) * count
+    cost = 2 * len(coefficients) * (count - (last - first))
+    if len(degrees):
+        cost += sparse_cost(degrees) * (last - first)
+    if cost > conf.INCREMENTAL_MAX_COST_RATIO * full_cost:
+        return None
+
+    start_time = time.perf_counter()
+    results = np.empty(count, dtype=dtype)
+    results[first:last] = state.results[first - offset:last - offset]
+    diff = diff.astype(dtype)
+
+    # Blokami conf.POINTS_CHUNK_SIZE - tablice pomocnicze potęgowania mieszczą się w pamięci podręcznej
+    with np.errstate(over='ignore', invalid='ignore'):
+        for block in range(0, count, conf.POINTS_CHUNK_SIZE):
+            block_end = min(block + conf.POINTS_CHUNK_SIZE, count)
+            for lo, hi, stored in ((block, min(block_end, first), False),
+                                   (max(block, first), min(block_end, last), True),
+                                   (max(block, last), block_end, False)):
+                if lo >= hi or (stored and not len(degrees)):
+                    continue
+                points = grid.points(lo, hi, dtype)
+                if stored:
+                    results[lo:hi] += horner_sparse(diff, points, dtype)
+                else:
+                    results[lo:hi] = kernel(coefficients, points, dtype)
+    computation_time = time.perf_counter() - start_time
+
+    remember(coefficients, start, step, results, scheme, state.updates + 1)
+    return results, computation_time
@@ -0,0 +1,190 @@
+import os
+import uuid
+import atexit
+import queue
+import shutil
+import threading
+
+import gui.config as conf
+from gui.engine import compute_from_config, read_config_file, server_cache_key, use_cached_results, store_cached_results
+from gui.events import resolve_backend, create_transport, wait_for_completion
+from gui.file_utils import write_config_file
+
+
+# Stany zlecenia
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+
+class Job(object):
+    """
+    Pojedyncze zlecenie obliczeń. Każde zlecenie ma własny katalog conf.TEMP_DIR/<job_id>/
+    z plikami config.ini, progress.tmp, computation.time, workers.time (i results.out, gdy wyniki
+    nie są zapisywane do pliku użytkownika), więc wiele zleceń może działać jednocześnie.
+    """
+    def __init__(self, job_id, job_dir, config_file):
+        self.job_id = job_id
+        self.job_dir = job_dir
+        self.config_file = config_file
+        self.computation_time_file = os.path.join(job_dir, 'computation.time')
+        self.worker_times_file = os.path.join(job_dir, 'workers.time')
+        self.error_estimate_file = os.path.join(job_dir, 'error.estimate')
+        self.status = JOB_QUEUED
+        self.progress = 0
+        self.computation_time = None
+        self.error = None
+        self._finished = threading.Event()
+
+    def set_progress(self, progress):
+        self.progress = progress
+
+    def finish(self, computation_time=None, error=None):
+        self.computation_time = computation_time
+        self.error = error
+        self.status = JOB_FAILED if error is not None else JOB_DONE
+        self._finished.set()
+
+    def wait(self, timeout=None):
+        """Czeka na zakończenie zlecenia. Zwraca True, jeżeli zlecenie się zakończyło."""
+        return self._finished.wait(timeout)
+
+    def cleanup(self):
+        """Usuwa katalog zlecenia."""
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+
+
+def create_job(implementation, multithreading, threads_number, avx, save_results,
+               generate_chart, output_file, coefficients_file, points_file,
+               precision='float32', results_format='text', scheme='horner', batch=False,
+               derivatives=0, reuse_results=True):
+    """
+    Tworzy zlecenie: nadaje mu identyfikator, zakłada katalog conf.TEMP_DIR/<job_id>/
+    i zapisuje w nim config.ini (parametry jak w write_config_file).
+    """
+    job_id = uuid.uuid4().hex[:12]
+    job_dir = os.path.join(conf.TEMP_DIR, job_id)
+    os.makedirs(job_dir)
+
+    config_file = write_config_file(
+        implementation, multithreading, threads_number, avx, save_results,
+        generate_chart, output_file, coefficients_file, points_file,
+        precision, results_format, job_dir=job_dir, scheme=scheme, batch=batch,
+        derivatives=derivatives, reuse_results=reuse_results
+    )
+    return Job(job_id, job_dir, config_file)
+
+
+# Implementacje liczone silnikiem NumPy (gui/engine.py), bez serwera C++/ASM
+ENGINE_IMPLEMENTATIONS = ('numpy', 'multipoint')
+
+
+def run_job_in_process(job):
+    """
+    Wykonuje zlecenie silnikiem NumPy w bieżącym procesie (bez kolejki i workerów).
+
+    Zwraca czas obliczeń w sekundach.
+    """
+    job.status = JOB_RUNNING
+    try:
+        computation_time = compute_from_config(job.config_file, progress_callback=job.set_progress)
+    except Exception as e:
+        job.finish(error=str(e))
+        raise
+    job.finish(computation_time)
+    return computation_time
+
+
+class JobScheduler(object):
+    """
+    Kolejka zleceń obsługiwana przez pulę workerów. Każdy worker ma własny transport
+    (gui/events.py) i pobiera kolejne zlecenia z kolejki, więc niezależne obliczenia
+    wykonują się równolegle, a zapis wyników jednych nakłada się z obliczeniami innych.
+    Przed zleceniem obliczeń sprawdzana jest pamięć podręczna wyników (gui/results_cache.py) -
+    przy trafieniu serwer nie jest uruchamiany, a po obliczeniach wyniki są w niej zapisywane.
+    """
+    def __init__(self, workers=conf.JOB_WORKERS, backend=None):
+        self.backend = resolve_backend(backend)
+        if self.backend == 'win32':
+            workers = 1  # Serwer App obsługuje jedno zlecenie naraz
+
+        self.queue = queue.Queue()
+        self.threads = []
+        for _ in range(workers):
+            thread = threading.Thread(target=self._run, args=(create_transport(self.backend),), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, job):
+        """Dodaje zlecenie do kolejki i zwraca je."""
+        self.queue.put(job)
+        return job
+
+    def _run(self, transport):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                break
+
+            job.status = JOB_RUNNING
+            try:
+                settings = read_config_file(job.config_file)
+                cache_key = server_cache_key(settings)
+                if cache_key is not None and use_cached_results(settings, cache_key, job.set_progress):
+                    job.finish(0.0)
+                    continue
+            except Exception as e:
+                job.finish(error=str(e))
+                continue
+
+            try:
+                transport.submit(job.config_file)
+                computation_time = wait_for_completion(transport, conf.TIMEOUT_SECONDS, job.set_progress)
+            except Exception as e:
+                transport.reset()
+                job.finish(error=str(e))
+                continue
+
+            if cache_key is not None:
+                try:
+                    store_cached_results(settings, cache_key)
+                except (OSError, ValueError):
+                    pass  # Wyniki są już u użytkownika - brak wpisu oznacza tylko ponowne obliczenia
+            job.finish(computation_time)
+
+        transport.close()
+
+    def close(self):
+        """Kończy pracę workerów po obsłużeniu zleceń z kolejki."""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join(timeout=1)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Zwraca współdzielony JobScheduler (tworzony przy pierwszym użyciu)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler()
+            # Workery nie są procesami daemon - zamknij je przed zakończeniem programu.
+            # Rejestracja po uruchomieniu workerów gwarantuje wywołanie przed
+            # funkcją multiprocessing, która czeka na zakończenie procesów potomnych.
+            atexit.register(close_scheduler)
+        return _scheduler
+
+
+def close_scheduler():
+    """Zamyka współdzielony JobScheduler."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.close()
+            _scheduler = None
+
@@ -1,4 +1,3 @@
-from asyncio.windows_events import NULL
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter.ttk import Progressbar
@@ -9,14 +8,16 @@ import zlib, base64
 import time
 
 import gui.config as conf
-from gui.events import trigger_event, monitor_progress_and_completion
+from gui.events import monitor_progress_and_completion
 from gui.file_utils import (
     generate_coefficients_file,
     generate_points_file,
-    load_file,
-    write_config_file
+    load_file
 )
+from gui.jobs import create_job, run_job_in_process, get_scheduler, close_scheduler, ENGINE_IMPLEMENTATIONS
+from gui import results_cache
 from gui.plotting import plot_results
+from gui.analysis import analyze_files, format_analysis
 from gui.experiment import run_experiment, show_experiment_info
 
 class MainWindow(object):
@@ -27,15 +28,18 @@ class MainWindow(object):
         self.master.title("Horner Polynomial Calculator")
 
         # Ikona programu
-        master.iconbitmap("icon.ico")
+        try:
+            master.iconbitmap("icon.ico")
+        except tk.TclError:
+            pass  # Pliki .ico nie są obsługiwane poza Windows
         image = ImageTk.PhotoImage(file="icon.ico")
         master.tk.call('wm', 'iconphoto', master._w, image)
 
         # Wczytanie logo dla C++ i ASM
-        self.cpp_logo_image = Image.open("gui/images/cpp.png").resize((50, 50), Image.ANTIALIAS)
+        self.cpp_logo_image = Image.open("gui/images/cpp.png").resize((50, 50), Image.LANCZOS)
         self.cpp_logo = ImageTk.PhotoImage(self.cpp_logo_image)
 
-        self.asm_logo_image = Image.open("gui/images/asm.png").resize((50, 50), Image.ANTIALIAS)
+        self.asm_logo_image = Image.open("gui/images/asm.png").resize((50, 50), Image.LANCZOS)
         self.asm_logo = ImageTk.PhotoImage(self.asm_logo_image)
 
         # Zmienne konfiguracyjne
@@ -45,9 +49,14 @@ class MainWindow(object):
         self.impl_choice = tk.StringVar(value='cpp')  # Domyślnie implementacja C++
         self.use_multithreading = tk.BooleanVar(value=False)
         self.threads_number = 1
+        self.derivatives = 0  # Liczba pochodnych zapisywanych jako dodatkowe kolumny wyników
         self.use_avx = tk.BooleanVar(value=False)
+        self.precision = tk.StringVar(value='float32')  # Precyzja silnika NumPy
+        self.scheme = tk.StringVar(value='horner')  # Schemat obliczeń (horner, blocked lub progression)
+        self.batch = tk.BooleanVar(value=False)  # Tryb wsadowy (wiele wielomianów, gui/batch.py)
         self.generate_chart = tk.BooleanVar(value=False)
         self.save_results = tk.BooleanVar(value=False)
+        self.results_format = tk.StringVar(value='text')  # Format pliku wyników
         self.is_running = True
 
         # Przygotowanie UI
@@ -112,6 +121,28 @@ class MainWindow(object):
         )
         self.asm_radio.pack(anchor='w', pady=2)
 
+        # Radiobutton silnika NumPy (obliczenia w procesie GUI, bez serwera C++/ASM)
+        self.numpy_radio = tk.Radiobutton(
+            top_left_frame,
+            text="NumPy (in-process)",
+            variable=self.impl_choice,
+            value='numpy',
+            anchor='w',
+            cursor="hand2",
+        )
+        self.numpy_radio.pack(anchor='w', pady=2)
+
+        # Radiobutton implementacji multipoint (silnik NumPy, float64, z oszacowaniem błędu)
+        self.multipoint_radio = tk.Radiobutton(
+            top_left_frame,
+            text="Multipoint (NumPy, float64)",
+            variable=self.impl_choice,
+            value='multipoint',
+            anchor='w',
+            cursor="hand2",
+        )
+        self.multipoint_radio.pack(anchor='w', pady=2)
+
         # ========== 2) Górna-prawa część: Opcje (multithreading, AVX, itp.) ==========
         top_right_frame = tk.LabelFrame(
             grid_frame,
@@ -155,6 +186,37 @@ class MainWindow(object):
         )
         self.avx_checkbox.pack(anchor='w', pady=2)
 
+        self.precision_checkbox = tk.Checkbutton(
+            top_right_frame,
+            text="Double Precision (NumPy)",
+            variable=self.precision,
+            onvalue='float64',
+            offvalue='float32',
+            cursor="hand2"
+        )
+        self.precision_checkbox.pack(anchor='w', pady=2)
+
+        self.blocked_checkbox = tk.Checkbutton(
+            top_right_frame,
+            text="Blocked Evaluation (high degree)",
+            variable=self.scheme,
+            onvalue='blocked',
+            offvalue='horner',
+            cursor="hand2"
+        )
+        self.blocked_checkbox.pack(anchor='w', pady=2)
+
+        # Wspólna zmienna self.scheme - zaznaczenie jednego schematu odznacza drugi
+        self.progression_checkbox = tk.Checkbutton(
+            top_right_frame,
+            text="Progression Evaluation (uniform points)",
+            variable=self.scheme,
+            onvalue='progression',
+            offvalue='horner',
+            cursor="hand2"
+        )
+        self.progression_checkbox.pack(anchor='w', pady=2)
+
         self.save_results_checkbox = tk.Checkbutton(
             top_right_frame,
             text="Save Output File",
@@ -163,6 +225,16 @@ class MainWindow(object):
         )
         self.save_results_checkbox.pack(anchor='w', pady=2)
 
+        self.binary_results_checkbox = tk.Checkbutton(
+            top_right_frame,
+            text="Binary Output Format",
+            variable=self.results_format,
+            onvalue='binary',
+            offvalue='text',
+            cursor="hand2"
+        )
+        self.binary_results_checkbox.pack(anchor='w', pady=2)
+
         self.chart_checkbox = tk.Checkbutton(
             top_right_frame,
             text="Generate Chart",
@@ -171,6 +243,21 @@ class MainWindow(object):
         )
         self.chart_checkbox.pack(anchor='w', pady=2)
 
+        # Spinbox w ramce (liczba pochodnych liczonych razem z wartością)
+        derivatives_frame = tk.Frame(top_right_frame)
+        derivatives_frame.pack(anchor='w', pady=2)
+        tk.Label(derivatives_frame, text="Derivatives:").pack(side=tk.LEFT, padx=5)
+        self.derivatives_spinbox = tk.Spinbox(
+            derivatives_frame,
+            from_=0,
+            to=conf.MAX_DERIVATIVES,
+            width=5,
+            command=self.update_derivatives
+        )
+        self.derivatives_spinbox.pack(side=tk.LEFT)
+        self.derivatives_spinbox.delete(0, tk.END)
+        self.derivatives_spinbox.insert(0, self.derivatives)
+
         # ========== 3) Dolna-lewa część: Coefficients & Points ==========
         bottom_left_frame = tk.Frame(grid_frame, padx=10, pady=10)
         bottom_left_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
@@ -205,6 +292,25 @@ class MainWindow(object):
         )
         self.gen_coeff_button.pack(anchor='w', pady=2)
 
+        self.load_coeff_dir_button = tk.Button(
+            coeff_frame,
+            text="Load Coefficients Directory",
+            command=self.load_coefficients_directory,
+            width=22,
+            cursor="hand2",
+            activeforeground="black"
+        )
+        self.load_coeff_dir_button.pack(anchor='w', pady=2)
+
+        # Tryb wsadowy: katalog plików .coeffs lub plik wielokolumnowy (jedna kolumna na wielomian)
+        self.batch_checkbox = tk.Checkbutton(
+            coeff_frame,
+            text="Batch Mode (many polynomials)",
+            variable=self.batch,
+            cursor="hand2"
+        )
+        self.batch_checkbox.pack(anchor='w', pady=2)
+
         self.coeff_file_label = tk.Label(
             coeff_frame,
             text="No file selected",
@@ -295,6 +401,15 @@ class MainWindow(object):
         )
         self.compute_button.pack(fill=tk.X, expand=False, pady=(30, 5))
 
+        # Pierwiastki i ekstrema wielomianu w zakresie pliku punktów (gui/analysis.py)
+        self.find_roots_button = tk.Button(
+            bottom_right_frame,
+            text="Find Roots && Extrema",
+            command=self.start_analysis,
+            cursor="hand2"
+        )
+        self.find_roots_button.pack(fill=tk.X, expand=False, pady=(5, 5))
+
         # ========== Eksperymenty ==========
 
         # 1) Przycisk "Run Experiment"
@@ -353,6 +468,12 @@ class MainWindow(object):
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid number of threads.")
 
+    def update_derivatives(self):
+        try:
+            self.derivatives = int(self.derivatives_spinbox.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number of derivatives.")
+
     def toggle_threads_spinbox(self):
         if self.use_multithreading.get():
             self.threads_spinbox.config(state='normal')
@@ -365,6 +486,13 @@ class MainWindow(object):
             self.coefficients_file = filename
             self.coeff_file_label.config(text=os.path.basename(filename))
 
+    def load_coefficients_directory(self):
+        directory = filedialog.askdirectory(title="Select Coefficients Directory")
+        if directory:
+            self.coefficients_file = directory
+            self.coeff_file_label.config(text=os.path.basename(directory) + os.sep)
+            self.batch.set(True)
+
     def load_points(self):
         filename = load_file("Select Points File", [("Points Files", "*.points"), ("All Files", "*.*")])
         if filename:
@@ -413,13 +541,8 @@ class MainWindow(object):
             if not os.path.exists(conf.TEMP_DIR):
                 os.makedirs(conf.TEMP_DIR)
 
-            # Usuń poprzedni plik postępu
-            progress_file = os.path.abspath(conf.PROGRESS_FILE)
-            if os.path.exists(progress_file):
-                os.remove(progress_file)
-
-            # Zapisz config
-            write_config_file(
+            # Utwórz zlecenie z własnym katalogiem i config.ini
+            job = create_job(
                 self.impl_choice.get(),
                 self.use_multithreading.get(),
                 self.threads_number,
@@ -428,18 +551,28 @@ class MainWindow(object):
                 self.generate_chart.get(),
                 self.output_file,
                 self.coefficients_file,
-                self.points_file
+                self.points_file,
+                self.precision.get(),
+                self.results_format.get(),
+                self.scheme.get(),
+                self.batch.get(),
+                self.derivatives
             )
 
-            # Wyzwól zdarzenie (uruchom program C++/ASM w tle)
-            trigger_event(conf.EVENT_NAME)
-
-            # Monitoruj postęp i zakończenie
-            self.monitor_thread = threading.Thread(
-                target=monitor_progress_and_completion,
-                args=(self,)
-            )
-            self.monitor_thread.start()
+            # Silnik NumPy liczy bezpośrednio w tym wątku, bez serwera C++/ASM
+            # (tryb wsadowy obsługuje tylko silnik NumPy). Postęp, wyniki, błędy i usunięcie
+            # katalogu zlecenia obsługuje monitor - tak samo jak dla zleceń z kolejki.
+            if self.impl_choice.get() in ENGINE_IMPLEMENTATIONS or self.batch.get():
+                self.start_monitor(job)
+                try:
+                    run_job_in_process(job)
+                except Exception:
+                    pass  # Błąd jest zapisany w job.error i zgłaszany przez monitor
+                return
+
+            # Zleć obliczenia (serwer C++/ASM lub lokalny proces obliczeniowy)
+            get_scheduler().submit(job)
+            self.start_monitor(job)
 
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
@@ -447,10 +580,49 @@ class MainWindow(object):
             self.status_label.config(text="Error")
             self.progress.stop()
 
-    def display_results(self, computation_time, points, results):
+    def start_analysis(self):
+        if not self.coefficients_file or not os.path.isfile(self.coefficients_file):
+            messagebox.showerror("Error", "Please load or generate a coefficients file first (batch mode is not supported).")
+            return
+
+        if not self.points_file or not os.path.exists(self.points_file):
+            messagebox.showerror("Error", "Please load or generate points file first.")
+            return
+
+        self.find_roots_button.config(state='disabled')
+        self.status_label.config(text="Finding roots and extrema...")
+        threading.Thread(target=self.analyze_polynomial, daemon=True).start()
+
+    def analyze_polynomial(self):
+        try:
+            text = format_analysis(analyze_files(self.coefficients_file, self.points_file), limit=20)
+        except Exception as e:
+            self.master.after(0, messagebox.showerror, "Error", f"Analysis failed: {e}")
+            self.master.after(0, self.status_label.config, {"text": "Error"})
+        else:
+            self.master.after(0, messagebox.showinfo, "Roots and Extrema", text)
+            self.master.after(0, self.status_label.config, {"text": "Analysis complete."})
+        finally:
+            self.master.after(0, self.find_roots_button.config, {"state": 'normal'})
+
+    def start_monitor(self, job):
+        """Monitoruje postęp i zakończenie zlecenia w osobnym wątku (monitor_progress_and_completion)."""
+        self.monitor_thread = threading.Thread(
+            target=monitor_progress_and_completion,
+            args=(self, job)
+        )
+        self.monitor_thread.start()
+
+    def display_results(self, computation_time, grid, results, error_estimate=None):
         # Po zakończeniu obliczeń
-        messagebox.showinfo("Computation Complete", f"Computation completed in {computation_time:.4f} seconds.")
-        self.status_label.config(text=f"Finished in {computation_time:.4f}s")
+        message = f"Computation completed in {computation_time:.4f} seconds."
+        if error_estimate is not None:
+            message += f"\nEstimated max relative error: {error_estimate:.3g}"
+        messagebox.showinfo("Computation Complete", message)
+        hits, misses = results_cache.stats()
+        self.status_label.config(
+            text=f"Finished in {computation_time:.4f}s | Result cache: {hits} hits, {misses} misses"
+        )
 
         # Zakończ jeżeli wyniki nie są zapisane
         if results is None:
@@ -462,11 +634,7 @@ class MainWindow(object):
                 )
             return
 
-        # Zrównaj długość listy punktów i wyników w razie nadmiaru
-        if len(points) > len(results):
-            points = points[:len(results)]
-
-        plot_results(self, points, results)
+        plot_results(self, grid, results)
 
 
     def on_closing(self):
@@ -474,4 +642,5 @@ class MainWindow(object):
         self.master.destroy()
         if hasattr(self, 'monitor_thread') and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=1)
+        close_scheduler()
 
@@ -0,0 +1,117 @@
+import math
+
+import numpy as np
+
+import gui.config as conf
+
+
+# Jednostka zaokrąglenia float64
+UNIT_ROUNDOFF = np.finfo(np.float64).eps / 2
+
+
+def should_use_multipoint(num_coeffs, num_points):
+    """
+    Heurystyka progu opłacalności: dla małych wielomianów lub niewielu punktów narzut
+    przygotowania macierzy jest większy niż zysk, więc lepszy jest zwykły schemat Hornera.
+    """
+    return num_coeffs >= conf.MULTIPOINT_MIN_COEFFS and num_coeffs * num_points >= conf.MULTIPOINT_MIN_WORK
+
+
+def split_blocks(num_coeffs):
+    """
+    Podział n współczynników na około sqrt(n) bloków po m współczynników (kroki małe i duże),
+    ta sama reguła co w hornerBlocked z App/horner.cpp.
+
+    :return: Krotka (m - liczba współczynników bloku, liczba bloków)
+    """
+    num_blocks = max(1, round(math.sqrt(num_coeffs)))
+    block_size = (num_coeffs + num_blocks - 1) // num_blocks
+    num_blocks = (num_coeffs + block_size - 1) // block_size
+    return block_size, num_blocks
+
+
+def block_matrix(coefficients, dtype=np.float64):
+    """Macierz (liczba bloków x m), wiersz j to współczynniki podwielomianu P_j (uzupełnione zerami)."""
+    block_size, num_blocks = split_blocks(len(coefficients))
+    blocks = np.zeros(num_blocks * block_size, dtype=dtype)
+    blocks[:len(coefficients)] = coefficients
+    return blocks.reshape(num_blocks, block_size)
+
+
+def evaluate_blocked(blocks, points, evaluate_blocks, dtype=np.float64):
+    """
+    Wspólny rdzeń schematu blokowego (horner_blocked z gui/engine.py) i metody kroków małych
+    i dużych (evaluate_multipoint): dla kolejnych paczek punktów evaluate_blocks(blocks, x) zwraca
+    macierz (liczba bloków x punkty) wartości podwielomianów P_j, a wynik P(x) = suma P_j(x) * (x^m)^j
+    łączony jest schematem Hornera względem y = x^m. Paczki mają co najwyżej
+    conf.BLOCKED_BUFFER_SIZE wyników częściowych.
+    """
+    num_blocks, block_size = blocks.shape
+    results = np.empty(len(points), dtype=dtype)
+    batch_size = max(1, conf.BLOCKED_BUFFER_SIZE // num_blocks)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for first in range(0, len(points), batch_size):
+            x = points[first:first + batch_size]
+            partial = evaluate_blocks(blocks, x)
+            y = x ** block_size
+
+            # Start od ostatniego bloku (zawiera najwyższy współczynnik) - bez 0 * inf = NaN przy przepełnieniu y
+            value = partial[-1].copy()
+            for block in partial[-2::-1]:
+                np.multiply(value, y, out=value)
+                value += block
+            results[first:first + len(x)] = value
+    return results
+
+
+def _matmul_blocks(blocks, x):
+    """Wartości podwielomianów jako iloczyn macierzy współczynników i potęg x^0..x^(m-1) (BLAS)."""
+    return blocks @ np.vander(x, blocks.shape[1], increasing=True).T
+
+
+def evaluate_multipoint(coefficients, points):
+    """
+    Oblicza wartości wielomianu jednocześnie we wszystkich punktach w precyzji float64
+    metodą kroków małych i dużych (Paterson-Stockmeyer). Zamiast n przejść po tablicy
+    punktów wykonywanych jest około 2 * sqrt(n), a pozostała praca to jedno mnożenie
+    macierzy wykonywane przez BLAS (wielowątkowo, z instrukcjami wektorowymi).
+
+    Nie jest to algorytm asymptotycznie szybszy od schematu Hornera: mnożenie macierzy
+    wykonuje nadal około n mnożeń z dodawaniem na punkt, czyli O(n * liczba punktów).
+    Metoda tylko przestawia tę samą pracę tak, aby wykonał ją BLAS - ewentualny zysk
+    wynika z wydajności BLAS, a nie z mniejszej liczby działań.
+
+    :param coefficients: Współczynniki wielomianu (coefficients[0] to wyraz wolny)
+    :param points: Tablica punktów (x)
+    :return: Tablica wartości wielomianu w punktach (float64)
+    """
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+
+    return evaluate_blocked(block_matrix(coefficients), points, _matmul_blocks)
+
+
+def error_estimate(coefficients, points, results, horner=False):
+    """
+    Szacuje błąd względny obliczeń evaluate_multipoint w podanych punktach na podstawie
+    ograniczenia błędu zaokrągleń: |błąd| <= gamma * suma |c_i| * |x|^i, gdzie
+    gamma = k*u / (1 - k*u), a k to długość najdłuższego łańcucha operacji (2 * (m + giant_steps),
+    a dla schematu Hornera - horner=True - 2 * n).
+
+    Punkty, w których wartość wielomianu jest zerowa lub nieskończona, są pomijane.
+    Zwraca największe oszacowanie błędu względnego (inf, gdy nie pozostał żaden punkt)
+    albo None dla pustej tablicy punktów.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) == 0:
+        return None
+
+    blocks = block_matrix(np.abs(np.asarray(coefficients, dtype=np.float64)))
+    magnitude = evaluate_blocked(blocks, np.abs(points), _matmul_blocks)
+
+    chain = 2 * len(coefficients) if horner else 2 * sum(blocks.shape)
+    gamma = chain * UNIT_ROUNDOFF / (1 - chain * UNIT_ROUNDOFF)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        relative = gamma * magnitude / np.abs(np.asarray(results, dtype=np.float64))
+    relative = relative[np.isfinite(relative)]
+    return float(relative.max()) if relative.size else float('inf')
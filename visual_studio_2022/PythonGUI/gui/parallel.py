@@ -0,0 +1,252 @@
+import os
+import time
+import signal
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import gui.config as conf
+from gui.engine import get_kernel
+
+
+# Licznik kafelków i licznik uruchomionych procesów współdzielone przez workery (ustawiane przez _init_worker)
+_next_tile = None
+_started_workers = None
+
+
+def _init_worker(next_tile, started_workers):
+    global _next_tile, _started_workers
+    _next_tile = next_tile
+    _started_workers = started_workers
+    # Ctrl+C obsługuje proces główny (zamyka pulę) - workery nie wypisują własnych KeyboardInterrupt
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    with started_workers.get_lock():
+        started_workers.value += 1
+
+
+def _wait_for_workers(workers):
+    """
+    Zadanie rozruchowe: zajmuje workera, dopóki nie wystartują wszystkie procesy puli.
+    Zajęte workery zmuszają ProcessPoolExecutor do utworzenia kolejnych procesów.
+    """
+    while _started_workers.value < workers:
+        time.sleep(0.001)
+
+
+class WorkerPool(object):
+    """
+    Trwała pula procesów (odpowiednik ThreadPool z App/threadpool.h) wraz ze wspólnym
+    licznikiem kafelków. Procesy są tworzone raz i używane przez kolejne bloki i zlecenia.
+    ProcessPoolExecutor uruchamia procesy dopiero przy pierwszych zadaniach, więc konstruktor
+    od razu czeka na start wszystkich workerów - czas uruchamiania procesów nie trafia
+    do mierzonego czasu obliczeń.
+    """
+    def __init__(self, workers):
+        self.workers = workers
+        self.next_tile = multiprocessing.Value('q', 0)
+        started_workers = multiprocessing.Value('q', 0)
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.next_tile, started_workers)
+        )
+        for future in [self.executor.submit(_wait_for_workers, workers) for _ in range(workers)]:
+            future.result()
+        # Wspólny licznik kafelków pozwala na tylko jedno obliczenie naraz
+        self.lock = threading.Lock()
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool(workers):
+    """
+    Zwraca współdzieloną pulę procesów. Pula jest tworzona przy pierwszym użyciu
+    i tworzona ponownie tylko, gdy zmieni się liczba workerów (threads_number).
+    Procesy puli kończy concurrent.futures przy zamykaniu interpretera.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.workers != workers:
+            if _pool is not None:
+                with _pool.lock:
+                    _pool.shutdown()
+            _pool = WorkerPool(workers)
+        return _pool
+
+
+def _reset_worker_pool_in_child():
+    # Proces utworzony przez fork dziedziczy obiekt puli bez jej wątków i procesów
+    global _pool, _pool_lock
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_worker_pool_in_child)
+
+
+def shutdown_worker_pool():
+    """Zamyka współdzieloną pulę procesów."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def tile_size(num_coeffs, num_points, workers):
+    """
+    Dobiera rozmiar kafelka (odpowiednik computeTileSize z App/horner.cpp): każdy kafelek
+    zawiera około conf.TILE_TARGET_WORK mnożeń z dodawaniem, ale nie więcej punktów
+    niż równy podział między workery. Rozmiar jest wielokrotnością 8.
+    """
+    per_worker = (num_points + workers - 1) // workers
+    size = conf.TILE_TARGET_WORK // max(1, num_coeffs)
+    size = max(conf.MIN_TILE_POINTS, min(size, per_worker))
+    return (size + 7) // 8 * 8
+
+
+def chunk_size(workers):
+    """
+    Zwraca liczbę punktów obliczanych jednym wywołaniem ParallelEvaluator.evaluate_range:
+    conf.PARALLEL_CHUNK_POINTS na workera. Blok conf.POINTS_CHUNK_SIZE punktów mieści
+    tylko kilka kafelków (przy 9 i więcej workerach część z nich nie miałaby pracy),
+    a narzut rozsyłania zadań do puli przeważałby nad obliczeniami niskich stopni.
+    """
+    return max(1, workers) * conf.PARALLEL_CHUNK_POINTS
+
+
+def _attach_shared_memory(name):
+    """
+    Dołącza do istniejącego bloku pamięci współdzielonej w procesie workera.
+    Blok należy do procesu głównego (to on go usuwa w ParallelEvaluator.close).
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 nie ma parametru track - workery korzystają z resource_tracker
+        # procesu głównego, więc rejestracja bloku i tak nie prowadzi do jego usunięcia
+        return shared_memory.SharedMemory(name=name)
+
+
+def _evaluate_tiles(coeffs_name, num_coeffs, results_name, dtype, scheme, grid, first, count, tile):
+    """
+    Zadanie workera: pobiera kolejne kafelki ze wspólnego licznika, sam generuje ich punkty
+    (punkty siatki grid o indeksach od first) i zapisuje wyniki bezpośrednio do współdzielonego
+    bufora wyników (nic nie jest odsyłane przez pickle).
+
+    Zwraca krotkę (pid, czas pracy w sekundach, liczba obliczonych kafelków).
+    """
+    kernel = get_kernel(scheme)
+    coeffs_shm = _attach_shared_memory(coeffs_name)
+    results_shm = _attach_shared_memory(results_name)
+    busy_time = 0.0
+    tiles_done = 0
+    try:
+        coefficients = np.ndarray((num_coeffs,), dtype=dtype, buffer=coeffs_shm.buf)
+        results = np.ndarray((count,), dtype=dtype, buffer=results_shm.buf)
+        while True:
+            with _next_tile.get_lock():
+                index = _next_tile.value
+                _next_tile.value += 1
+            start = index * tile
+            if start >= count:
+                break
+
+            tile_start = time.perf_counter()
+            end = min(start + tile, count)
+            points = grid.points(first + start, first + end, dtype)
+            results[start:end] = kernel(coefficients, points, dtype)
+            busy_time += time.perf_counter() - tile_start
+            tiles_done += 1
+        del coefficients, results
+    finally:
+        coeffs_shm.close()
+        results_shm.close()
+    return os.getpid(), busy_time, tiles_done
+
+
+class ParallelEvaluator(object):
+    """
+    Równoległe obliczanie wartości wielomianu w puli procesów (odpowiednik
+    hornerScalarMultithreaded z App/horner.cpp). Współczynniki i wyniki znajdują się
+    w blokach multiprocessing.shared_memory, a obliczenia wykonuje współdzielona pula
+    procesów (get_worker_pool). Punkty dzielone są na kafelki (tile_size), które workery
+    pobierają ze wspólnego licznika, więc wolniejszy worker liczy po prostu mniej kafelków.
+    Punkty kafelka worker generuje sam z siatki (gui/grid.py) - nie ma wspólnej tablicy
+    punktów. Czas pracy każdego workera jest sumowany w busy_times.
+    """
+    def __init__(self, coefficients, workers, max_points, dtype=np.float32, scheme='horner'):
+        self.dtype = np.dtype(dtype)
+        self.scheme = scheme
+        self.workers = max(1, workers)
+        self.max_points = max_points
+        self.num_coeffs = len(coefficients)
+
+        itemsize = self.dtype.itemsize
+        self.coeffs_shm = shared_memory.SharedMemory(create=True, size=self.num_coeffs * itemsize)
+        self.results_shm = shared_memory.SharedMemory(create=True, size=max_points * itemsize)
+
+        self.coefficients = np.ndarray((self.num_coeffs,), dtype=self.dtype, buffer=self.coeffs_shm.buf)
+        self.coefficients[:] = coefficients
+        self.results = np.ndarray((max_points,), dtype=self.dtype, buffer=self.results_shm.buf)
+
+        get_worker_pool(self.workers)  # Utwórz pulę przed pomiarem czasu obliczeń
+        self.busy_times = {}  # pid workera -> czas pracy w sekundach
+
+    def evaluate_range(self, grid, first, last):
+        """
+        Oblicza wartości wielomianu w punktach siatki grid (PointGrid) o indeksach [first, last)
+        (co najwyżej max_points).
+
+        Zwraca kopię wyników, bufor współdzielony jest używany ponownie przy kolejnym wywołaniu.
+        """
+        count = last - first
+        if count > self.max_points:
+            raise ValueError(f"Too many points for the shared buffer: {count} > {self.max_points}")
+
+        tile = tile_size(self.num_coeffs, count, self.workers)
+
+        pool = get_worker_pool(self.workers)
+        with pool.lock:
+            with pool.next_tile.get_lock():
+                pool.next_tile.value = 0
+
+            # Jedno zadanie na workera - zadanie kończy się, gdy zabraknie kafelków
+            futures = [
+                pool.executor.submit(
+                    _evaluate_tiles, self.coeffs_shm.name, self.num_coeffs, self.results_shm.name,
+                    self.dtype.str, self.scheme, grid, first, count, tile
+                )
+                for _ in range(self.workers)
+            ]
+            for future in futures:
+                pid, busy_time, _ = future.result()
+                self.busy_times[pid] = self.busy_times.get(pid, 0.0) + busy_time
+
+        return self.results[:count].copy()
+
+    def worker_busy_times(self):
+        """Zwraca czasy pracy workerów w sekundach (po jednym na worker)."""
+        busy_times = list(self.busy_times.values())
+        return busy_times + [0.0] * (self.workers - len(busy_times))
+
+    def close(self):
+        # Pula procesów pozostaje otwarta dla kolejnych obliczeń (get_worker_pool)
+        # Widoki NumPy muszą zniknąć przed zamknięciem bloków pamięci
+        del self.coefficients, self.results
+        for shm in (self.coeffs_shm, self.results_shm):
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,19 +1,24 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from tkinter import messagebox
 
-def plot_results(app, points, results):
+def plot_results(app, grid, results):
     """
     Wyświetla wykres wyników wielomianu obliczonego metodą Hornera
     dla zadanych punktów.
 
     :param app: Referencja do głównej aplikacji (zawierająca m.in. zmienną generate_chart)
-    :param points: Lista punktów (x)
-    :param results: Lista wartości wielomianu w tych punktach (p(x))
+    :param grid: Siatka punktów (PointGrid z gui/grid.py) - punkty x są generowane tylko dla wyników
+    :param results: Lista wartości wielomianu w tych punktach (p(x)) lub macierz
+                    (punkty x wielomiany) w trybie wsadowym - jedna linia na wielomian
     """
     # Sprawdź, czy użytkownik w ogóle chce generować wykres
     if not app.generate_chart.get():
         return
 
+    # Liczba punktów siatki jest taka sama jak liczba wyników (count_points i countPoints z App/utils.cpp)
+    points = grid.points(0, len(results), np.float64)
+
     # Ustaw styl wykresu
     plt.style.use("seaborn-darkgrid")
 
@@ -31,7 +36,7 @@ def plot_results(app, points, results):
         markerfacecolor='white',
         markeredgewidth=1.2,
         markeredgecolor="#1C7ED6",
-        label='Polynomial Value'
+        label='Polynomial Value' if np.ndim(results) == 1 else None
     )
 
     # Opisy osi (z niewielkim zwiększeniem rozmiaru czcionki i pogrubieniem)
@@ -41,8 +46,9 @@ def plot_results(app, points, results):
     # Tytuł wykresu
     plt.title('Horner Polynomial Evaluation', fontsize=16, fontweight='bold')
 
-    # Dodaj legendę
-    plt.legend()
+    # Dodaj legendę (w trybie wsadowym linie nie są podpisywane)
+    if np.ndim(results) == 1:
+        plt.legend()
 
     # Włącz linie siatki
     plt.grid(True, linestyle='--', alpha=0.7)
@@ -0,0 +1,324 @@
+import os
+import csv
+import sys
+import html
+import time
+import argparse
+
+import numpy as np
+# Bez pyplot: Figure + FigureCanvasAgg rysują do pliku PNG bez wyświetlacza i nie zmieniają
+# globalnego backendu matplotlib (raport można tworzyć także w procesie GUI)
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from gui.grid import count_points
+from gui.experiment import CSV_FILENAME, EXIT_OK, EXIT_USAGE
+from gui.experiment_spec import DEFAULT_SPEC_FILE, load_spec
+
+
+# Domyślny katalog raportu (index.html + wykresy PNG)
+REPORT_DIR = "experiment_report"
+
+
+def load_results(csv_filename):
+    """
+    Wczytuje plik CSV eksperymentu (także scalony przez merge_results) do kolumn NumPy.
+    Nieudane uruchomienia (czas -1) są pomijane.
+
+    :return: Słownik kolumn: scenario, implementation (tablice str), avx (bool), threads (int), time (float64)
+    """
+    with open(csv_filename, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    columns = {
+        "scenario": np.array([row["scenario"] for row in rows], dtype=str),
+        "implementation": np.array([row["implementation"] for row in rows], dtype=str),
+        "avx": np.array([row["avx"] == "True" for row in rows], dtype=bool),
+        "threads": np.array([int(row["threads"]) for row in rows], dtype=np.int64),
+        "time": np.array([float(row["time_seconds"]) for row in rows], dtype=np.float64),
+    }
+    valid = columns["time"] >= 0
+    return {name: values[valid] for name, values in columns.items()}
+
+
+def _group(table, fields):
+    """
+    Numeruje grupy wierszy o tych samych wartościach pól (np.unique po każdym polu).
+
+    :return: Krotka (numer grupy każdego wiersza, indeks pierwszego wiersza każdej grupy)
+    """
+    codes = np.zeros(len(table[fields[0]]), dtype=np.int64)
+    for field in fields:
+        _, inverse = np.unique(table[field], return_inverse=True)
+        codes = codes * (inverse.max(initial=0) + 1) + inverse
+    _, first, groups = np.unique(codes, return_index=True, return_inverse=True)
+    return groups, first
+
+
+def configuration_medians(results):
+    """
+    Mediana czasu każdej konfiguracji (scenariusz, implementacja, AVX, wątki) - jedno sortowanie
+    wszystkich czasów według (grupa, czas), bez pętli po konfiguracjach.
+
+    :return: Tabela (słownik kolumn) konfiguracji z kolumnami median i samples
+    """
+    fields = ("scenario", "implementation", "avx", "threads")
+    groups, first = _group(results, fields)
+    counts = np.bincount(groups)
+    ordered = results["time"][np.lexsort((results["time"], groups))]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    median = (ordered[starts + (counts - 1) // 2] + ordered[starts + counts // 2]) / 2
+
+    table = {field: results[field][first] for field in fields}
+    table["median"] = median
+    table["samples"] = counts
+    # Kolejność wierszy: scenariusz, implementacja, AVX, wątki
+    order = np.lexsort((table["threads"], table["avx"], table["implementation"], table["scenario"]))
+    return {name: values[order] for name, values in table.items()}
+
+
+def _baseline(table, fields, select):
+    """
+    Dla każdego wiersza zwraca medianę wiersza bazowego z tej samej grupy (te same wartości fields),
+    wskazanego maską select (np. threads == 1). Gdy grupa nie ma wiersza bazowego - NaN.
+    """
+    groups, first = _group(table, fields)
+    baseline = np.full(len(first), np.nan)
+    baseline[groups[select]] = table["median"][select]
+    return baseline[groups]
+
+
+def add_scaling(table):
+    """
+    Dodaje kolumny speedup (T(1 wątek) / T(p)) i efficiency (speedup / p) - odniesieniem
+    jest ta sama implementacja i ustawienie AVX na jednym wątku.
+    """
+    t1 = _baseline(table, ("scenario", "implementation", "avx"), table["threads"] == 1)
+    table["speedup"] = t1 / table["median"]
+    table["efficiency"] = table["speedup"] / table["threads"]
+    return table
+
+
+def add_throughput(table, spec):
+    """
+    Dodaje kolumny throughput (punkty * współczynniki na sekundę) i gflops. Schemat Hornera
+    wykonuje n-1 mnożeń i n-1 dodawań na punkt (n współczynników). Rozmiary scenariuszy
+    pochodzą ze specyfikacji - scenariusze spoza niej mają NaN.
+    """
+    sizes = {
+        scenario["name"]: (count_points(scenario["points_min"], scenario["points_max"], scenario["points_step"]),
+                           scenario["coeff_n"])
+        for scenario in spec["scenarios"]
+    } if spec is not None else {}
+    points = np.array([sizes.get(name, (np.nan, np.nan))[0] for name in table["scenario"]], dtype=np.float64)
+    coeffs = np.array([sizes.get(name, (np.nan, np.nan))[1] for name in table["scenario"]], dtype=np.float64)
+    table["throughput"] = points * coeffs / table["median"]
+    table["gflops"] = 2.0 * (coeffs - 1) * points / table["median"] / 1e9
+    return table
+
+
+def ratios(table, fields, field, numerator, denominator):
+    """
+    Stosunek median T(field=numerator) / T(field=denominator) w grupach o tych samych fields,
+    np. AVX: ('scenario', 'implementation', 'threads'), 'avx', False, True.
+
+    :return: Tabela grup, w których są oba warianty, z kolumną ratio (> 1 - denominator szybszy)
+    """
+    numerator_time = _baseline(table, fields, table[field] == numerator)
+    denominator_time = _baseline(table, fields, table[field] == denominator)
+    _, first = _group(table, fields)
+    first = np.sort(first)
+    ratio = numerator_time[first] / denominator_time[first]
+    keep = np.isfinite(ratio)
+    result = {name: table[name][first][keep] for name in fields}
+    result["ratio"] = ratio[keep]
+    return result
+
+
+def fit_amdahl(table):
+    """
+    Dopasowuje prawo Amdahla T(p) = a + b / p (najmniejsze kwadraty po wszystkich liczbach wątków)
+    dla każdej pary (scenariusz, implementacja, AVX). Część sekwencyjna s = a / (a + b),
+    obcięta do [0, 1], a maksymalne przyspieszenie to 1 / s.
+
+    :return: Tabela z kolumnami serial_fraction i max_speedup (konfiguracje z co najmniej dwiema liczbami wątków)
+    """
+    fields = ("scenario", "implementation", "avx")
+    groups, first = _group(table, fields)
+    count = len(first)
+    # Układ normalny regresji liniowej T = a + b x, x = 1/p, dla wszystkich grup jednocześnie
+    x = 1.0 / table["threads"]
+    y = table["median"]
+    n = np.bincount(groups, minlength=count).astype(np.float64)
+    sx = np.bincount(groups, x, count)
+    sy = np.bincount(groups, y, count)
+    sxx = np.bincount(groups, x * x, count)
+    sxy = np.bincount(groups, x * y, count)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        determinant = n * sxx - sx * sx
+        b = (n * sxy - sx * sy) / determinant
+        a = (sy - b * sx) / n
+        serial = np.clip(a / (a + b), 0.0, 1.0)
+        max_speedup = 1.0 / serial
+
+    keep = np.sort(first[(n >= 2) & (determinant > 1e-12)])
+    result = {name: table[name][keep] for name in fields}
+    result["serial_fraction"] = serial[groups[keep]]
+    result["max_speedup"] = max_speedup[groups[keep]]
+    return result
+
+
+def _variant(table, i):
+    return f"{table['implementation'][i]}{' AVX' if table['avx'][i] else ''}"
+
+
+def _plot_per_scenario(table, field, ylabel, filename, ideal=None):
+    """
+    Zapisuje wykres PNG (backend Agg): jeden panel na scenariusz, linia field(wątki)
+    dla każdej implementacji i ustawienia AVX. ideal - funkcja p -> wartość idealna (linia przerywana).
+    """
+    scenarios = list(dict.fromkeys(table["scenario"]))
+    columns = min(len(scenarios), 3)
+    rows = -(-len(scenarios) // columns)
+    figure = Figure(figsize=(5 * columns, 4 * rows))
+    FigureCanvasAgg(figure)
+
+    for index, scenario in enumerate(scenarios):
+        axes = figure.add_subplot(rows, columns, index + 1)
+        in_scenario = np.flatnonzero(table["scenario"] == scenario)
+        variants = dict.fromkeys(_variant(table, i) for i in in_scenario)
+        for variant in variants:
+            rows_of_variant = [i for i in in_scenario if _variant(table, i) == variant]
+            axes.plot(table["threads"][rows_of_variant], table[field][rows_of_variant],
+                      marker="o", markersize=4, linewidth=1.5, label=variant)
+        if ideal is not None:
+            threads = np.unique(table["threads"][in_scenario])
+            axes.plot(threads, ideal(threads), color="gray", linestyle="--", linewidth=1, label="ideal")
+        axes.set_title(scenario, fontsize=12, fontweight="bold")
+        axes.set_xlabel("Threads")
+        axes.set_ylabel(ylabel)
+        axes.grid(True, linestyle="--", alpha=0.7)
+        axes.legend(fontsize=8)
+
+    figure.tight_layout()
+    figure.savefig(filename, dpi=100)
+
+
+def _format(value, digits):
+    if isinstance(value, (float, np.floating)):
+        return "" if not np.isfinite(value) else f"{value:.{digits}f}"
+    return str(value)
+
+
+def _html_table(table, columns):
+    """Tabela HTML z wybranych kolumn: lista krotek (nagłówek, kolumna, liczba miejsc po przecinku)."""
+    lines = ["<table>", "<tr>" + "".join(f"<th>{html.escape(header)}</th>" for header, _, _ in columns) + "</tr>"]
+    for i in range(len(table[columns[0][1]])):
+        cells = "".join(f"<td>{html.escape(_format(table[name][i], digits))}</td>" for _, name, digits in columns)
+        lines.append(f"<tr>{cells}</tr>")
+    lines.append("</table>")
+    return "\n".join(lines)
+
+
+def generate_report(csv_filename, output_dir=REPORT_DIR, spec=None):
+    """
+    Tworzy statyczny raport analizy wyników eksperymentu (bez GUI) w katalogu output_dir:
+    index.html z tabelami (mediany, przyspieszenie i efektywność względem 1 wątku,
+    przepustowość i GFLOP/s, stosunki AVX/skalarne i asm/cpp, dopasowanie prawa Amdahla)
+    oraz wykresy speedup.png, efficiency.png i gflops.png.
+
+    :param spec: Specyfikacja eksperymentu - rozmiary scenariuszy do przepustowości (None - bez przepustowości)
+    :return: Ścieżka pliku index.html
+    """
+    results = load_results(csv_filename)
+    if len(results["time"]) == 0:
+        raise ValueError(f"No successful runs in {csv_filename}")
+
+    table = add_throughput(add_scaling(configuration_medians(results)), spec)
+    avx = ratios(table, ("scenario", "implementation", "threads"), "avx", False, True)
+    asm = ratios(table, ("scenario", "avx", "threads"), "implementation", "cpp", "asm")
+    amdahl = fit_amdahl(table)
+
+    os.makedirs(output_dir, exist_ok=True)
+    _plot_per_scenario(table, "speedup", "Speedup vs 1 thread", os.path.join(output_dir, "speedup.png"),
+                       ideal=lambda p: p)
+    _plot_per_scenario(table, "efficiency", "Parallel efficiency", os.path.join(output_dir, "efficiency.png"),
+                       ideal=np.ones_like)
+    charts = ["speedup.png", "efficiency.png"]
+    if np.isfinite(table["gflops"]).any():
+        _plot_per_scenario(table, "gflops", "GFLOP/s", os.path.join(output_dir, "gflops.png"))
+        charts.append("gflops.png")
+
+    sections = [
+        ("Configurations", "Median time of each configuration; speedup and efficiency are relative to the same "
+                           "implementation and AVX setting on 1 thread.",
+         _html_table(table, [("Scenario", "scenario", 0), ("Implementation", "implementation", 0),
+                             ("AVX", "avx", 0), ("Threads", "threads", 0), ("Samples", "samples", 0),
+                             ("Median [s]", "median", 6), ("Speedup", "speedup", 2),
+                             ("Efficiency", "efficiency", 2), ("Points*coeffs/s", "throughput", 0),
+                             ("GFLOP/s", "gflops", 3)])),
+        ("Amdahl's law fit", "T(p) = a + b/p fitted over all thread counts; serial fraction s = a/(a+b), "
+                             "maximum speedup 1/s.",
+         _html_table(amdahl, [("Scenario", "scenario", 0), ("Implementation", "implementation", 0),
+                              ("AVX", "avx", 0), ("Serial fraction", "serial_fraction", 4),
+                              ("Max speedup", "max_speedup", 1)])),
+        ("AVX vs scalar", "T(scalar) / T(AVX) - above 1 means AVX is faster.",
+         _html_table(avx, [("Scenario", "scenario", 0), ("Implementation", "implementation", 0),
+                           ("Threads", "threads", 0), ("Ratio", "ratio", 2)])),
+        ("asm vs cpp", "T(cpp) / T(asm) - above 1 means asm is faster.",
+         _html_table(asm, [("Scenario", "scenario", 0), ("AVX", "avx", 0),
+                           ("Threads", "threads", 0), ("Ratio", "ratio", 2)])),
+    ]
+
+    body = ["<h1>Horner experiment report</h1>",
+            f"<p>Source: {html.escape(os.path.abspath(csv_filename))} ({len(results['time'])} successful runs), "
+            f"generated {time.strftime('%Y-%m-%d %H:%M:%S')}.</p>"]
+    body += [f'<img src="{chart}" alt="{chart}">' for chart in charts]
+    for title, description, content in sections:
+        body.append(f"<h2>{html.escape(title)}</h2>\n<p>{html.escape(description)}</p>\n{content}")
+
+    index = os.path.join(output_dir, "index.html")
+    with open(index, "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+                "<title>Horner experiment report</title>\n<style>\n"
+                "body { font-family: sans-serif; margin: 2em; }\n"
+                "table { border-collapse: collapse; margin-bottom: 2em; }\n"
+                "th, td { border: 1px solid #ccc; padding: 2px 8px; text-align: right; }\n"
+                "img { max-width: 100%; display: block; margin-bottom: 1em; }\n"
+                "</style>\n</head>\n<body>\n" + "\n".join(body) + "\n</body>\n</html>\n")
+    return index
+
+
+def main(argv=None):
+    """
+    Punkt wejścia python -m gui.report (lub python -m gui.experiment report): raport HTML/PNG
+    z pliku CSV eksperymentu, bez wyświetlacza. Zwraca kod wyjścia EXIT_OK lub EXIT_USAGE.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m gui.report",
+        description="Generate a static HTML/PNG speedup and efficiency report from experiment results."
+    )
+    parser.add_argument("input", nargs="?", default=CSV_FILENAME,
+                        help="experiment (or merged) CSV results file (default: %(default)s)")
+    parser.add_argument("-o", "--output", default=REPORT_DIR, help="report directory (default: %(default)s)")
+    parser.add_argument("--spec", default=DEFAULT_SPEC_FILE,
+                        help="experiment spec with scenario sizes for throughput (default: experiment.json)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    try:
+        spec = load_spec(args.spec)
+    except (OSError, ValueError) as e:
+        print(f"Throughput skipped - cannot load experiment spec: {e}", file=sys.stderr)
+        spec = None
+
+    try:
+        index = generate_report(args.input, args.output, spec)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Report failed: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    print(f"Report saved to {index}")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
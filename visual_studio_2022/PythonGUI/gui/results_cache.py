@@ -0,0 +1,145 @@
+import os
+import shutil
+import struct
+import hashlib
+import threading
+
+import numpy as np
+
+import gui.config as conf
+from gui.results_io import BinaryResultsWriter, TextResultsWriter, read_results
+
+
+# Pamięć podręczna wyników na dysku (conf.RESULTS_CACHE_DIR). Każdy wpis to plik w formacie
+# binarnym wyników (gui/results_io.py) o nazwie <skrót>.hrnb, gdzie skrót SHA-256 obejmuje
+# współczynniki (float64), trójkę start/end/step, precyzję, schemat i liczbę kolumn wyników
+# (schematy różnią się błędami zaokrągleń, więc ich wyniki nie są wymienne).
+# Kolejność LRU wyznacza czas modyfikacji pliku (odświeżany przy każdym trafieniu).
+ENTRY_SUFFIX = '.hrnb'
+
+_stats = {'hits': 0, 'misses': 0}
+_lock = threading.Lock()
+
+
+def cache_key(coefficients, start, end, step, dtype, scheme, columns=1):
+    """Zwraca skrót (hex) danych wejściowych, od których zależą wyniki."""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(coefficients, dtype='<f8').tobytes())
+    digest.update(struct.pack('<dddHI', start, end, step, np.dtype(dtype).itemsize, columns))
+    digest.update(scheme.encode('ascii'))
+    return digest.hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(conf.RESULTS_CACHE_DIR, key + ENTRY_SUFFIX)
+
+
+def lookup(key):
+    """
+    Szuka wpisu w pamięci podręcznej i aktualizuje liczniki trafień i chybień.
+
+    Zwraca ścieżkę pliku wyników albo None.
+    """
+    path = _entry_path(key)
+    with _lock:
+        try:
+            os.utime(path)  # Odśwież pozycję w kolejności LRU
+        except OSError:
+            _stats['misses'] += 1
+            return None
+        _stats['hits'] += 1
+    return path
+
+
+def fits(count, dtype, columns=1):
+    """Sprawdza, czy wyniki nie są zbyt duże na pojedynczy wpis (conf.RESULTS_CACHE_MAX_ENTRY_BYTES)."""
+    return count * columns * np.dtype(dtype).itemsize <= conf.RESULTS_CACHE_MAX_ENTRY_BYTES
+
+
+class CacheWriter(object):
+    """
+    Zapisuje wyniki obliczenia do nowego wpisu równolegle z plikiem wyników użytkownika.
+    Wpis staje się widoczny dopiero po commit (plik tymczasowy + os.replace),
+    więc przerwane obliczenia nie zostawiają niepełnych wpisów.
+    """
+    def __init__(self, key, dtype, start, end, step, columns=1):
+        os.makedirs(conf.RESULTS_CACHE_DIR, exist_ok=True)
+        self.path = _entry_path(key)
+        self.tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self.writer = BinaryResultsWriter(self.tmp_path, dtype, start, end, step, columns)
+
+    def write(self, results):
+        self.writer.write(results)
+
+    def commit(self):
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+        evict()
+
+    def discard(self):
+        self.writer.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def evict(max_bytes=None):
+    """Usuwa najdawniej używane wpisy, aż łączny rozmiar nie przekracza conf.RESULTS_CACHE_MAX_BYTES."""
+    max_bytes = conf.RESULTS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    with _lock:
+        try:
+            names = os.listdir(conf.RESULTS_CACHE_DIR)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            path = os.path.join(conf.RESULTS_CACHE_DIR, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def copy_results(path, output_file, results_format):
+    """
+    Zapisuje wyniki z wpisu do pliku wyników użytkownika. Format binarny to kopia pliku
+    (nagłówek jest identyczny), format tekstowy jest tworzony blokami conf.POINTS_CHUNK_SIZE.
+    """
+    if results_format == 'binary':
+        shutil.copyfile(path, output_file)
+        return
+
+    results = read_results(path)
+    writer = TextResultsWriter(output_file)
+    try:
+        for first in range(0, len(results), conf.POINTS_CHUNK_SIZE):
+            writer.write(results[first:first + conf.POINTS_CHUNK_SIZE])
+    finally:
+        writer.close()
+        del results
+
+
+def stats():
+    """Zwraca krotkę (trafienia, chybienia) w tym procesie."""
+    with _lock:
+        return _stats['hits'], _stats['misses']
+
+
+def clear():
+    """Usuwa wszystkie wpisy i zeruje liczniki."""
+    with _lock:
+        shutil.rmtree(conf.RESULTS_CACHE_DIR, ignore_errors=True)
+        _stats['hits'] = 0
+        _stats['misses'] = 0
@@ -0,0 +1,122 @@
+import struct
+
+import numpy as np
+
+
+# Format binarny wyników (little-endian), zgodny z writeResultsBinaryHeader z App/utils.cpp:
+#   magic    4s   b'HRNB'
+#   version  u16  wersja formatu
+#   itemsize u16  4 (float32) lub 8 (float64)
+#   columns  u32  liczba kolumn wyników na punkt
+#   reserved u32  0
+#   count    u64  liczba punktów (wierszy)
+#   start    f64  pierwszy punkt zakresu
+#   end      f64  ostatni punkt zakresu
+#   step     f64  krok między punktami
+# Po nagłówku następują surowe dane count x columns zapisane wierszami.
+RESULTS_MAGIC = b'HRNB'
+RESULTS_VERSION = 1
+HEADER_FORMAT = '<4sHHIIQddd'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+COUNT_OFFSET = struct.calcsize('<4sHHII')
+
+RESULTS_FORMATS = ('text', 'binary')
+
+_DTYPES = {
+    4: np.dtype('<f4'),
+    8: np.dtype('<f8'),
+}
+
+
+class TextResultsWriter(object):
+    """Zapisuje wyniki tekstowo, jedna wartość w linii (format writeResultsChunk z App/utils.cpp)."""
+    def __init__(self, filename):
+        self.file = open(filename, 'w')
+
+    def write(self, results):
+        np.savetxt(self.file, results, fmt='%.6g')
+
+    def close(self):
+        self.file.close()
+
+
+class BinaryResultsWriter(object):
+    """
+    Strumieniowo zapisuje wyniki w formacie binarnym. Liczba punktów w nagłówku
+    jest uzupełniana przy zamknięciu pliku.
+    """
+    def __init__(self, filename, dtype, start, end, step, columns=1):
+        self.dtype = np.dtype(dtype).newbyteorder('<')
+        self.columns = columns
+        self.count = 0
+        self.file = open(filename, 'wb')
+        self.file.write(struct.pack(
+            HEADER_FORMAT, RESULTS_MAGIC, RESULTS_VERSION, self.dtype.itemsize,
+            columns, 0, 0, start, end, step
+        ))
+
+    def write(self, results):
+        results = np.ascontiguousarray(results, dtype=self.dtype)
+        self.file.write(results.tobytes())
+        self.count += len(results)
+
+    def close(self):
+        self.file.seek(COUNT_OFFSET)
+        self.file.write(struct.pack('<Q', self.count))
+        self.file.close()
+
+
+def open_results_writer(filename, results_format, dtype, start, end, step, columns=1):
+    """
+    Tworzy obiekt zapisujący wyniki w wybranym formacie ('text' lub 'binary').
+    """
+    if results_format == 'binary':
+        return BinaryResultsWriter(filename, dtype, start, end, step, columns)
+    if results_format == 'text':
+        return TextResultsWriter(filename)
+    raise ValueError(f"Unsupported results format: {results_format}")
+
+
+def read_results_header(filename):
+    """
+    Odczytuje nagłówek binarnego pliku wyników.
+
+    Zwraca słownik z polami nagłówka lub None, jeżeli plik nie jest w formacie binarnym.
+    """
+    with open(filename, 'rb') as f:
+        data = f.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE or data[:4] != RESULTS_MAGIC:
+        return None
+
+    magic, version, itemsize, columns, _, count, start, end, step = struct.unpack(HEADER_FORMAT, data)
+    if version != RESULTS_VERSION:
+        raise ValueError(f"Unsupported results file version: {version}")
+    if itemsize not in _DTYPES:
+        raise ValueError(f"Unsupported results item size: {itemsize}")
+
+    return {
+        'dtype': _DTYPES[itemsize],
+        'columns': columns,
+        'count': count,
+        'start': start,
+        'end': end,
+        'step': step,
+    }
+
+
+def read_results(filename):
+    """
+    Wczytuje wyniki z pliku, rozpoznając format po nagłówku.
+
+    Pliki binarne są otwierane przez numpy.memmap (bez kopiowania danych),
+    pliki tekstowe są wczytywane przez numpy.loadtxt.
+    """
+    header = read_results_header(filename)
+    if header is None:
+        return np.loadtxt(filename, dtype=np.float64, ndmin=1)
+
+    if header['count'] == 0:
+        return np.empty(0, dtype=header['dtype'])
+
+    shape = (header['count'],) if header['columns'] == 1 else (header['count'], header['columns'])
+    return np.memmap(filename, dtype=header['dtype'], mode='r', offset=HEADER_SIZE, shape=shape)
@@ -0,0 +1,122 @@
+import numpy as np
+
+import gui.config as conf
+
+
+# Pierwszy niepusty wiersz pliku w formacie rzadkim (App/utils.cpp sprawdza ten sam nagłówek).
+# Dla np.loadtxt to komentarz, więc nie trzeba go pomijać przy wczytywaniu danych.
+SPARSE_HEADER = '# sparse'
+
+
+def parse_sparse_coefficients(data, filename=''):
+    """
+    Zamienia wiersze rzadkiego pliku .coeffs (pary "stopień wartość") na gęstą tablicę
+    współczynników (coefficients[0] to wyraz wolny). Powtórzone stopnie są sumowane.
+
+    :param data: Tablica (k x 2) wczytana z pliku
+    :return: Tablica współczynników float64 o długości najwyższy stopień + 1
+    """
+    degrees = data[:, 0]
+    if np.any(degrees < 0) or np.any(degrees != np.floor(degrees)):
+        raise ValueError(f"Invalid degree in sparse coefficients file: {filename}")
+
+    degrees = degrees.astype(np.int64)
+    coefficients = np.zeros(int(degrees.max()) + 1, dtype=np.float64)
+    np.add.at(coefficients, degrees, data[:, 1])
+    return coefficients
+
+
+def is_sparse_format(filename):
+    """
+    Sprawdza, czy plik .coeffs jest w formacie rzadkim, tj. czy jego pierwszy niepusty
+    wiersz to nagłówek SPARSE_HEADER. Plik bez nagłówka jest zawsze gęsty - o formacie
+    nie decyduje liczba wartości w pierwszym wierszu danych.
+    """
+    with open(filename, 'r') as f:
+        for line in f:
+            if line.strip():
+                return line.strip() == SPARSE_HEADER
+    return False
+
+
+def nonzero_terms(coefficients):
+    """Zwraca krotkę (stopnie, wartości) niezerowych wyrazów wielomianu (rosnąco po stopniu)."""
+    coefficients = np.asarray(coefficients)
+    degrees = np.flatnonzero(coefficients)
+    return degrees, coefficients[degrees]
+
+
+def _power_cost(exponent):
+    """Liczba mnożeń potęgowania przez podnoszenie do kwadratu (x^exponent)."""
+    return exponent.bit_length() - 1 + bin(exponent).count('1') - 1
+
+
+def sparse_cost(degrees):
+    """
+    Szacunkowa liczba operacji wektorowych na punkt dla horner_sparse: dla każdej luki
+    między kolejnymi niezerowymi wyrazami potęgowanie x^luka oraz mnożenie z dodawaniem.
+    """
+    if len(degrees) == 0:
+        return 0
+    gaps = np.diff(degrees).tolist()
+    cost = sum(_power_cost(gap) + 2 for gap in gaps)
+    if degrees[0] > 0:
+        cost += _power_cost(int(degrees[0])) + 1
+    return cost
+
+
+def should_use_sparse(coefficients, sparse_format=False):
+    """
+    Decyduje, czy obliczać wielomian schematem rzadkim. Wielomian z pliku w formacie
+    rzadkim jest kandydatem zawsze, a z pliku gęstego - gdy udział zerowych współczynników
+    wynosi co najmniej conf.SPARSE_MIN_ZERO_RATIO. Schemat rzadki jest wybierany tylko wtedy,
+    gdy jest tańszy od zwykłego schematu Hornera (2 operacje na współczynnik).
+    """
+    n = len(coefficients)
+    degrees, _ = nonzero_terms(coefficients)
+    if not sparse_format and (n - len(degrees)) < conf.SPARSE_MIN_ZERO_RATIO * n:
+        return False
+    return sparse_cost(degrees) < 2 * n
+
+
+def _power(points, exponent):
+    """Oblicza points^exponent przez podnoszenie do kwadratu (jak w schemacie Hornera - same mnożenia)."""
+    result = None
+    base = points
+    while True:
+        if exponent & 1:
+            result = base.copy() if result is None else np.multiply(result, base, out=result)
+        exponent >>= 1
+        if not exponent:
+            return result
+        base = base * base
+
+
+def horner_sparse(coefficients, points, dtype=np.float32):
+    """
+    Oblicza wartości wielomianu tylko na podstawie niezerowych wyrazów: schemat Hornera
+    względem kolejnych niezerowych współczynników, w którym mnożenie przez x zastępuje
+    mnożenie przez x^luka (luka - różnica stopni sąsiednich wyrazów). Dla x^50000 + 1
+    to kilkadziesiąt operacji na punkt zamiast 50 001.
+
+    :param coefficients: Współczynniki wielomianu (coefficients[0] to wyraz wolny)
+    :param points: Tablica punktów (x)
+    :param dtype: Precyzja obliczeń (np.float32 lub np.float64)
+    :return: Tablica wartości wielomianu w punktach
+    """
+    degrees, values = nonzero_terms(np.asarray(coefficients, dtype=dtype))
+    points = np.asarray(points, dtype=dtype)
+
+    results = np.zeros(points.shape, dtype=dtype)
+    if len(degrees) == 0:
+        return results
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        results += values[-1]
+        for i in range(len(degrees) - 2, -1, -1):
+            gap = int(degrees[i + 1] - degrees[i])
+            np.multiply(results, points if gap == 1 else _power(points, gap), out=results)
+            results += values[i]
+        if degrees[0] > 0:
+            np.multiply(results, _power(points, int(degrees[0])), out=results)
+    return results
@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+
+
+# Mnożnik rozstępu międzykwartylowego w regule Tukeya (granice Q1 - k*IQR, Q3 + k*IQR)
+OUTLIER_IQR_FACTOR = 1.5
+
+
+def median_ci_ranks(n, confidence=0.95):
+    """
+    Zwraca pozycje (l, u) statystyk pozycyjnych (numeracja od 1) wyznaczających przedział ufności
+    mediany bez założeń o rozkładzie: liczba próbek poniżej mediany ma rozkład Bin(n, 1/2),
+    więc [x_(l), x_(u)] pokrywa medianę z prawdopodobieństwem 1 - 2 P(B <= l - 1).
+    Dla zbyt małej liczby próbek (np. n < 6 przy 95%) zwraca None.
+    """
+    alpha = 1.0 - confidence
+    cumulative = 0.0
+    lower = 0
+    for i in range(n + 1):
+        cumulative += math.comb(n, i) / 2.0 ** n
+        if cumulative > alpha / 2:
+            break
+        lower = i + 1
+    if lower < 1:
+        return None
+    return lower, n - lower + 1
+
+
+def median_ci(samples, confidence=0.95):
+    """Przedział ufności mediany (krotka (dolna, górna) granica) albo None przy zbyt małej liczbie próbek."""
+    ranks = median_ci_ranks(len(samples), confidence)
+    if ranks is None:
+        return None
+    ordered = np.sort(samples)
+    return float(ordered[ranks[0] - 1]), float(ordered[ranks[1] - 1])
+
+
+def relative_ci_width(samples, confidence=0.95):
+    """Szerokość przedziału ufności mediany względem mediany (inf, gdy przedziału nie da się wyznaczyć)."""
+    ci = median_ci(samples, confidence)
+    median = float(np.median(samples)) if len(samples) else 0.0
+    if ci is None or median <= 0:
+        return math.inf
+    return (ci[1] - ci[0]) / median
+
+
+def outlier_mask(samples):
+    """Oznacza próbki spoza granic Tukeya (Q1 - 1.5 IQR, Q3 + 1.5 IQR) - oznaczane, nie usuwane."""
+    samples = np.asarray(samples, dtype=np.float64)
+    if len(samples) < 4:
+        return np.zeros(len(samples), dtype=bool)
+    q1, q3 = np.percentile(samples, [25, 75])
+    iqr = q3 - q1
+    return (samples < q1 - OUTLIER_IQR_FACTOR * iqr) | (samples > q3 + OUTLIER_IQR_FACTOR * iqr)
+
+
+def summarize(samples, confidence=0.95):
+    """
+    Statystyki czasów jednej konfiguracji: mediana, 95. percentyl, średnia, odchylenie
+    standardowe (próbkowe), przedział ufności mediany i jego szerokość względna oraz maska wartości odstających.
+
+    :return: Słownik statystyk (None dla wartości, których nie da się wyznaczyć)
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if len(samples) == 0:
+        return {'samples': 0, 'median': None, 'p95': None, 'mean': None, 'stddev': None,
+                'ci_low': None, 'ci_high': None, 'ci_rel_width': None, 'outliers': np.zeros(0, dtype=bool)}
+
+    ci = median_ci(samples, confidence)
+    width = relative_ci_width(samples, confidence)
+    return {
+        'samples': len(samples),
+        'median': float(np.median(samples)),
+        'p95': float(np.percentile(samples, 95)),
+        'mean': float(np.mean(samples)),
+        'stddev': float(np.std(samples, ddof=1)) if len(samples) > 1 else 0.0,
+        'ci_low': ci[0] if ci is not None else None,
+        'ci_high': ci[1] if ci is not None else None,
+        'ci_rel_width': width if math.isfinite(width) else None,
+        'outliers': outlier_mask(samples),
+    }
@@ -0,0 +1,29 @@
+import unittest
+
+import numpy as np
+
+from gui.batch import BatchEvaluator
+from gui.engine import horner
+
+
+class BatchEvaluatorTest(unittest.TestCase):
+    def test_mixed_degrees_match_horner_outside_unit_interval(self):
+        # Wielomian stopnia 3 w jednej paczce z wielomianem stopnia 199: x^199 przepełnia się
+        # dla |x| > 1, ale krótszy wielomian musi mieć wartości takie jak przy osobnym obliczeniu
+        rng = np.random.default_rng(1)
+        cubic = np.array([3.0, -2.0, 1.0, -4.0])
+        high = rng.uniform(-1, 1, 200)
+        matrix = np.zeros((len(high), 2))
+        matrix[:len(cubic), 0] = cubic
+        matrix[:, 1] = high
+
+        for dtype in (np.float32, np.float64):
+            points = np.array([-100.0, -1.5, 0.0, 2.0, 100.0], dtype=dtype)
+            results = BatchEvaluator(matrix, dtype).evaluate(points)
+            self.assertTrue(np.all(np.isfinite(results[:, 0])))
+            np.testing.assert_allclose(results[:, 0], horner(cubic, points, dtype), rtol=1e-6)
+            np.testing.assert_array_equal(np.isnan(results[:, 1]), np.isnan(horner(high, points, dtype)))
+
+
+if __name__ == '__main__':
+    unittest.main()
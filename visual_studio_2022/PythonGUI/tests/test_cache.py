@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import gui.config as conf
+from gui import incremental, results_cache
+from gui.engine import compute_from_config, horner
+from gui.file_utils import write_config_file
+from gui.grid import PointGrid
+from gui.results_io import read_results
+
+
+def _kernel(coefficients, points, dtype):
+    return horner(coefficients, points, dtype)
+
+
+class ResultsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(conf, 'RESULTS_CACHE_DIR', os.path.join(self.tmp.name, 'cache'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        results_cache.clear()
+        incremental.forget()
+        self.addCleanup(incremental.forget)
+
+        self.coefficients_file = os.path.join(self.tmp.name, 'poly.coeffs')
+        np.savetxt(self.coefficients_file, np.random.default_rng(8).uniform(-1, 1, 30), fmt='%.17g')
+        self.points_file = os.path.join(self.tmp.name, 'grid.points')
+        with open(self.points_file, 'w') as f:
+            f.write("-1 1 0.0001\n")
+
+    def _compute(self, output_file, results_format='binary'):
+        config_file = write_config_file(
+            'numpy', False, 1, False, True, False, output_file, self.coefficients_file, self.points_file,
+            results_format=results_format, job_dir=self.tmp.name
+        )
+        return compute_from_config(config_file, progress_callback=lambda progress: None)
+
+    def test_second_run_is_served_from_cache(self):
+        first = os.path.join(self.tmp.name, 'first.out')
+        second = os.path.join(self.tmp.name, 'second.out')
+        self._compute(first)
+        # Bez zapamiętanego obliczenia - trafienie musi pochodzić z pamięci podręcznej na dysku
+        incremental.forget()
+        hits, _ = results_cache.stats()
+
+        self.assertEqual(self._compute(second), 0.0)
+        self.assertEqual(results_cache.stats()[0], hits + 1)
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_cached_text_results_match_binary(self):
+        binary = os.path.join(self.tmp.name, 'results.bin')
+        text = os.path.join(self.tmp.name, 'results.txt')
+        self._compute(binary)
+        incremental.forget()
+        self._compute(text, 'text')
+        expected = read_results(binary)
+        np.testing.assert_allclose(read_results(text), expected, rtol=1e-5, atol=1e-6)
+        del expected
+
+    def test_eviction_removes_least_recently_used(self):
+        self._compute(os.path.join(self.tmp.name, 'results.out'))
+        self.assertEqual(len(os.listdir(conf.RESULTS_CACHE_DIR)), 1)
+        results_cache.evict(max_bytes=0)
+        self.assertEqual(os.listdir(conf.RESULTS_CACHE_DIR), [])
+
+
+class IncrementalTest(unittest.TestCase):
+    def setUp(self):
+        incremental.forget()
+        self.addCleanup(incremental.forget)
+        rng = np.random.default_rng(9)
+        self.coefficients = rng.uniform(-1, 1, 200)
+        self.grid = PointGrid(-1.0, 1.0, 0.001)
+        results = horner(self.coefficients, self.grid.points(0, len(self.grid), np.float64), np.float64)
+        incremental.remember(self.coefficients, self.grid.start, self.grid.step, results, 'horner')
+
+    def test_changed_coefficients(self):
+        changed = self.coefficients.copy()
+        changed[[3, 150]] += [0.5, -0.25]
+        update = incremental.try_update(changed, self.grid, np.float64, _kernel, 'horner')
+        self.assertIsNotNone(update)
+        expected = horner(changed, self.grid.points(0, len(self.grid), np.float64), np.float64)
+        np.testing.assert_allclose(update[0], expected, rtol=1e-12, atol=1e-12)
+
+    def test_extended_range(self):
+        grid = PointGrid(-1.05, 1.0, 0.001)
+        update = incremental.try_update(self.coefficients, grid, np.float64, _kernel, 'horner')
+        self.assertIsNotNone(update)
+        expected = horner(self.coefficients, grid.points(0, len(grid), np.float64), np.float64)
+        np.testing.assert_allclose(update[0], expected, rtol=1e-12, atol=1e-12)
+
+    def test_incompatible_grid_or_scheme_is_not_updated(self):
+        self.assertIsNone(incremental.try_update(
+            self.coefficients, PointGrid(-1.0, 1.0, 0.002), np.float64, _kernel, 'horner'))
+        self.assertIsNone(incremental.try_update(self.coefficients, self.grid, np.float64, _kernel, 'blocked'))
+        self.assertIsNone(incremental.try_update(self.coefficients, self.grid, np.float32, _kernel, 'horner'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+import numpy as np
+
+import gui.config as conf
+from gui.engine import horner, horner_blocked, horner_derivatives, horner_progression
+from gui.grid import PointGrid
+from gui.multipoint import evaluate_multipoint
+from gui.parallel import ParallelEvaluator, shutdown_worker_pool
+from gui.sparse import horner_sparse
+
+
+def _reference(coefficients, points):
+    """Wartości wielomianu i suma modułów wyrazów (skala błędu schematu Hornera) w long double."""
+    coefficients = np.asarray(coefficients, dtype=np.longdouble)
+    points = np.asarray(points, dtype=np.longdouble)
+    values = horner(coefficients, points, np.longdouble)
+    scale = horner(np.abs(coefficients), np.abs(points), np.longdouble)
+    return values, scale
+
+
+class ProgressionTest(unittest.TestCase):
+    def test_matches_horner_up_to_max_coeffs(self):
+        rng = np.random.default_rng(2)
+        for start, end, step in ((-3.0, 3.0, 0.1), (-10.0, 10.0, 0.01)):
+            grid = np.arange(start, end + step / 2, step)
+            for n in range(2, conf.PROGRESSION_MAX_COEFFS + 1):
+                coefficients = rng.uniform(-1, 1, n)
+                for dtype, tolerance in ((np.float64, 1e-12), (np.float32, 1e-5)):
+                    points = grid.astype(dtype)
+                    expected, scale = _reference(coefficients, points)
+                    error = np.abs(horner_progression(coefficients, points, dtype) - expected) / scale
+                    self.assertLess(float(error.max()), tolerance, (start, end, step, n, dtype))
+
+    def test_high_degree_falls_back_to_horner(self):
+        coefficients = np.random.default_rng(3).uniform(-1, 1, 32)
+        points = np.arange(-3.0, 3.05, 0.1)
+        np.testing.assert_array_equal(
+            horner_progression(coefficients, points, np.float64), horner(coefficients, points, np.float64)
+        )
+
+
+class BlockedTest(unittest.TestCase):
+    def test_matches_horner(self):
+        rng = np.random.default_rng(4)
+        grid = np.linspace(-1.05, 1.05, 1001)
+        for n in (1, 2, 10, 101, 1000):
+            coefficients = rng.uniform(-1, 1, n)
+            for dtype, tolerance in ((np.float64, 1e-13), (np.float32, 1e-4)):
+                points = grid.astype(dtype)
+                expected, scale = _reference(coefficients, points)
+                error = np.abs(horner_blocked(coefficients, points, dtype) - expected) / scale
+                self.assertLess(float(error.max()), tolerance, (n, dtype))
+
+    def test_overflow_gives_inf_like_horner(self):
+        # x^m przepełnia się - łączenie bloków nie może dawać 0 * inf = NaN
+        coefficients = np.ones(400)
+        points = np.array([-1e30, 1e30, 50.0], dtype=np.float32)
+        results = horner_blocked(coefficients, points, np.float32)
+        np.testing.assert_array_equal(results, horner(coefficients, points, np.float32))
+        self.assertFalse(np.any(np.isnan(results)))
+
+
+class SparseTest(unittest.TestCase):
+    def test_matches_horner(self):
+        coefficients = np.zeros(51)
+        coefficients[[0, 7, 50]] = [-1.0, 3.0, 0.5]
+        points = np.linspace(-1.05, 1.05, 501)
+        np.testing.assert_allclose(
+            horner_sparse(coefficients, points, np.float64), horner(coefficients, points, np.float64), rtol=1e-12
+        )
+
+
+class MultipointTest(unittest.TestCase):
+    def test_matches_horner(self):
+        coefficients = np.random.default_rng(5).uniform(-1, 1, 300)
+        points = np.linspace(-1.2, 1.2, 2001)
+        expected, scale = _reference(coefficients, points)
+        error = np.abs(evaluate_multipoint(coefficients, points) - expected) / scale
+        self.assertLess(float(error.max()), 1e-13)
+
+
+class DerivativesTest(unittest.TestCase):
+    def test_matches_polyder(self):
+        coefficients = np.random.default_rng(6).uniform(-1, 1, 12)
+        points = np.linspace(-2, 2, 101)
+        results = horner_derivatives(coefficients, points, 3, np.float64)
+        polynomial = np.polynomial.Polynomial(coefficients)
+        for j in range(4):
+            np.testing.assert_allclose(results[:, j], polynomial.deriv(j)(points), rtol=1e-9, atol=1e-9)
+
+
+class ParallelEvaluatorTest(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_worker_pool()
+
+    def test_matches_horner(self):
+        coefficients = np.random.default_rng(7).uniform(-1, 1, 20)
+        grid = PointGrid(-1.0, 1.0, 1e-4)
+        with ParallelEvaluator(coefficients, 3, len(grid), np.float64) as evaluator:
+            for first, last in ((0, len(grid)), (100, 5000)):
+                np.testing.assert_array_equal(
+                    evaluator.evaluate_range(grid, first, last),
+                    horner(coefficients, grid.points(first, last, np.float64), np.float64)
+                )
+            self.assertEqual(len(evaluator.worker_busy_times()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
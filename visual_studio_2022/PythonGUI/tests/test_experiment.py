@@ -0,0 +1,104 @@
+import os
+import csv
+import tempfile
+import unittest
+from unittest import mock
+
+import gui.config as conf
+from gui.experiment import (
+    fingerprint, merge_results, metadata_filename, run_scenarios, summary_filename, _read_metadata
+)
+from gui.experiment_spec import expand_matrix, select_shard, validate_spec
+
+
+def _spec():
+    return validate_spec({
+        "scenarios": [
+            {"name": "Small", "coeff_n": 8, "coeff_min": -1, "coeff_max": 1,
+             "points_min": -1, "points_max": 1, "points_step": 0.01, "seed": 1},
+        ],
+        "implementations": ["numpy", "multipoint"],
+        "avx": [False],
+        "threads": [1],
+        "runs": 2,
+    })
+
+
+def _read_rows(filename):
+    with open(filename, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class ExperimentTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(conf, 'TEMP_DIR', os.path.join(self.tmp.name, 'temp'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _csv(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_shards_partition_the_matrix(self):
+        configurations = expand_matrix(validate_spec(dict(_spec(), threads="1-5")))
+        shards = [select_shard(configurations, index, 3) for index in (1, 2, 3)]
+        self.assertEqual(sorted(sum(shards, []), key=configurations.index), configurations)
+        self.assertEqual(sum(len(shard) for shard in shards), len(configurations))
+
+    def test_interrupted_experiment_resumes_without_repeating_runs(self):
+        filename = self._csv('results.csv')
+
+        def interrupt(done, total, row):
+            if done == 2:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            run_scenarios(filename, _spec(), progress_callback=interrupt)
+        self.assertEqual(len(_read_rows(filename)), 2)
+        self.assertIsNone(_read_metadata(filename)["finished"])
+
+        new_runs = []
+        done, failed = run_scenarios(filename, _spec(), progress_callback=lambda *args: new_runs.append(args))
+        rows = _read_rows(filename)
+        self.assertEqual((done, failed), (4, 0))
+        self.assertEqual(len(new_runs), 2)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(len({fingerprint(row) for row in rows}), 4)
+        metadata = _read_metadata(filename)
+        self.assertIsNotNone(metadata["finished"])
+        self.assertEqual(metadata["resumed"], 1)
+        self.assertTrue(os.path.exists(summary_filename(filename)))
+
+    def test_resume_rejects_different_spec(self):
+        filename = self._csv('results.csv')
+
+        def interrupt(done, total, row):
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            run_scenarios(filename, _spec(), progress_callback=interrupt)
+        with self.assertRaises(ValueError):
+            run_scenarios(filename, dict(_spec(), runs=3))
+
+    def test_merge_shards(self):
+        parts = [self._csv(f'part{index}.csv') for index in (1, 2)]
+        for index, filename in enumerate(parts, 1):
+            run_scenarios(filename, _spec(), shard=(index, 2))
+
+        merged = self._csv('merged.csv')
+        rows, missing = merge_results(parts, merged)
+        self.assertEqual((rows, missing), (4, []))
+        merged_rows = _read_rows(merged)
+        self.assertEqual({row["shard"] for row in merged_rows}, {"1/2", "2/2"})
+        self.assertEqual({row["implementation"] for row in merged_rows}, {"numpy", "multipoint"})
+        self.assertTrue(os.path.exists(metadata_filename(merged)))
+
+        # Brakująca część jest zgłaszana, powtórzona - odrzucana
+        self.assertEqual(merge_results(parts[:1], merged), (2, [2]))
+        with self.assertRaises(ValueError):
+            merge_results([parts[0], parts[0]], merged)
+
+
+if __name__ == '__main__':
+    unittest.main()
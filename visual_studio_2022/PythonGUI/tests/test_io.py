@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import gui.config as conf
+from gui import coeffs_cache
+from gui.engine import compute_from_config, horner, read_computation_time
+from gui.file_utils import write_config_file
+from gui.grid import PointGrid
+from gui.results_io import BinaryResultsWriter, TextResultsWriter, read_results, read_results_header
+
+
+class ResultsIoTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_binary_round_trip(self):
+        filename = os.path.join(self.tmp.name, 'results.out')
+        values = np.arange(12, dtype=np.float64).reshape(6, 2)
+        writer = BinaryResultsWriter(filename, np.float64, -1.0, 1.0, 0.4, columns=2)
+        writer.write(values[:4])
+        writer.write(values[4:])
+        writer.close()
+
+        header = read_results_header(filename)
+        self.assertEqual((header['count'], header['columns'], header['step']), (6, 2, 0.4))
+        results = read_results(filename)
+        np.testing.assert_array_equal(results, values)
+        del results
+
+    def test_text_round_trip(self):
+        filename = os.path.join(self.tmp.name, 'results.out')
+        writer = TextResultsWriter(filename)
+        writer.write(np.array([1.5, -2.25, 3e10]))
+        writer.close()
+        self.assertIsNone(read_results_header(filename))
+        np.testing.assert_array_equal(read_results(filename), [1.5, -2.25, 3e10])
+
+    def test_computation_error_marker(self):
+        # Znacznik błędu serwera C++ (writeComputationError) zamiast czasu obliczeń
+        filename = os.path.join(self.tmp.name, 'computation.time')
+        with open(filename, 'w') as f:
+            f.write("error: Failed to write results to file: results.out\n")
+        with self.assertRaisesRegex(ValueError, "Failed to write results"):
+            read_computation_time(filename)
+
+
+class CoefficientsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        coeffs_cache.invalidate()
+        self.addCleanup(coeffs_cache.invalidate)
+
+    def _write(self, name, text):
+        filename = os.path.join(self.tmp.name, name)
+        with open(filename, 'w') as f:
+            f.write(text)
+        return filename
+
+    def test_sidecar_is_written_and_refreshed_after_change(self):
+        filename = self._write('poly.coeffs', '1\n2\n3\n')
+        np.testing.assert_array_equal(coeffs_cache.load_coefficients(filename, np.float64), [1, 2, 3])
+        self.assertTrue(os.path.exists(coeffs_cache.sidecar_path(filename)))
+
+        # Inny rozmiar pliku - sidecar i wpis w pamięci są nieaktualne
+        self._write('poly.coeffs', '4\n5\n6\n7\n')
+        np.testing.assert_array_equal(coeffs_cache.load_coefficients(filename, np.float64), [4, 5, 6, 7])
+
+    def test_sparse_format_requires_header(self):
+        sparse = self._write('sparse.coeffs', '# sparse\n0 1\n\n5 2\n')
+        np.testing.assert_array_equal(coeffs_cache.parse_coefficients(sparse), [1, 0, 0, 0, 0, 2])
+
+        pairs = self._write('pairs.coeffs', '1 2\n3 4\n')
+        with self.assertRaises(ValueError):
+            coeffs_cache.parse_coefficients(pairs)
+        single = self._write('single.coeffs', '# sparse\n1\n2\n')
+        with self.assertRaises(ValueError):
+            coeffs_cache.parse_coefficients(single)
+
+
+class ComputeFromConfigTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(conf, 'RESULTS_CACHE_DIR', os.path.join(self.tmp.name, 'cache'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.coefficients = np.array([0.5, -1.0, 0.25, 2.0])
+        self.coefficients_file = os.path.join(self.tmp.name, 'poly.coeffs')
+        np.savetxt(self.coefficients_file, self.coefficients, fmt='%.17g')
+        self.points_file = os.path.join(self.tmp.name, 'grid.points')
+        with open(self.points_file, 'w') as f:
+            f.write("-2 2 0.001\n")
+
+    def test_results_files_match_horner(self):
+        grid = PointGrid(-2.0, 2.0, 0.001)
+        expected = horner(self.coefficients, grid.points(0, len(grid), np.float64), np.float64)
+        for results_format in ('binary', 'text'):
+            output_file = os.path.join(self.tmp.name, f'results.{results_format}')
+            config_file = write_config_file(
+                'numpy', False, 1, False, True, False, output_file, self.coefficients_file, self.points_file,
+                precision='float64', results_format=results_format, job_dir=self.tmp.name, reuse_results=False
+            )
+            computation_time = compute_from_config(config_file, progress_callback=lambda progress: None)
+            self.assertEqual(read_computation_time(os.path.join(self.tmp.name, 'computation.time')),
+                             float(f"{computation_time:g}"))
+            results = read_results(output_file)
+            # Format tekstowy ma 6 cyfr znaczących (%.6g, jak App/utils.cpp)
+            np.testing.assert_allclose(results, expected, rtol=1e-15 if results_format == 'binary' else 1e-5)
+            del results
+
+
+if __name__ == '__main__':
+    unittest.main()